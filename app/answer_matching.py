@@ -0,0 +1,187 @@
+"""
+Grading of typed answers with tolerance for typos and missing accents.
+
+Answers are compared in a normalized form: casefolded, accents and
+punctuation stripped, whitespace collapsed, so "perche" matches "perché".
+Beyond that a small edit distance counts as a typo, unless the typed text is
+at least as close to a *different* answer in the bank's vocabulary: "sei"
+for "sai" is a wrong verb, not a typo.
+
+Each vocabulary is indexed once. Normalized forms go in a dict for exact
+hits, and every form's deletion neighbourhood (the strings left after
+removing up to two letters) maps back to it. Two strings within two edits
+always share a neighbour, so a near-miss lookup is a few dozen dict probes
+plus an exact distance check on the handful of candidates found, instead of
+a scan over every answer. Indexes are cached per vocabulary object, so a
+content reload builds new ones and a question does not.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+EXACT = "exact"
+ACCENT = "accent"
+TYPO = "typo"
+WRONG = "wrong"
+
+MAX_EDITS = 2
+# Vocabularies this small (a question's own options) are scanned instead of indexed
+LINEAR_SCAN_LIMIT = 16
+
+
+def normalize(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.casefold().replace("'", " "))
+    plain = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(_PUNCTUATION.sub(" ", plain).split())
+
+
+def tolerance(answer: str) -> int:
+    """Edits allowed for a typo: none for very short answers (ho/ha), one up to six letters, then two."""
+    length = len(answer)
+    if length <= 3:
+        return 0
+    return 1 if length <= 6 else MAX_EDITS
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance where swapping two adjacent letters also counts as one edit."""
+    if len(a) < len(b):
+        a, b = b, a
+    before, previous = None, list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            if before is not None and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        before, previous = previous, current
+    return previous[-1]
+
+
+def _deletes(word: str, depth: int) -> set[str]:
+    """``word`` with every combination of up to ``depth`` letters removed."""
+    found = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {variant[:i] + variant[i + 1 :] for variant in frontier for i in range(len(variant))}
+        found |= frontier
+    return found
+
+
+@dataclass(frozen=True)
+class Match:
+    """Verdict on a typed answer; ``nearest`` is the vocabulary answer it was closest to, if any."""
+
+    verdict: str
+    expected: str
+    nearest: Optional[str] = None
+
+    @property
+    def accepted(self) -> bool:
+        return self.verdict != WRONG
+
+
+class AnswerIndex:
+    """
+    Normalized answer vocabulary of one exercise.
+
+    Parameters
+    ----------
+    answers:
+        Every answer the exercise can expect or offer.
+    """
+
+    def __init__(self, answers: Iterable[str]) -> None:
+        self.forms: dict[str, str] = {}
+        for answer in answers:
+            self.forms.setdefault(normalize(answer), answer)
+        # Deletion neighbourhood -> forms; two strings within MAX_EDITS share a key
+        self._neighbours: dict[str, list[str]] = {}
+        if len(self.forms) > LINEAR_SCAN_LIMIT:
+            for form in self.forms:
+                for variant in _deletes(form, MAX_EDITS):
+                    self._neighbours.setdefault(variant, []).append(form)
+
+    def search(self, form: str, radius: int) -> list[tuple[int, str]]:
+        """Every vocabulary form within ``radius`` (≤ MAX_EDITS) edits of ``form``, nearest first."""
+        if self._neighbours:
+            candidates = {match for variant in _deletes(form, radius) for match in self._neighbours.get(variant, ())}
+        else:
+            candidates = self.forms.keys()
+        found = [(distance, candidate) for candidate in candidates if (distance := edit_distance(form, candidate)) <= radius]
+        found.sort()
+        return found
+
+    def grade(self, typed: str, expected: str, accepted: Iterable[str] = ()) -> Match:
+        """
+        Grade ``typed`` against ``expected``; ``accepted`` are other right answers
+        to the same question (sono andata for sono andato), graded the same way.
+        """
+        match = self._grade(typed, expected)
+        if match.accepted:
+            return match
+        for alternative in accepted:
+            if alternative != expected:
+                other = self._grade(typed, alternative)
+                if other.accepted:
+                    return other
+        return match
+
+    def _grade(self, typed: str, expected: str) -> Match:
+        text, target = typed.strip(), normalize(expected)
+        if text == expected.strip():
+            return Match(EXACT, expected)
+        form = normalize(text)
+        if form == target:
+            return Match(ACCENT, expected)
+        if form in self.forms:
+            # A real answer, just not this one
+            return Match(WRONG, expected, self.forms[form])
+
+        distance = edit_distance(form, target)
+        if distance > tolerance(target):
+            nearest = self.search(form, min(tolerance(form), MAX_EDITS))
+            return Match(WRONG, expected, self.forms[nearest[0][1]] if nearest else None)
+        closer = self.search(form, distance)
+        if any(candidate != target and score <= distance for score, candidate in closer):
+            return Match(WRONG, expected, self.forms[closer[0][1]])
+        return Match(TYPO, expected)
+
+
+_cache: dict[tuple[Any, ...], tuple[tuple[Any, ...], AnswerIndex]] = {}
+_cache_lock = threading.Lock()
+MAX_CACHED_INDEXES = 64
+
+
+def _answers(sources: Iterable[Iterable[Any]], answer_key: str) -> Iterable[str]:
+    for source in sources:
+        for item in source:
+            answer = item if isinstance(item, str) else item.get(answer_key)
+            if isinstance(answer, str):
+                yield answer
+
+
+def index_for(*sources: Iterable[Any], answer_key: str = "correct") -> AnswerIndex:
+    """
+    Return the index over option lists and question banks, reusing it while
+    the same source objects are passed (questions contribute ``answer_key``).
+    """
+    key = (*(id(source) for source in sources), answer_key)
+    cached = _cache.get(key)
+    # The sources are kept alive in the entry, so their ids cannot be reused
+    if cached is not None and all(held is source for held, source in zip(cached[0], sources)):
+        return cached[1]
+    index = AnswerIndex(_answers(sources, answer_key))
+    with _cache_lock:
+        if len(_cache) >= MAX_CACHED_INDEXES:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = (sources, index)
+    return index
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
 from dataclasses import dataclass
 from typing import List, Optional
 
 import requests
 
+from app.metrics import CHAT_ERRORS, CHAT_SECONDS
+from app.tracing import start_span
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,6 +71,7 @@ class ChatClient:
             If the API key is missing or the request fails.
         """
         if not self.api_key:
+            CHAT_ERRORS.inc(error="missing_key")
             raise ChatClientError("OpenAI API key is not configured. Please set it before sending messages.")
 
         payload = {
@@ -79,26 +85,52 @@ class ChatClient:
             "Content-Type": "application/json",
         }
 
+        model_name = payload["model"]
+        start = time.perf_counter()
         try:
-            response = self._session.post(
-                self.base_url,
-                headers=headers,
-                json=payload,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
+            with start_span("ChatClient.send_chat", model=model_name, messages=len(messages)):
+                response = self._session.post(
+                    self.base_url,
+                    headers=headers,
+                    json=payload,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
         except requests.HTTPError as exc:
+            CHAT_ERRORS.inc(error=f"http_{exc.response.status_code}" if exc.response is not None else "http")
             detail = self._extract_error_detail(exc.response)
             raise ChatClientError(detail) from exc
+        except requests.Timeout as exc:
+            CHAT_ERRORS.inc(error="timeout")
+            raise ChatClientError(f"Network error while calling OpenAI: {exc}") from exc
         except requests.RequestException as exc:
+            CHAT_ERRORS.inc(error="network")
             raise ChatClientError(f"Network error while calling OpenAI: {exc}") from exc
+        finally:
+            CHAT_SECONDS.observe(time.perf_counter() - start, model=model_name)
 
         try:
             data = response.json()
             return data["choices"][0]["message"]["content"].strip()
         except (KeyError, IndexError, json.JSONDecodeError) as exc:
+            CHAT_ERRORS.inc(error="bad_response")
             raise ChatClientError("Unexpected response from OpenAI.") from exc
 
+    async def chat(
+        self,
+        messages: List[ChatMessage],
+        *,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> str:
+        """
+        Async variant of :meth:`send_chat` for use on the event loop.
+
+        The blocking HTTP call runs in a worker thread so a slow API response
+        does not stall every other session in the process.
+        """
+        return await asyncio.to_thread(self.send_chat, messages, model=model, temperature=temperature)
+
     @staticmethod
     def _extract_error_detail(response: Optional[requests.Response]) -> str:
         if response is None:
@@ -0,0 +1,315 @@
+"""
+Batch generation of new question-bank items with the chat model.
+
+Asks the model for items of one bank in structured JSON, a batch per request,
+with at most ``--concurrency`` requests in flight. Each returned item is
+validated against the bank's schema (:func:`data.content.validate_item`) and
+dropped when its normalized prompt and answer hash to something the bank,
+or an earlier batch, already has.
+
+Every finished batch is recorded in a checkpoint file next to the output, so
+an interrupted run picks up where it stopped and never pays for a completed
+batch twice; ``--fresh`` discards the checkpoint. The accepted items are
+written to ``<out>/<bank>.jsonl`` for review. Moving a reviewed file into
+the content directory adds its items to the bank (see :mod:`data.content`).
+
+Usage::
+
+    python -m app.content_generation --bank GREETING_QUESTIONS --count 200 [--concurrency 4] [--out content/review]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import unicodedata
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence
+
+import data
+from app.chat_client import ChatClient, ChatClientError, ChatMessage
+from data.content import CONTENT_DIR, SCHEMAS, ContentError, validate_item
+
+logger = logging.getLogger(__name__)
+
+REVIEW_DIR = CONTENT_DIR / "review"
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_CONCURRENCY = 4
+MAX_ATTEMPTS = 3
+EXAMPLE_ITEMS = 5
+CHECKPOINT_FORMAT = 1
+
+_JSON_ARRAY = re.compile(r"\[.*\]", re.DOTALL)
+
+
+def normalize(text: Any) -> str:
+    """Casefold, strip accents and punctuation, and collapse whitespace."""
+    decomposed = unicodedata.normalize("NFKD", str(text).casefold())
+    plain = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(re.sub(r"[^\w\s]", " ", plain).split())
+
+
+def _identity_fields(bank: str, item: dict[str, Any]) -> list[str]:
+    schema = SCHEMAS.get(bank, {})
+    fields = [field for field in schema.get("required", ()) if field != "explanation"]
+    fields += [field for field in schema.get("any_of", ()) if field in item]
+    return fields
+
+
+def item_key(bank: str, item: Any) -> str:
+    """Hash of the fields that make an item distinct; the explanation is ignored."""
+    if isinstance(item, str):
+        parts = [normalize(item)]
+    else:
+        parts = [f"{field}={normalize(item.get(field, ''))}" for field in _identity_fields(bank, dict(item))]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def build_messages(bank: str, examples: Sequence[Any], size: int) -> list[ChatMessage]:
+    schema = SCHEMAS.get(bank, {})
+    required = ", ".join(schema.get("required", ()))
+    any_of = schema.get("any_of")
+    fields = f"Every object needs the fields {required}"
+    if any_of:
+        fields += f" plus one prompt field from: {', '.join(any_of)}"
+    system = (
+        "You write exercises for learners of Italian at A1-B1 level. "
+        "Answer with a JSON array only, no prose and no code fences. "
+        f"{fields}. Italian must be correct and natural, "
+        "and explanations short, in English, in the style of the examples."
+    )
+    shown = json.dumps([dict(example) for example in examples], ensure_ascii=False, indent=1)
+    user = f"Examples from the {bank} bank:\n{shown}\n\nWrite {size} new items that are not in the examples."
+    return [ChatMessage("system", system), ChatMessage("user", user)]
+
+
+def parse_items(reply: str) -> list[Any]:
+    """Pull the JSON array out of a reply, tolerating fences or an ``{"items": [...]}`` wrapper."""
+    try:
+        parsed = json.loads(reply)
+    except json.JSONDecodeError:
+        match = _JSON_ARRAY.search(reply)
+        if match is None:
+            raise ContentError("reply contains no JSON array") from None
+        try:
+            parsed = json.loads(match.group(0))
+        except json.JSONDecodeError as exc:
+            raise ContentError(f"reply is not valid JSON: {exc}") from None
+    if isinstance(parsed, dict):
+        parsed = parsed.get("items")
+    if not isinstance(parsed, list):
+        raise ContentError("reply is not a JSON array")
+    return parsed
+
+
+class Checkpoint:
+    """
+    Finished batches of one run, saved after each batch.
+
+    Parameters
+    ----------
+    path:
+        JSON file holding the batches; written by atomic replace.
+    bank:
+        Bank the run generates for. A checkpoint for another bank is ignored.
+    """
+
+    def __init__(self, path: Path, bank: str) -> None:
+        self.path = path
+        self.bank = bank
+        self.batches: dict[int, list[Any]] = {}
+
+    def load(self) -> None:
+        try:
+            stored = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Ignoring unreadable checkpoint %s", self.path, exc_info=True)
+            return
+        if stored.get("format") == CHECKPOINT_FORMAT and stored.get("bank") == self.bank:
+            self.batches = {int(index): items for index, items in stored.get("batches", {}).items()}
+
+    def record(self, index: int, items: list[Any]) -> None:
+        self.batches[index] = items
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(".tmp")
+        payload = {"format": CHECKPOINT_FORMAT, "bank": self.bank, "batches": self.batches}
+        temporary.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(temporary, self.path)
+
+    def discard(self) -> None:
+        self.batches = {}
+        self.path.unlink(missing_ok=True)
+
+
+class ContentGenerator:
+    """
+    Generates, validates and dedupes items for one bank.
+
+    Parameters
+    ----------
+    client:
+        Chat client used for every request.
+    bank:
+        A ``*_QUESTIONS`` bank (or any bank with a schema in :mod:`data.content`).
+    batch_size:
+        Items requested per call.
+    concurrency:
+        Maximum requests in flight.
+    model, temperature:
+        Passed through to :meth:`ChatClient.chat`.
+    """
+
+    def __init__(
+        self,
+        client: ChatClient,
+        bank: str,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        model: Optional[str] = None,
+        temperature: float = 0.9,
+    ) -> None:
+        self.client = client
+        self.bank = bank
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.model = model
+        self.temperature = temperature
+        self.existing = tuple(getattr(data, bank))
+
+    def validate(self, raw_items: Iterable[Any]) -> list[Any]:
+        items = []
+        for raw in raw_items:
+            try:
+                items.append(validate_item(self.bank, raw))
+            except ContentError as exc:
+                logger.info("Dropped generated item for %s: %s", self.bank, exc)
+        return items
+
+    async def _batch(self, index: int, semaphore: asyncio.Semaphore) -> list[Any]:
+        # A different sample of examples per batch steers batches apart
+        rng = random.Random(index)
+        examples = rng.sample(self.existing, min(EXAMPLE_ITEMS, len(self.existing)))
+        messages = build_messages(self.bank, examples, self.batch_size)
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            async with semaphore:
+                try:
+                    reply = await self.client.chat(messages, model=self.model, temperature=self.temperature)
+                    return self.validate(parse_items(reply))
+                except (ChatClientError, ContentError) as exc:
+                    logger.warning("Batch %d attempt %d/%d failed: %s", index, attempt, MAX_ATTEMPTS, exc)
+            if attempt < MAX_ATTEMPTS:
+                await asyncio.sleep(2**attempt)
+        raise ChatClientError(f"batch {index} failed after {MAX_ATTEMPTS} attempts")
+
+    async def run(self, count: int, checkpoint: Checkpoint) -> tuple[dict[str, Any], list[Any]]:
+        """Generate up to ``count`` new items, resuming from ``checkpoint``; returns a summary and the items."""
+        batches = -(-count // self.batch_size)
+        todo = [index for index in range(batches) if index not in checkpoint.batches]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_batch(index: int) -> None:
+            checkpoint.record(index, await self._batch(index, semaphore))
+
+        results = await asyncio.gather(*(run_batch(index) for index in todo), return_exceptions=True)
+        failed = []
+        for index, result in zip(todo, results):
+            if isinstance(result, BaseException):
+                logger.error("Batch %d failed: %s", index, result)
+                failed.append(index)
+
+        seen = {item_key(self.bank, item) for item in self.existing}
+        accepted: list[Any] = []
+        generated = 0
+        for index in sorted(checkpoint.batches):
+            for item in checkpoint.batches[index]:
+                generated += 1
+                key = item_key(self.bank, item)
+                if key not in seen:
+                    seen.add(key)
+                    accepted.append(item)
+        summary = {
+            "bank": self.bank,
+            "batches": batches,
+            "resumed": batches - len(todo),
+            "failed": failed,
+            "generated": generated,
+            "accepted": min(len(accepted), count),
+        }
+        return summary, accepted[:count]
+
+
+def write_review_file(bank: str, items: Sequence[Any], out_dir: Path) -> Path:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"{bank.lower()}.jsonl"
+    temporary = path.with_suffix(".tmp")
+    with temporary.open("w", encoding="utf-8") as handle:
+        for item in items:
+            handle.write(json.dumps(item, ensure_ascii=False) + "\n")
+    os.replace(temporary, path)
+    return path
+
+
+async def generate(
+    client: ChatClient,
+    bank: str,
+    count: int,
+    out_dir: Path = REVIEW_DIR,
+    *,
+    fresh: bool = False,
+    **options: Any,
+) -> dict[str, Any]:
+    """Run a generation job and write its review file; returns a summary."""
+    checkpoint = Checkpoint(out_dir / f"{bank.lower()}.checkpoint.json", bank)
+    if fresh:
+        checkpoint.discard()
+    checkpoint.load()
+    result, accepted = await ContentGenerator(client, bank, **options).run(count, checkpoint)
+    result["output"] = str(write_review_file(bank, accepted, out_dir))
+    if not result["failed"]:
+        # Everything is in the review file now; a rerun should start over
+        checkpoint.discard()
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    from config import OPENAI_API_KEY
+
+    parser = argparse.ArgumentParser(description="Generate new question-bank items with the chat model for review.")
+    parser.add_argument("--bank", required=True, choices=sorted(name for name in data.__all__ if not name.endswith("_OPTIONS")))
+    parser.add_argument("--count", type=int, default=100, help="Number of new items wanted")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Items requested per call")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Requests in flight at once")
+    parser.add_argument("--model", default=None, help="Chat model (defaults to the client's)")
+    parser.add_argument("--temperature", type=float, default=0.9)
+    parser.add_argument("--out", type=Path, default=REVIEW_DIR, help="Directory for review files and the checkpoint")
+    parser.add_argument("--fresh", action="store_true", help="Ignore an existing checkpoint")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    result = asyncio.run(
+        generate(
+            ChatClient(OPENAI_API_KEY),
+            args.bank,
+            args.count,
+            args.out,
+            fresh=args.fresh,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            model=args.model,
+            temperature=args.temperature,
+        )
+    )
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
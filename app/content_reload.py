@@ -0,0 +1,141 @@
+"""
+Hot reload of question banks and reference content.
+
+A daemon thread polls the modification times of the bank modules, the
+reference sections and the content directory. When something changed it
+reloads the affected modules and publishes a fresh content snapshot
+(:func:`data.snapshot.rebuild`); compiling happens on the watcher thread and
+the swap is one reference assignment, so sessions keep running throughout.
+A reload that fails (for example a syntax error in a bank module) is logged
+and the previous snapshot stays live.
+
+``CONTENT_RELOAD_INTERVAL`` sets the polling period in seconds (default 2);
+``0`` disables the watcher.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from app.metrics import REGISTRY
+from data import snapshot
+from data.content import CONTENT_DIR, EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(snapshot.__file__).resolve().parent
+
+CONTENT_RELOADS = REGISTRY.counter("italia_content_reloads_total", "Content snapshot reloads by result.", ("result",))
+REGISTRY.gauge("italia_content_version", "Version of the live content snapshot.", lambda: snapshot.current().version)
+
+
+def _module_name(path: Path) -> Optional[str]:
+    """Return the ``data`` submodule defined by ``path``, if it holds banks."""
+    if path.suffix != ".py" or path.name == "__init__.py":
+        return None
+    relative = path.relative_to(DATA_DIR).with_suffix("")
+    if relative.parts[0] not in ("banks", "reference_sections"):
+        return None
+    return ".".join(relative.parts)
+
+
+class ContentWatcher:
+    """
+    Polls content files and republishes the snapshot when they change.
+
+    Parameters
+    ----------
+    interval:
+        Seconds between scans.
+    content_dir:
+        Directory of external bank files (see :mod:`data.content`).
+    """
+
+    def __init__(self, interval: float = 2.0, content_dir: Path = CONTENT_DIR) -> None:
+        self.interval = interval
+        self.content_dir = content_dir
+        self._mtimes: dict[Path, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _watched_files(self) -> list[Path]:
+        files = [DATA_DIR / "reference_sections.py", *sorted((DATA_DIR / "banks").glob("*.py"))]
+        if self.content_dir.is_dir():
+            files += sorted(path for path in self.content_dir.iterdir() if path.suffix.lower() in EXTENSIONS)
+        return files
+
+    def scan(self) -> dict[Path, int]:
+        mtimes: dict[Path, int] = {}
+        for path in self._watched_files():
+            try:
+                mtimes[path] = path.stat().st_mtime_ns
+            except OSError:
+                pass
+        return mtimes
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._mtimes = self.scan()
+        self._thread = threading.Thread(target=self._run, name="content-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Content watcher scan failed")
+
+    def check(self) -> bool:
+        """Reload if any watched file changed; returns whether a new snapshot was published."""
+        mtimes = self.scan()
+        changed = [path for path in mtimes.keys() | self._mtimes.keys() if mtimes.get(path) != self._mtimes.get(path)]
+        if not changed:
+            return False
+        # Deleted modules cannot be reloaded; their banks keep the last loaded items
+        modules = sorted({name for path in changed if path in mtimes and (name := _module_name(path))})
+
+        started = time.perf_counter()
+        try:
+            published = snapshot.rebuild(modules)
+        except Exception:
+            CONTENT_RELOADS.inc(result="error")
+            logger.exception("Content reload failed; keeping snapshot %d", snapshot.current().version)
+            published = None
+        # Remember the new mtimes either way so a broken file is not retried until it changes again
+        self._mtimes = mtimes
+        if published is None:
+            return False
+        CONTENT_RELOADS.inc(result="ok")
+        logger.info(
+            "Reloaded content after %d changed files in %.0f ms",
+            len(changed),
+            (time.perf_counter() - started) * 1000,
+        )
+        return True
+
+
+_watcher: Optional[ContentWatcher] = None
+_watcher_lock = threading.Lock()
+
+
+def start_content_watcher() -> Optional[ContentWatcher]:
+    """Start the process-wide watcher once; later calls return the same one."""
+    global _watcher
+    interval = float(os.getenv("CONTENT_RELOAD_INTERVAL", "2"))
+    if interval <= 0:
+        return None
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = ContentWatcher(interval)
+            _watcher.start()
+    return _watcher
@@ -0,0 +1,106 @@
+"""
+Event-loop lag monitor and blocking-call detector.
+
+A heartbeat coroutine on the Flet event loop measures how late each wake-up is
+(scheduling lag) and records it in ``LOOP_LAG_SECONDS``. A watchdog thread
+checks the heartbeat; when the loop has not run for longer than the block
+threshold, it logs the loop thread's current stack once per stall, which
+points straight at the synchronous call that froze every session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from app.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+LAG_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0)
+
+LOOP_LAG_SECONDS = REGISTRY.histogram(
+    "italia_loop_lag_seconds", "How late the event loop ran a scheduled heartbeat.", buckets=LAG_BUCKETS
+)
+LOOP_BLOCKED = REGISTRY.counter("italia_loop_blocked_total", "Stalls longer than the block threshold.")
+for _quantile in (0.5, 0.9, 0.99):
+    REGISTRY.gauge(
+        f"italia_loop_lag_p{int(_quantile * 100)}_seconds",
+        f"Estimated {int(_quantile * 100)}th percentile of event-loop lag since start.",
+        lambda q=_quantile: LOOP_LAG_SECONDS.quantile(q),
+    )
+
+
+class LoopMonitor:
+    """
+    Watches one event loop for scheduling lag and blocking callbacks.
+
+    Parameters
+    ----------
+    interval:
+        Seconds between heartbeats.
+    block_threshold:
+        A stall longer than this many seconds is reported with a stack trace.
+    """
+
+    def __init__(self, interval: float = 0.1, block_threshold: float = 0.25) -> None:
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._reported_heartbeat = 0.0
+        self._stop = threading.Event()
+        self._start_lock = threading.Lock()
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._start_lock:
+            if self.loop is not None:
+                return
+            self.loop = loop
+        # Time since construction is not a stall; the heartbeat task records the loop thread
+        self._heartbeat = time.monotonic()
+        self._thread_id = None
+        asyncio.run_coroutine_threadsafe(self._heartbeat_loop(), loop)
+        threading.Thread(target=self._watchdog, name="loop-watchdog", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def _heartbeat_loop(self) -> None:
+        self._thread_id = threading.get_ident()
+        loop = asyncio.get_running_loop()
+        while not self._stop.is_set():
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            LOOP_LAG_SECONDS.observe(max(0.0, loop.time() - expected))
+            self._heartbeat = time.monotonic()
+
+    def _watchdog(self) -> None:
+        while not self._stop.wait(self.block_threshold / 2):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat - self.interval
+            if stalled < self.block_threshold or heartbeat == self._reported_heartbeat:
+                continue
+            self._reported_heartbeat = heartbeat
+            LOOP_BLOCKED.inc()
+            frame = sys._current_frames().get(self._thread_id) if self._thread_id else None
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "<unavailable>\n"
+            logger.warning("Event loop blocked for over %.0f ms; loop thread is at:\n%s", stalled * 1000, stack)
+
+
+MONITOR = LoopMonitor(
+    block_threshold=float(os.getenv("LOOP_BLOCK_THRESHOLD", "0.25")),
+)
+
+
+def start_loop_monitor(loop: asyncio.AbstractEventLoop) -> None:
+    """Start the process-wide monitor on ``loop``; later calls are no-ops."""
+    if os.getenv("LOOP_MONITOR", "1") != "0":
+        MONITOR.start(loop)
@@ -0,0 +1,295 @@
+"""
+In-process metrics registry with a Prometheus text endpoint.
+
+Counters, gauges and fixed-bucket histograms are kept per label set. A
+histogram child is a flat ``array`` of bucket counts plus a running sum, so
+recording a value is one bisect and one increment regardless of how many
+observations have been made.
+"""
+
+from __future__ import annotations
+
+import hmac
+import json
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator, Optional, Sequence
+from urllib.parse import parse_qsl, urlsplit
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.kind}\n"
+        return header + "".join(f"{line}\n" for line in self.samples())
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """Gauge whose value is read from a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], float]) -> None:
+        super().__init__(name, documentation)
+        self._callback = callback
+
+    def samples(self) -> Iterator[str]:
+        yield f"{self.name} {_format_value(self._callback())}"
+
+
+class CallbackCounter(Gauge):
+    """Counter whose monotonically increasing value is owned by another module."""
+
+    kind = "counter"
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (last slot is +Inf) and the sum
+        self._counts: dict[tuple[str, ...], array] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = array("Q", bytes(8 * (len(self.buckets) + 1)))
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def snapshot(self, **labels: str) -> tuple[list[int], float]:
+        """Return (bucket counts, sum) for one label set; counts end with +Inf."""
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.get(key)
+            return (list(counts) if counts is not None else [0] * (len(self.buckets) + 1)), self._sums.get(key, 0.0)
+
+    def quantile(self, q: float, **labels: str) -> float:
+        """Estimate a quantile by linear interpolation inside the matching bucket."""
+        counts, _ = self.snapshot(**labels)
+        total = sum(counts)
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            if seen + count >= rank and count:
+                if bound == float("inf"):
+                    return lower
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return lower
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            items = [(key, list(counts), self._sums[key]) for key, counts in self._counts.items()]
+        for key, counts, total_sum in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total_sum)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, callback: Callable[[], float]) -> Gauge:
+        return self.register(Gauge(name, documentation, callback))
+
+    def callback_counter(self, name: str, documentation: str, callback: Callable[[], float]) -> CallbackCounter:
+        return self.register(CallbackCounter(name, documentation, callback))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.render() for metric in metrics)
+
+
+REGISTRY = MetricsRegistry()
+
+
+def _session_count(field: str) -> Callable[[], float]:
+    def read() -> float:
+        from app.session import session_counts
+
+        return session_counts()[field]
+
+    return read
+
+
+SESSIONS_ACTIVE = REGISTRY.gauge("italia_sessions_active", "Flet sessions currently open.", _session_count("active"))
+SESSIONS_OPENED = REGISTRY.callback_counter("italia_sessions_opened_total", "Flet sessions opened since start.", _session_count("opened"))
+SESSIONS_CLOSED = REGISTRY.callback_counter("italia_sessions_closed_total", "Flet sessions closed since start.", _session_count("closed"))
+PROGRESS_SECONDS = REGISTRY.histogram(
+    "italia_progress_seconds",
+    "Latency of progress reads and writes by operation and backend.",
+    ("operation", "backend"),
+)
+CHAT_SECONDS = REGISTRY.histogram("italia_chat_seconds", "Latency of chat completion requests.", ("model",))
+CHAT_ERRORS = REGISTRY.counter("italia_chat_errors_total", "Failed chat completion requests by error class.", ("error",))
+HANDLER_SECONDS = REGISTRY.histogram("italia_handler_seconds", "Time UI event handlers and view tasks spend running, excluding awaits.", ("handler",))
+
+
+# Admin endpoints served next to /metrics; they take the query parameters and return JSON
+ADMIN_ROUTES: dict[str, Callable[[dict[str, str]], Any]] = {}
+
+
+def admin_route(path: str) -> Callable[[Callable[[dict[str, str]], Any]], Callable[[dict[str, str]], Any]]:
+    """Register an admin endpoint; requests need ``X-Admin-Token`` matching ``ADMIN_TOKEN``."""
+
+    def register(handler: Callable[[dict[str, str]], Any]) -> Callable[[dict[str, str]], Any]:
+        ADMIN_ROUTES[path] = handler
+        return handler
+
+    return register
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path in ADMIN_ROUTES:
+            self._handle_admin(url.path, dict(parse_qsl(url.query)))
+            return
+        if url.path != "/metrics":
+            self.send_error(404)
+            return
+        self._send(200, self.registry.render().encode(), "text/plain; version=0.0.4; charset=utf-8")
+
+    def _handle_admin(self, path: str, params: dict[str, str]) -> None:
+        token = os.getenv("ADMIN_TOKEN", "")
+        if not token or not hmac.compare_digest(token, self.headers.get("X-Admin-Token", "")):
+            self.send_error(403)
+            return
+        try:
+            result = ADMIN_ROUTES[path](params)
+        except ValueError as exc:
+            self.send_error(400, str(exc))
+            return
+        self._send(200, json.dumps(result).encode(), "application/json")
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0", registry: Optional[MetricsRegistry] = None) -> ThreadingHTTPServer:
+    """Serve ``GET /metrics`` and the admin routes from a daemon thread and return the server."""
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry or REGISTRY})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
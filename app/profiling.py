@@ -0,0 +1,219 @@
+"""
+On-demand profiling for live sessions.
+
+Two tools, both off by default:
+
+* ``StackSampler`` samples the event-loop thread's stack from a background
+  thread and writes one collapsed-stack file (``*.folded``, the input format of
+  flamegraph.pl and speedscope) per time window.
+* Session profiling runs the ``@batched`` handlers of selected sessions under
+  cProfile and dumps the aggregated ``.pstats`` when profiling stops or the
+  session closes.
+
+Set ``ITALIA_PROFILE=1`` to start sampling at launch, or use the admin routes
+on the metrics server (``/debug/profile``, ``/debug/sessions``). When nothing
+is enabled the only per-handler cost is a truthiness check on an empty dict.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from app.metrics import admin_route
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = Path(os.getenv("PROFILE_DIR", "profiles"))
+SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.01"))
+WINDOW_SECONDS = float(os.getenv("PROFILE_WINDOW_SECONDS", "60"))
+
+# Session id -> aggregated stats; read on every handler call, so keep it a plain dict
+SESSION_PROFILES: dict[str, Optional[pstats.Stats]] = {}
+
+# cProfile hooks are process-wide on newer Pythons, so profile one handler at a time
+_cprofile_lock = threading.Lock()
+
+
+def _frame_label(frame: Any) -> str:
+    code = frame.f_code
+    return f"{Path(code.co_filename).name}:{code.co_name}:{frame.f_lineno}"
+
+
+class StackSampler:
+    """
+    Samples one thread's Python stack at a fixed interval.
+
+    Parameters
+    ----------
+    interval:
+        Seconds between samples.
+    window:
+        Seconds of samples aggregated into each output file.
+    output_dir:
+        Directory that receives the ``.folded`` files.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, window: float = WINDOW_SECONDS, output_dir: Path = PROFILE_DIR) -> None:
+        self.interval = interval
+        self.window = window
+        self.output_dir = output_dir
+        self.thread_id: Optional[int] = None
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def attach_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Target the thread that runs ``loop``."""
+        if self.thread_id is None:
+            loop.call_soon_threadsafe(self._record_thread)
+
+    def _record_thread(self) -> None:
+        self.thread_id = threading.get_ident()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Optional[Path]:
+        """Stop sampling and write what was collected in the current window."""
+        if not self.running:
+            return None
+        self._stop.set()
+        assert self._thread is not None
+        self._thread.join()
+        return self._write_window()
+
+    def _run(self) -> None:
+        window_end = time.monotonic() + self.window
+        while not self._stop.wait(self.interval):
+            if self.thread_id is not None:
+                frame = sys._current_frames().get(self.thread_id)
+                if frame is not None:
+                    stack = []
+                    while frame is not None:
+                        stack.append(_frame_label(frame))
+                        frame = frame.f_back
+                    self._stacks[";".join(reversed(stack))] += 1
+            if time.monotonic() >= window_end:
+                self._write_window()
+                window_end = time.monotonic() + self.window
+
+    def _write_window(self) -> Optional[Path]:
+        stacks, self._stacks = self._stacks, Counter()
+        if not stacks:
+            return None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"loop-{os.getpid()}-{time.strftime('%Y%m%d-%H%M%S')}.folded"
+        path.write_text("".join(f"{stack} {count}\n" for stack, count in stacks.most_common()))
+        logger.info("Wrote %d stack samples to %s", sum(stacks.values()), path)
+        return path
+
+
+SAMPLER = StackSampler()
+
+
+def attach_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Point the sampler at the Flet event loop and honour ``ITALIA_PROFILE``."""
+    SAMPLER.attach_loop(loop)
+    if os.getenv("ITALIA_PROFILE", "").lower() in ("1", "true") and not SAMPLER.running:
+        SAMPLER.start()
+
+
+def start_session_profile(session_id: str) -> None:
+    SESSION_PROFILES.setdefault(session_id, None)
+
+
+def stop_session_profile(session_id: str) -> Optional[Path]:
+    """Stop profiling a session and dump its aggregated stats, if any."""
+    stats = SESSION_PROFILES.pop(session_id, None)
+    if stats is None:
+        return None
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    path = PROFILE_DIR / f"session-{session_id}-{time.strftime('%Y%m%d-%H%M%S')}.pstats"
+    stats.dump_stats(str(path))
+    return path
+
+
+def _record(session_id: str, profile: cProfile.Profile) -> None:
+    if session_id not in SESSION_PROFILES:
+        return
+    stats = SESSION_PROFILES[session_id]
+    if stats is None:
+        SESSION_PROFILES[session_id] = pstats.Stats(profile)
+    else:
+        stats.add(profile)
+
+
+def run_profiled(session_id: str, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a sync handler under cProfile when ``session_id`` is being profiled."""
+    if session_id not in SESSION_PROFILES or not _cprofile_lock.acquire(blocking=False):
+        return method(*args, **kwargs)
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(method, *args, **kwargs)
+    finally:
+        _cprofile_lock.release()
+        _record(session_id, profile)
+
+
+async def run_profiled_async(session_id: str, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Await an async handler under cProfile when ``session_id`` is being profiled.
+
+    The profile spans the awaits, so it also sees other tasks the loop ran in
+    between; use the stack sampler for a loop-wide view.
+    """
+    if session_id not in SESSION_PROFILES or not _cprofile_lock.acquire(blocking=False):
+        return await method(*args, **kwargs)
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        return await method(*args, **kwargs)
+    finally:
+        profile.disable()
+        _cprofile_lock.release()
+        _record(session_id, profile)
+
+
+@admin_route("/debug/profile")
+def _profile_route(params: dict[str, str]) -> dict[str, Any]:
+    action = params.get("action", "status")
+    session_id = params.get("session")
+    written = None
+
+    if action == "start":
+        if session_id:
+            start_session_profile(session_id)
+        else:
+            SAMPLER.start()
+    elif action == "stop":
+        path = stop_session_profile(session_id) if session_id else SAMPLER.stop()
+        written = str(path) if path else None
+    elif action != "status":
+        raise ValueError(f"Unknown action: {action}")
+
+    return {"sampling": SAMPLER.running, "sessions": sorted(SESSION_PROFILES), "written": written}
+
+
+@admin_route("/debug/sessions")
+def _sessions_route(_: dict[str, str]) -> dict[str, Any]:
+    from app.session import live_sessions
+
+    return {"sessions": sorted(live_sessions())}
@@ -0,0 +1,116 @@
+"""
+Compact wire format for the cloud progress record.
+
+The plain record repeats ``"score"``, ``"total"`` and ``"v"`` for every user
+and exercise::
+
+    {"alice": {"_v": 7, "verb_exercise": {"score": 3, "total": 5, "v": 7}}}
+
+The compact form stores each exercise key once in a table and every user as a
+flat integer array of ``[version, key_id, score, total, v, key_id, ...]``,
+then compresses the JSON and wraps it in a small envelope::
+
+    {"_schema": 2, "codec": "gzip", "data": "<base64>"}
+
+``zstd`` is used instead of ``gzip`` when the optional ``zstandard`` package is
+installed and ``PROGRESS_CODEC=zstd``. Records without ``_schema`` are the
+original plain format and are still read; they are rewritten compactly on the
+next save.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import os
+from typing import Any, Optional
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+SCHEMA_FIELD = "_schema"
+SCHEMA_VERSION = 2
+VERSION_FIELD = "_v"
+
+CODEC = os.getenv("PROGRESS_CODEC", "gzip")
+
+_FIELDS_PER_ENTRY = 4
+
+
+def pack(record: dict[str, Any]) -> dict[str, Any]:
+    """Convert a plain record into the key table and per-user integer arrays."""
+    key_ids: dict[str, int] = {}
+    users: dict[str, list[int]] = {}
+    for user_id, user_data in record.items():
+        row = [int(user_data.get(VERSION_FIELD, 0))]
+        for key, entry in user_data.items():
+            if key == VERSION_FIELD:
+                continue
+            key_id = key_ids.setdefault(key, len(key_ids))
+            row += [key_id, int(entry.get("score", 0)), int(entry.get("total", 0)), int(entry.get("v", 0))]
+        users[user_id] = row
+    return {"k": list(key_ids), "u": users}
+
+
+def unpack(packed: dict[str, Any], user_id: Optional[str] = None) -> dict[str, Any]:
+    """Inverse of :func:`pack`; with ``user_id`` only that user's entries are expanded."""
+    keys = packed["k"]
+    rows = packed["u"]
+    if user_id is not None:
+        rows = {user_id: rows[user_id]} if user_id in rows else {}
+    record: dict[str, Any] = {}
+    for user_id, row in rows.items():
+        user_data: dict[str, Any] = {VERSION_FIELD: row[0]}
+        for i in range(1, len(row), _FIELDS_PER_ENTRY):
+            key_id, score, total, version = row[i : i + _FIELDS_PER_ENTRY]
+            user_data[keys[key_id]] = {"score": score, "total": total, "v": version}
+        record[user_id] = user_data
+    return record
+
+
+def _compress(raw: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(raw)
+    return gzip.compress(raw, compresslevel=9, mtime=0)
+
+
+def _decompress(blob: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("Progress record is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(blob)
+    if codec == "gzip":
+        return gzip.decompress(blob)
+    raise ValueError(f"Unknown progress record codec: {codec}")
+
+
+def encode_record(record: dict[str, Any], codec: str = CODEC) -> dict[str, Any]:
+    """Return the compact envelope for a plain record."""
+    if codec == "zstd" and zstandard is None:
+        codec = "gzip"
+    raw = json.dumps(pack(record), separators=(",", ":")).encode("utf-8")
+    return {
+        SCHEMA_FIELD: SCHEMA_VERSION,
+        "codec": codec,
+        "data": base64.b64encode(_compress(raw, codec)).decode("ascii"),
+    }
+
+
+def decode_record(stored: Any, user_id: Optional[str] = None) -> dict[str, Any]:
+    """
+    Return the plain record for a compact envelope or a schema 1 (plain) record.
+
+    Pass ``user_id`` to skip expanding every other user's entries on reads.
+    """
+    if not isinstance(stored, dict):
+        return {}
+    schema = stored.get(SCHEMA_FIELD)
+    if schema is None:
+        return stored
+    if schema != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported progress record schema: {schema}")
+    raw = _decompress(base64.b64decode(stored["data"]), stored.get("codec", "gzip"))
+    return unpack(json.loads(raw), user_id)
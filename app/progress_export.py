@@ -0,0 +1,144 @@
+"""
+Streaming export of the progress service's data.
+
+Reads the service's SQLite database directly and writes two tables:
+
+``progress``
+    Current ``(user_id, exercise_key, score, total, version)`` rows.
+``attempts``
+    The append-only log of accepted changes, with ``id`` and ``recorded_at``.
+
+Rows are fetched and written in fixed-size chunks, so memory stays flat at
+any table size. ``--since`` takes the cursor printed by the previous run (the
+last exported attempt ID) and limits both tables to what changed after it;
+the new cursor is printed as JSON when the export finishes.
+
+Usage::
+
+    python -m app.progress_export --out exports/ [--format csv|parquet] [--since N]
+
+Parquet output needs the optional ``pyarrow`` package.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sqlite3
+from typing import Iterator, Optional, Sequence
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional dependency
+    pyarrow = None
+
+CHUNK_ROWS = 10_000
+
+PROGRESS_COLUMNS = ("user_id", "exercise_key", "score", "total", "version")
+ATTEMPT_COLUMNS = ("id", "user_id", "exercise_key", "score", "total", "version", "recorded_at")
+
+_PROGRESS_ALL = "SELECT user_id, exercise_key, score, total, version FROM progress ORDER BY user_id, exercise_key"
+# Rows whose latest change is newer than the cursor; a row's version only moves with its attempts
+_PROGRESS_SINCE = """
+SELECT p.user_id, p.exercise_key, p.score, p.total, p.version
+FROM progress AS p
+JOIN (SELECT DISTINCT user_id, exercise_key FROM attempts WHERE id > ?) AS changed
+  ON changed.user_id = p.user_id AND changed.exercise_key = p.exercise_key
+ORDER BY p.user_id, p.exercise_key
+"""
+_ATTEMPTS_SINCE = "SELECT id, user_id, exercise_key, score, total, version, recorded_at FROM attempts WHERE id > ? ORDER BY id"
+
+
+def _chunks(cursor: sqlite3.Cursor, size: int = CHUNK_ROWS) -> Iterator[list[tuple]]:
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return
+        yield rows
+
+
+class _CsvSink:
+    def __init__(self, path: str, columns: Sequence[str]) -> None:
+        self._handle = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._handle)
+        self._writer.writerow(columns)
+
+    def write(self, rows: list[tuple]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class _ParquetSink:
+    """Writes each chunk as one row group, so only a chunk is ever held in memory."""
+
+    def __init__(self, path: str, columns: Sequence[str]) -> None:
+        if pyarrow is None:
+            raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+        self._columns = columns
+        self._path = path
+        self._writer: Optional[pyarrow.parquet.ParquetWriter] = None
+
+    def write(self, rows: list[tuple]) -> None:
+        table = pyarrow.table({name: list(values) for name, values in zip(self._columns, zip(*rows))})
+        if self._writer is None:
+            self._writer = pyarrow.parquet.ParquetWriter(self._path, table.schema, compression="zstd")
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def _export_table(
+    conn: sqlite3.Connection, query: str, params: tuple, path: str, columns: Sequence[str], fmt: str
+) -> int:
+    sink = _ParquetSink(path, columns) if fmt == "parquet" else _CsvSink(path, columns)
+    count = 0
+    try:
+        for rows in _chunks(conn.execute(query, params)):
+            sink.write(rows)
+            count += len(rows)
+    finally:
+        sink.close()
+    return count
+
+
+def export(db_path: str, out_dir: str, fmt: str = "csv", since: int = 0) -> dict[str, int]:
+    """Export both tables to ``out_dir`` and return row counts and the next cursor."""
+    os.makedirs(out_dir, exist_ok=True)
+    suffix = f".{since}" if since else ""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        # One read transaction gives both tables the same snapshot while the service keeps writing
+        conn.execute("BEGIN")
+        cursor = conn.execute("SELECT COALESCE(MAX(id), 0) FROM attempts").fetchone()[0]
+        progress_query, progress_params = (_PROGRESS_SINCE, (since,)) if since else (_PROGRESS_ALL, ())
+        progress_rows = _export_table(
+            conn, progress_query, progress_params, os.path.join(out_dir, f"progress{suffix}.{fmt}"), PROGRESS_COLUMNS, fmt
+        )
+        attempt_rows = _export_table(
+            conn, _ATTEMPTS_SINCE, (since,), os.path.join(out_dir, f"attempts{suffix}.{fmt}"), ATTEMPT_COLUMNS, fmt
+        )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return {"progress_rows": progress_rows, "attempt_rows": attempt_rows, "cursor": cursor}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Stream progress and attempt history out of the progress service database.")
+    parser.add_argument("--db", default=os.getenv("PROGRESS_SERVICE_DB", "progress.db"), help="SQLite database of the progress service")
+    parser.add_argument("--out", default="exports", help="Directory for the exported files")
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    parser.add_argument("--since", type=int, default=0, help="Cursor printed by the previous export")
+    args = parser.parse_args(argv)
+    print(json.dumps(export(args.db, args.out, args.format, args.since)))
+
+
+if __name__ == "__main__":
+    main()
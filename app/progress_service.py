@@ -0,0 +1,458 @@
+"""
+Standalone progress service.
+
+A small asyncio HTTP/1.1 server that owns the progress store, so the Flet app
+no longer reads and rewrites a whole JSONBin record per sync. Connections are
+kept alive between requests and every response is compact JSON.
+
+Endpoints
+---------
+``GET /progress/{user}?since=N``
+    Exercises written after version ``N`` (all of them when omitted)::
+
+        {"v": 12, "e": {"verb_exercise": [3, 5, 12]}}
+
+    Responses carry an ``ETag`` of the user's version; a request whose
+    ``If-None-Match`` still matches gets an empty ``304 Not Modified``
+    without the store reading any rows.
+
+``PATCH /progress/{user}``
+    Several exercises in one request, each as
+    ``[score, total, base_version, base_score, base_total]`` (``base_version``
+    may be ``null`` for an overwrite). Concurrent edits are merged with
+    :func:`progress_api.merge_change` and the stored values are returned in
+    the same shape as ``GET``::
+
+        {"changes": {"verb_exercise": [4, 6, 12, 3, 5]}}
+
+``GET /leaderboard/{exercise_key}?limit=N&after=CURSOR``
+    One page of users ranked by score (ties by user ID), plus the cursor of
+    the next page::
+
+        {"entries": [["alice", 42, 50], ["bob", 40, 41]], "next": "40:bob"}
+
+    Pages are read with a keyset seek on an index, so every page costs the
+    same however many users there are.
+
+``GET /aggregates`` and ``GET /aggregates/{exercise_key}``
+    Learner count and score/total sums with overall accuracy, per exercise.
+    The sums are maintained incrementally by every ``PATCH``.
+
+``GET /healthz``
+    Liveness probe.
+
+Every accepted change is also appended to an ``attempts`` log, which
+``python -m app.progress_export`` streams out for analysis.
+
+Run it with ``python -m app.progress_service`` and point the app at it with
+``PROGRESS_SERVICE_URL``. ``PROGRESS_SERVICE_DB`` selects the SQLite file
+(default ``progress.db``); when ``PROGRESS_SERVICE_TOKEN`` is set, requests
+must send it as ``Authorization: Bearer <token>``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from progress_api import ProgressChange, merge_change
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 64 * 1024
+IDLE_TIMEOUT = 60.0
+
+_REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS progress (
+    user_id TEXT NOT NULL,
+    exercise_key TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    PRIMARY KEY (user_id, exercise_key)
+);
+CREATE INDEX IF NOT EXISTS progress_leaderboard ON progress (exercise_key, score DESC, user_id);
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    exercise_key TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS aggregates (
+    exercise_key TEXT PRIMARY KEY,
+    users INTEGER NOT NULL,
+    score_sum INTEGER NOT NULL,
+    total_sum INTEGER NOT NULL
+);
+"""
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str = "") -> None:
+        super().__init__(message or _REASONS.get(status, ""))
+        self.status = status
+
+
+class SqliteProgressStore:
+    """
+    Versioned per-user progress in SQLite.
+
+    Parameters
+    ----------
+    path:
+        Database file; ``":memory:"`` keeps everything in memory.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._backfill_aggregates()
+
+    def _backfill_aggregates(self) -> None:
+        # Databases created before the aggregates table existed are summed once
+        if self._conn.execute("SELECT 1 FROM aggregates LIMIT 1").fetchone():
+            return
+        self._conn.execute(
+            "INSERT INTO aggregates (exercise_key, users, score_sum, total_sum) "
+            "SELECT exercise_key, COUNT(*), SUM(score), SUM(total) FROM progress GROUP BY exercise_key"
+        )
+
+    def read(self, user_id: str, since: int = 0) -> tuple[dict[str, tuple[int, int, int]], int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT exercise_key, score, total, version FROM progress WHERE user_id = ? AND version > ?",
+                (user_id, since),
+            ).fetchall()
+            version = self._user_version(user_id)
+        return {key: (score, total, row_version) for key, score, total, row_version in rows}, version
+
+    def apply(self, user_id: str, changes: dict[str, ProgressChange]) -> tuple[dict[str, tuple[int, int, int]], int]:
+        """Merge ``changes`` in one transaction and return the stored values."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                version = self._user_version(user_id)
+                stored: dict[str, tuple[int, int, int]] = {}
+                for key, change in changes.items():
+                    row = self._conn.execute(
+                        "SELECT score, total, version FROM progress WHERE user_id = ? AND exercise_key = ?",
+                        (user_id, key),
+                    ).fetchone()
+                    current = {"score": row[0], "total": row[1], "v": row[2]} if row else None
+                    score, total = merge_change(current, change)
+                    version += 1
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO progress (user_id, exercise_key, score, total, version) VALUES (?, ?, ?, ?, ?)",
+                        (user_id, key, score, total, version),
+                    )
+                    stored[key] = (score, total, version)
+                    self._update_aggregate(key, row, score, total)
+                    self._conn.execute(
+                        "INSERT INTO attempts (user_id, exercise_key, score, total, version, recorded_at) VALUES (?, ?, ?, ?, ?, ?)",
+                        (user_id, key, score, total, version, now),
+                    )
+                self._conn.execute("INSERT OR REPLACE INTO users (user_id, version) VALUES (?, ?)", (user_id, version))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return stored, version
+
+    def _update_aggregate(self, key: str, previous: Optional[tuple[int, int, int]], score: int, total: int) -> None:
+        added_user, old_score, old_total = (0, previous[0], previous[1]) if previous else (1, 0, 0)
+        self._conn.execute(
+            "INSERT INTO aggregates (exercise_key, users, score_sum, total_sum) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (exercise_key) DO UPDATE SET users = users + excluded.users, "
+            "score_sum = score_sum + excluded.score_sum, total_sum = total_sum + excluded.total_sum",
+            (key, added_user, score - old_score, total - old_total),
+        )
+
+    def leaderboard(
+        self, exercise_key: str, limit: int, after: Optional[tuple[int, str]] = None
+    ) -> list[tuple[str, int, int]]:
+        """Return up to ``limit`` ``(user_id, score, total)`` ranked after the ``(score, user_id)`` cursor."""
+        query = "SELECT user_id, score, total FROM progress WHERE exercise_key = ?"
+        params: list[Any] = [exercise_key]
+        if after is not None:
+            # The plain range on score lets SQLite seek the index instead of scanning earlier pages
+            query += " AND score <= ? AND (score < ? OR user_id > ?)"
+            params += [after[0], after[0], after[1]]
+        query += " ORDER BY score DESC, user_id LIMIT ?"
+        with self._lock:
+            return self._conn.execute(query, (*params, limit)).fetchall()
+
+    def aggregates(self, exercise_key: Optional[str] = None) -> dict[str, tuple[int, int, int]]:
+        """Return ``{exercise_key: (users, score_sum, total_sum)}``."""
+        query = "SELECT exercise_key, users, score_sum, total_sum FROM aggregates"
+        params: tuple[Any, ...] = ()
+        if exercise_key is not None:
+            query += " WHERE exercise_key = ?"
+            params = (exercise_key,)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return {key: (users, score_sum, total_sum) for key, users, score_sum, total_sum in rows}
+
+    def version(self, user_id: str) -> int:
+        with self._lock:
+            return self._user_version(user_id)
+
+    def _user_version(self, user_id: str) -> int:
+        row = self._conn.execute("SELECT version FROM users WHERE user_id = ?", (user_id,)).fetchone()
+        return row[0] if row else 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _parse_changes(body: bytes) -> dict[str, ProgressChange]:
+    try:
+        payload = json.loads(body)
+        changes = {
+            str(key): ProgressChange(
+                int(value[0]),
+                int(value[1]),
+                None if value[2] is None else int(value[2]),
+                int(value[3]),
+                int(value[4]),
+            )
+            for key, value in payload["changes"].items()
+        }
+    except (ValueError, KeyError, TypeError, IndexError, AttributeError) as exc:
+        raise HTTPError(400, f"Malformed changes: {exc}") from exc
+    if not changes:
+        raise HTTPError(400, "No changes")
+    return changes
+
+
+def _etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def _encode_cursor(score: int, user_id: str) -> str:
+    return f"{score}:{user_id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[int, str]:
+    score, sep, user_id = cursor.partition(":")
+    if not sep:
+        raise HTTPError(400, "Malformed cursor")
+    try:
+        return int(score), user_id
+    except ValueError as exc:
+        raise HTTPError(400, "Malformed cursor") from exc
+
+
+def _aggregate_body(users: int, score_sum: int, total_sum: int) -> dict[str, Any]:
+    return {
+        "users": users,
+        "score": score_sum,
+        "total": total_sum,
+        "accuracy": round(score_sum / total_sum, 4) if total_sum else None,
+    }
+
+
+def _entries_body(entries: dict[str, tuple[int, int, int]], version: int) -> dict[str, Any]:
+    return {"v": version, "e": {key: list(value) for key, value in entries.items()}}
+
+
+class ProgressService:
+    """
+    HTTP front end for a :class:`SqliteProgressStore`.
+
+    Parameters
+    ----------
+    store:
+        Backing store; its calls run on a worker thread.
+    token:
+        Bearer token required on every request except ``/healthz``; empty
+        disables authentication.
+    """
+
+    def __init__(self, store: SqliteProgressStore, token: str = "") -> None:
+        self.store = store
+        self.token = token
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        logger.info("Progress service listening on %s:%d", host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers = await self._read_headers(reader)
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+                length = int(headers.get("content-length", "0"))
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": _REASONS[413]}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                extra: dict[str, str] = {}
+                try:
+                    status, payload, extra = await self._dispatch(method, target, headers, body)
+                except HTTPError as exc:
+                    status, payload = exc.status, {"error": str(exc)}
+                except Exception:
+                    logger.exception("Progress service request failed: %s %s", method, target)
+                    status, payload, keep_alive = 500, {"error": "Internal error"}, False
+                await self._respond(writer, status, payload, keep_alive, extra)
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_headers(reader: asyncio.StreamReader) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    async def _dispatch(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, Any, dict[str, str]]:
+        url = urlsplit(target)
+        if url.path == "/healthz":
+            return 200, {"ok": True}, {}
+
+        if self.token and not hmac.compare_digest(f"Bearer {self.token}", headers.get("authorization", "")):
+            raise HTTPError(401)
+
+        resource, _, name = url.path.lstrip("/").partition("/")
+        if "/" in name:
+            raise HTTPError(404)
+        name = unquote(name)
+        query = dict(parse_qsl(url.query))
+        if resource == "progress" and name:
+            return await self._progress(method, name, query, headers, body)
+        if method != "GET":
+            raise HTTPError(405)
+        if resource == "leaderboard" and name:
+            return 200, await self._leaderboard(name, query), {}
+        if resource == "aggregates":
+            aggregates = await asyncio.to_thread(self.store.aggregates, name or None)
+            if name:
+                if name not in aggregates:
+                    raise HTTPError(404)
+                return 200, _aggregate_body(*aggregates[name]), {}
+            return 200, {key: _aggregate_body(*value) for key, value in aggregates.items()}, {}
+        raise HTTPError(404)
+
+    async def _progress(
+        self, method: str, user_id: str, query: dict[str, str], headers: dict[str, str], body: bytes
+    ) -> tuple[int, Any, dict[str, str]]:
+        if method == "GET":
+            try:
+                since = int(query.get("since", "0"))
+            except ValueError as exc:
+                raise HTTPError(400, "since must be an integer") from exc
+            # A version-stamped ETag identifies the body for this URL
+            if_none_match = headers.get("if-none-match")
+            if if_none_match and if_none_match == _etag(await asyncio.to_thread(self.store.version, user_id)):
+                return 304, None, {"ETag": if_none_match}
+            entries, version = await asyncio.to_thread(self.store.read, user_id, since)
+            return 200, _entries_body(entries, version), {"ETag": _etag(version)}
+        if method == "PATCH":
+            changes = _parse_changes(body)
+            stored, version = await asyncio.to_thread(self.store.apply, user_id, changes)
+            return 200, _entries_body(stored, version), {}
+        raise HTTPError(405)
+
+    async def _leaderboard(self, exercise_key: str, query: dict[str, str]) -> dict[str, Any]:
+        try:
+            limit = min(max(int(query.get("limit", DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+        except ValueError as exc:
+            raise HTTPError(400, "limit must be an integer") from exc
+        after = _decode_cursor(query["after"]) if query.get("after") else None
+        rows = await asyncio.to_thread(self.store.leaderboard, exercise_key, limit, after)
+        next_cursor = _encode_cursor(rows[-1][1], rows[-1][0]) if len(rows) == limit else None
+        return {"entries": [list(row) for row in rows], "next": next_cursor}
+
+    @staticmethod
+    async def _respond(
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Any,
+        keep_alive: bool = True,
+        headers: Optional[dict[str, str]] = None,
+    ) -> None:
+        body = b"" if payload is None else json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        extra = "".join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, 'Internal Server Error')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"{extra}"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+def run_service(host: Optional[str] = None, port: Optional[int] = None) -> None:
+    """Serve the progress API until interrupted."""
+    logging.basicConfig(level=logging.INFO)
+    store = SqliteProgressStore(os.getenv("PROGRESS_SERVICE_DB", "progress.db"))
+    service = ProgressService(store, os.getenv("PROGRESS_SERVICE_TOKEN", ""))
+    try:
+        asyncio.run(
+            service.serve(
+                host or os.getenv("PROGRESS_SERVICE_HOST", "0.0.0.0"),
+                port or int(os.getenv("PROGRESS_SERVICE_PORT", os.getenv("PORT", "8600"))),
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    run_service()
@@ -0,0 +1,135 @@
+"""
+Exercise progress kept in a single client_storage blob.
+
+Every exercise's ``(score, total)`` lives under one key as a small versioned
+document::
+
+    {"v": 1, "e": {"article_exercise": [3, 5], "verb_exercise": [7, 9]}}
+
+The blob is read once per session. Writes compare the in-memory map with the
+last persisted copy, skip no-op saves and fold concurrent saves into one
+``set_async`` call. Progress saved by older versions under per-exercise
+``{key}_score`` / ``{key}_total`` keys is migrated on the first load; only
+the exercises those versions had are touched, so unrelated keys with the
+same suffixes are left alone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import flet as ft
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_BLOB_KEY = "progress"
+BLOB_VERSION = 1
+
+# Storage keys of the exercise views that saved progress under per-exercise keys
+LEGACY_EXERCISES = (
+    "article_exercise",
+    "verb_exercise",
+    "preposition_exercise",
+    "pronunciation_exercise",
+    "greeting_exercise",
+    "time_exercise",
+    "weather_exercise",
+    "color_exercise",
+    "clothing_exercise",
+    "day_month_exercise",
+    "question_word_exercise",
+    "possessive_exercise",
+    "family_exercise",
+    "piacere_exercise",
+    "body_exercise",
+)
+_LEGACY_KEYS = {f"{exercise}_{field}": (exercise, field) for exercise in LEGACY_EXERCISES for field in ("score", "total")}
+
+
+def encode_blob(entries: dict[str, tuple[int, int]]) -> dict[str, Any]:
+    return {"v": BLOB_VERSION, "e": {key: [score, total] for key, (score, total) in entries.items()}}
+
+
+def decode_blob(blob: Any) -> dict[str, tuple[int, int]]:
+    if not isinstance(blob, dict) or blob.get("v") != BLOB_VERSION:
+        raise ValueError(f"Unsupported progress blob: {blob!r:.80}")
+    return {key: (int(value[0]), int(value[1])) for key, value in blob.get("e", {}).items()}
+
+
+class ProgressStore:
+    """Session-local progress map persisted as one client_storage blob."""
+
+    def __init__(self, page: ft.Page) -> None:
+        self.page = page
+        self._entries: dict[str, tuple[int, int]] = {}
+        self._persisted: dict[str, tuple[int, int]] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+
+    async def load(self) -> None:
+        """Read the blob (or migrate legacy keys) once per session."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            storage = self.page.client_storage
+            blob = await storage.get_async(PROGRESS_BLOB_KEY)
+            if blob is None:
+                self._entries = await self._migrate_legacy()
+            else:
+                try:
+                    self._entries = decode_blob(blob)
+                except (ValueError, TypeError, IndexError):
+                    logger.warning("Discarding unreadable progress blob")
+                    self._entries = {}
+                self._persisted = dict(self._entries)
+            self._loaded = True
+
+    async def _migrate_legacy(self) -> dict[str, tuple[int, int]]:
+        storage = self.page.client_storage
+        legacy_keys = [key for key in await storage.get_keys_async("") if key in _LEGACY_KEYS]
+        entries: dict[str, tuple[int, int]] = {}
+        for key in legacy_keys:
+            exercise, field = _LEGACY_KEYS[key]
+            value = int(await storage.get_async(key) or 0)
+            score, total = entries.get(exercise, (0, 0))
+            entries[exercise] = (value, total) if field == "score" else (score, value)
+
+        # Write the blob before dropping the old keys so a failure cannot lose progress
+        await storage.set_async(PROGRESS_BLOB_KEY, encode_blob(entries))
+        self._persisted = dict(entries)
+        for key in legacy_keys:
+            await storage.remove_async(key)
+        if legacy_keys:
+            logger.info("Migrated %d legacy progress keys into %r", len(legacy_keys), PROGRESS_BLOB_KEY)
+        return entries
+
+    async def get(self, key: str) -> tuple[int, int]:
+        await self.load()
+        return self._entries.get(key, (0, 0))
+
+    async def set(self, key: str, score: int, total: int) -> None:
+        await self.load()
+        self.update(key, score, total)
+        await self.flush()
+
+    def update(self, key: str, score: int, total: int) -> None:
+        """Change the in-memory map only; call :meth:`flush` to persist it."""
+        self._entries[key] = (score, total)
+
+    def snapshot(self) -> dict[str, tuple[int, int]]:
+        return dict(self._entries)
+
+    async def flush(self) -> None:
+        """Persist the map if it differs from what was last written."""
+        async with self._write_lock:
+            if self._entries == self._persisted:
+                return
+            snapshot = dict(self._entries)
+            await self.page.client_storage.set_async(PROGRESS_BLOB_KEY, encode_blob(snapshot))
+            self._persisted = snapshot
+
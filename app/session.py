@@ -0,0 +1,152 @@
+"""Per-session lifecycle: task tracking, teardown on disconnect and session counters."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable
+
+import flet as ft
+
+from app.profiling import stop_session_profile
+from app.tracing import bind_context
+from app.ui_updates import detach_batch
+
+logger = logging.getLogger(__name__)
+
+SESSION_KEY = "session_lifecycle"
+
+_counter_lock = threading.Lock()
+_sessions_opened = 0
+_sessions_closed = 0
+_live_sessions: "weakref.WeakValueDictionary[str, SessionLifecycle]" = weakref.WeakValueDictionary()
+
+
+def session_counts() -> dict[str, int]:
+    """Return process-wide counters for opened, closed and active sessions."""
+    with _counter_lock:
+        return {
+            "opened": _sessions_opened,
+            "closed": _sessions_closed,
+            "active": _sessions_opened - _sessions_closed,
+        }
+
+
+def live_sessions() -> dict[str, "SessionLifecycle"]:
+    """Return the open sessions of this process keyed by session id."""
+    with _counter_lock:
+        return dict(_live_sessions)
+
+
+class SessionLifecycle:
+    """
+    Owns the background work and view tree of one Flet session.
+
+    Parameters
+    ----------
+    page:
+        The session page. Disconnect and close handlers are installed on it.
+    flush_timeout:
+        Seconds to wait for in-flight persistent tasks (progress saves) when
+        the client disconnects or the session expires.
+    """
+
+    def __init__(self, page: ft.Page, flush_timeout: float = 5.0) -> None:
+        global _sessions_opened
+
+        self.page = page
+        self.flush_timeout = flush_timeout
+        self.views: list[Any] = []
+        self.closed = False
+        self._tasks: set[Future] = set()
+        self._persistent_tasks: set[Future] = set()
+        self._flush_callbacks: list[Callable[[], Awaitable[None]]] = []
+
+        page.session.set(SESSION_KEY, self)
+        page.on_disconnect = self._on_disconnect
+        page.on_close = self._on_close
+
+        with _counter_lock:
+            _sessions_opened += 1
+            _live_sessions[page.session_id] = self
+
+    def run_task(self, handler: Callable[..., Awaitable[Any]], *args: Any, persist: bool = False) -> Future:
+        """
+        Run ``handler`` on the page loop and track it for teardown.
+
+        Tasks started with ``persist=True`` are awaited on teardown instead of
+        being cancelled, which is what progress writes need. The caller's
+        tracing span becomes the parent of spans opened by the task; the
+        caller's update batch does not carry over, so the task's own updates
+        are sent by its own batch or immediately.
+        """
+        future = self.page.run_task(bind_context(detach_batch(handler)), *args)
+        tasks = self._persistent_tasks if persist else self._tasks
+        tasks.add(future)
+        future.add_done_callback(tasks.discard)
+        return future
+
+    def add_views(self, *views: Any) -> None:
+        self.views.extend(views)
+
+    def on_flush(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Register a coroutine function that persists pending state on teardown."""
+        self._flush_callbacks.append(callback)
+
+    async def flush(self) -> None:
+        """Wait for in-flight persistent tasks, then run the flush callbacks."""
+        pending = [asyncio.wrap_future(future) for future in list(self._persistent_tasks)]
+        if pending:
+            _, not_done = await asyncio.wait(pending, timeout=self.flush_timeout)
+            if not_done:
+                logger.warning("Session %s: %d progress writes did not finish", self.page.session_id, len(not_done))
+
+        for callback in list(self._flush_callbacks):
+            try:
+                await asyncio.wait_for(callback(), timeout=self.flush_timeout)
+            except Exception:
+                logger.exception("Session %s: flush callback failed", self.page.session_id)
+
+    async def close(self) -> None:
+        """Cancel session tasks, flush pending writes and release the view tree."""
+        global _sessions_closed
+
+        if self.closed:
+            return
+        self.closed = True
+
+        for future in list(self._tasks):
+            future.cancel()
+        self._tasks.clear()
+
+        await self.flush()
+
+        self._flush_callbacks.clear()
+        self.views.clear()
+        self.page.controls.clear()
+        self.page.overlay.clear()
+        self.page.session.clear()
+
+        stop_session_profile(self.page.session_id)
+
+        with _counter_lock:
+            _sessions_closed += 1
+            _live_sessions.pop(self.page.session_id, None)
+
+    async def _on_disconnect(self, _: ft.ControlEvent) -> None:
+        # The session may still reconnect, so only persist what is in flight.
+        await self.flush()
+
+    async def _on_close(self, _: ft.ControlEvent) -> None:
+        await self.close()
+
+
+def session_lifecycle(page: ft.Page) -> SessionLifecycle:
+    """Return the lifecycle registered for ``page``, creating it on first use."""
+    lifecycle = page.session.get(SESSION_KEY)
+    if lifecycle is None:
+        lifecycle = SessionLifecycle(page)
+    return lifecycle
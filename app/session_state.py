@@ -0,0 +1,150 @@
+"""
+Server-side cache of one session's user ID and progress.
+
+Client storage round-trips to the browser, so it is treated as the
+persistence layer only: the user ID is read once per session and the
+progress map is held in a :class:`ProgressStore`. Reads are served from
+memory; writes update memory immediately and are persisted by a single
+coalesced background task, which the session lifecycle awaits on teardown.
+Cloud writes go through the session's :class:`CloudOutbox`, which also pulls
+changes made on other devices into the progress map, and the views showing
+them, at the start of a session and after each push.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+import flet as ft
+
+from app.progress_store import ProgressStore
+from app.session import session_lifecycle
+from app.sync_queue import CloudOutbox
+
+logger = logging.getLogger(__name__)
+
+STATE_SESSION_KEY = "session_state"
+USER_ID_KEY = "user_id"
+
+
+class SessionState:
+    def __init__(self, page: ft.Page) -> None:
+        self.page = page
+        self.lifecycle = session_lifecycle(page)
+        self.progress = ProgressStore(page)
+        self.outbox = CloudOutbox(page, self.lifecycle, on_remote=self._apply_remote)
+        self._user_id: Optional[str] = None
+        self._persisted_user_id: Optional[str] = None
+        self._flush_scheduled = False
+        self.lifecycle.on_flush(self.flush)
+
+    async def get_user_id(self) -> str:
+        if self._user_id is None:
+            stored = await self.page.client_storage.get_async(USER_ID_KEY) or ""
+            # A set_user_id() may have landed while the read was in flight
+            if self._user_id is None:
+                self._user_id = self._persisted_user_id = str(stored)
+        return self._user_id
+
+    def set_user_id(self, user_id: str) -> None:
+        self._user_id = user_id
+        self._schedule_flush()
+
+    async def get_progress(self, key: str) -> tuple[int, int]:
+        return await self.progress.get(key)
+
+    async def save_progress(self, key: str, score: int, total: int) -> tuple[int, int]:
+        """
+        Record progress in memory and return without waiting for client storage.
+
+        Returns the value it replaced.
+        """
+        previous = await self.progress.get(key)
+        self.progress.update(key, score, total)
+        self._schedule_flush()
+        return previous
+
+    async def queue_cloud_save(
+        self,
+        user_id: str,
+        key: str,
+        score: int,
+        total: int,
+        *,
+        base: tuple[int, int] = (0, 0),
+        reset: bool = False,
+    ) -> None:
+        """
+        Queue a cloud write; it is sent in the background and retried until accepted.
+
+        ``base`` is the value the new one grew from and ``reset`` marks a
+        deliberate reset (see :meth:`CloudOutbox.enqueue`).
+        """
+        await self.outbox.load()
+        self.outbox.enqueue(user_id, key, score, total, base=base, reset=reset)
+        self._schedule_flush()
+
+    async def sync_from_cloud(self, user_id: str) -> bool:
+        """Pull the user's cloud changes into the progress map; returns whether the cloud answered."""
+        try:
+            return await self.outbox.pull(user_id)
+        except Exception:
+            logger.debug("Session %s: cloud pull failed", self.page.session_id, exc_info=True)
+            return False
+
+    async def _apply_remote(self, user_id: str, entries: dict[str, tuple[int, int]]) -> None:
+        if user_id != self._user_id:
+            return
+        await self.progress.load()
+        changed = set()
+        for key, (score, total) in entries.items():
+            if await self.progress.get(key) != (score, total):
+                self.progress.update(key, score, total)
+                changed.add(key)
+        if not changed:
+            return
+        self._schedule_flush()
+        # Views hold their own copy of the score; have the affected ones reload it
+        for view in self.lifecycle.views:
+            if getattr(view, "storage_key", None) in changed and hasattr(view, "_load_progress"):
+                self.lifecycle.run_task(view._load_progress)
+
+    async def resume_sync(self) -> None:
+        """Resume sending cloud writes left over from an earlier session."""
+        try:
+            await self.outbox.load()
+        except Exception:
+            logger.warning("Session %s: could not read the cloud outbox", self.page.session_id, exc_info=True)
+
+    def _schedule_flush(self) -> None:
+        if self._flush_scheduled or self.lifecycle.closed:
+            return
+        self._flush_scheduled = True
+        self.lifecycle.run_task(self._background_flush, persist=True)
+
+    async def _background_flush(self) -> None:
+        # Clear the flag first so writes made during the flush schedule another one
+        self._flush_scheduled = False
+        try:
+            await self.flush()
+        except Exception:
+            logger.warning("Session %s: persisting state to client storage failed", self.page.session_id, exc_info=True)
+
+    async def flush(self) -> None:
+        """Write the user ID, progress blob and cloud outbox if they changed."""
+        if self._user_id is not None and self._user_id != self._persisted_user_id:
+            user_id = self._user_id
+            await self.page.client_storage.set_async(USER_ID_KEY, user_id)
+            self._persisted_user_id = user_id
+        await self.progress.flush()
+        await self.outbox.persist()
+
+
+def session_state(page: ft.Page) -> SessionState:
+    """Return the session's state cache, creating it on first use."""
+    state = page.session.get(STATE_SESSION_KEY)
+    if state is None:
+        state = SessionState(page)
+        page.session.set(STATE_SESSION_KEY, state)
+    return state
@@ -0,0 +1,385 @@
+"""
+Offline-first delta sync of cloud progress.
+
+Saves are recorded in a per-session outbox and sent later, so an unreachable
+cloud costs nothing at answer time. The outbox keeps only the latest
+``(score, total)`` per user and exercise, which merges repeated saves into one
+entry, together with the local value the entry grew from and whether the
+user reset the exercise on the way. It is stored in client storage next to the progress blob, so a session
+that ends while offline resumes sending on the next visit. A background task
+sends each user's pending exercises as one batch and backs off exponentially
+while the cloud keeps failing.
+
+Sync is incremental (see :mod:`progress_api`). For every exercise the outbox
+remembers the last acknowledged cloud version together with the local value it
+corresponds to, and a per-user cursor of the newest version pulled:
+
+* a pull fetches only entries newer than the cursor and applies them to
+  exercises with no unsent change; the first pull of a session also catches
+  up on merged values the device has not shown yet;
+* a push sends only pending exercises, expressed on top of their acknowledged
+  cloud value (or, before anything was acknowledged, on top of the value the
+  device had loaded), so answers given on two devices add up instead of the
+  last writer discarding the other's. Only an explicit reset overwrites the
+  cloud value;
+* every successful push is followed by a pull, so a long-lived session picks
+  up what other devices wrote in the meantime.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+import flet as ft
+
+from app.metrics import PROGRESS_SECONDS
+from app.session import SessionLifecycle
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_KEY = "progress_outbox"
+OUTBOX_VERSION = 2
+MIN_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+
+# (score, total, base_version, base_score, base_total) per exercise; no base version overwrites
+Change = tuple[int, int, Optional[int], int, int]
+# (score, total, version) per exercise
+Versioned = tuple[int, int, int]
+
+Sender = Callable[[str, dict[str, Change]], Awaitable[Optional[dict[str, Versioned]]]]
+Puller = Callable[[str, int], Awaitable[Optional[tuple[dict[str, Versioned], int]]]]
+RemoteHandler = Callable[[str, dict[str, tuple[int, int]]], Awaitable[None]]
+
+
+class Pending(NamedTuple):
+    """Unsent value of one exercise and the local value it grew from."""
+
+    score: int
+    total: int
+    base_score: int = 0
+    base_total: int = 0
+    reset: bool = False
+
+
+class Ack(NamedTuple):
+    """Last cloud state of one exercise and the local value it was derived from."""
+
+    version: int
+    cloud_score: int
+    cloud_total: int
+    local_score: int
+    local_total: int
+
+
+async def _send_to_cloud(user_id: str, changes: dict[str, Change]) -> Optional[dict[str, Versioned]]:
+    from progress_api import ProgressChange, push_progress_changes
+
+    return await push_progress_changes(user_id, {key: ProgressChange(*change) for key, change in changes.items()})
+
+
+async def _pull_from_cloud(user_id: str, since: int) -> Optional[tuple[dict[str, Versioned], int]]:
+    from progress_api import pull_progress_changes
+
+    return await pull_progress_changes(user_id, since)
+
+
+async def _ignore_remote(user_id: str, entries: dict[str, tuple[int, int]]) -> None:
+    pass
+
+
+class CloudOutbox:
+    """
+    Pending cloud writes and sync cursors for one session.
+
+    Parameters
+    ----------
+    page:
+        Session page whose client storage holds the durable copy.
+    lifecycle:
+        Runs the sender task; the task is cancelled when the session closes.
+    sender:
+        Coroutine pushing ``{exercise_key: change}`` for one user and returning
+        the stored ``(score, total, version)`` per exercise, or ``None`` when
+        the cloud did not accept it.
+    puller:
+        Coroutine returning a user's entries newer than a version cursor and
+        the new cursor, or ``None`` when the cloud is unreachable.
+    on_remote:
+        Called with ``(user_id, {exercise_key: (score, total)})`` when a pull
+        brings newer values from another device.
+    """
+
+    def __init__(
+        self,
+        page: ft.Page,
+        lifecycle: SessionLifecycle,
+        sender: Sender = _send_to_cloud,
+        puller: Puller = _pull_from_cloud,
+        on_remote: RemoteHandler = _ignore_remote,
+    ) -> None:
+        self.page = page
+        self.lifecycle = lifecycle
+        self.sender = sender
+        self.puller = puller
+        self.on_remote = on_remote
+        self._pending: dict[str, dict[str, Pending]] = {}
+        self._acked: dict[str, dict[str, Ack]] = {}
+        self._since: dict[str, int] = {}
+        self._pulled: set[str] = set()
+        self._pull_lock = asyncio.Lock()
+        self._persisted: dict[str, Any] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._sending = False
+        self._backoff = MIN_BACKOFF
+
+    async def load(self) -> None:
+        """Read the durable outbox once and resume sending anything left in it."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self.page.client_storage.get_async(OUTBOX_KEY)
+            pending, acked, since = _decode(stored)
+            for user_id, entries in pending.items():
+                # Entries queued earlier in this session are newer than the stored ones
+                merged = dict(entries)
+                merged.update(self._pending.get(user_id, {}))
+                self._pending[user_id] = merged
+            for user_id, acks in acked.items():
+                self._acked[user_id] = {**acks, **self._acked.get(user_id, {})}
+            for user_id, cursor in since.items():
+                self._since[user_id] = max(cursor, self._since.get(user_id, 0))
+            self._persisted = stored if isinstance(stored, dict) else {}
+            self._loaded = True
+        self._start_sending()
+
+    async def pull(self, user_id: str, refresh: bool = False) -> bool:
+        """
+        Fetch changes made elsewhere since the last pull.
+
+        Without ``refresh`` this happens once per user and session. Returns
+        whether the user's cloud state is known to this session.
+        """
+        if user_id in self._pulled and not refresh:
+            return True
+        await self.load()
+        async with self._pull_lock:
+            first = user_id not in self._pulled
+            if not (first or refresh):
+                return True
+            with PROGRESS_SECONDS.time(operation="load", backend="cloud"):
+                result = await self.puller(user_id, self._since.get(user_id, 0))
+            if result is None:
+                return False
+            entries, cursor = result
+
+            pending = self._pending.get(user_id, {})
+            acked = self._acked.setdefault(user_id, {})
+            applied: dict[str, tuple[int, int]] = {}
+            for key, (score, total, version) in entries.items():
+                queued = pending.get(key)
+                if queued is not None:
+                    # The queued value grew from what this device had loaded, not from
+                    # the cloud value, so it is pushed as an increment on top of it
+                    if key not in acked:
+                        acked[key] = Ack(version, score, total, queued.base_score, queued.base_total)
+                    continue
+                acked[key] = Ack(version, score, total, score, total)
+                applied[key] = (score, total)
+            if first:
+                # Merged values acknowledged after the device last showed them
+                for key, ack in acked.items():
+                    if key in pending or key in applied:
+                        continue
+                    if (ack.cloud_score, ack.cloud_total) == (ack.local_score, ack.local_total):
+                        continue
+                    acked[key] = Ack(ack.version, ack.cloud_score, ack.cloud_total, ack.cloud_score, ack.cloud_total)
+                    applied[key] = (ack.cloud_score, ack.cloud_total)
+            self._since[user_id] = max(cursor, self._since.get(user_id, 0))
+            self._pulled.add(user_id)
+
+        if applied:
+            await self.on_remote(user_id, applied)
+        return True
+
+    def enqueue(
+        self,
+        user_id: str,
+        key: str,
+        score: int,
+        total: int,
+        *,
+        base: tuple[int, int] = (0, 0),
+        reset: bool = False,
+    ) -> None:
+        """
+        Queue ``(score, total)`` for one exercise.
+
+        ``base`` is the local value the new one grew from; it only matters for
+        an exercise the cloud has not acknowledged yet. ``reset`` marks a value
+        the user deliberately lowered, which then overwrites the cloud's.
+        """
+        entries = self._pending.setdefault(user_id, {})
+        queued = entries.get(key)
+        if queued is not None:
+            base = (queued.base_score, queued.base_total)
+            reset = reset or queued.reset
+        entries[key] = Pending(score, total, *base, reset)
+        self._start_sending()
+
+    def pending(self, user_id: str, key: str) -> Optional[tuple[int, int]]:
+        """Return an unsent value, which is newer than anything in the cloud."""
+        queued = self._pending.get(user_id, {}).get(key)
+        return None if queued is None else (queued.score, queued.total)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._pending.values())
+
+    async def persist(self) -> None:
+        """Write the outbox and sync cursors to client storage if they changed."""
+        if not self._loaded:
+            return
+        snapshot = _encode(self._pending, self._acked, self._since)
+        if snapshot == self._persisted:
+            return
+        await self.page.client_storage.set_async(OUTBOX_KEY, snapshot)
+        self._persisted = snapshot
+
+    def _changes(self, user_id: str, entries: dict[str, Pending]) -> dict[str, Change]:
+        acked = self._acked.get(user_id, {})
+        changes: dict[str, Change] = {}
+        for key, queued in entries.items():
+            ack = acked.get(key)
+            if queued.reset:
+                changes[key] = (queued.score, queued.total, None, 0, 0)
+            elif ack is None:
+                # Nothing in the cloud when last pulled; if another device wrote
+                # since, the server adds the increments over the loaded value
+                changes[key] = (queued.score, queued.total, 0, queued.base_score, queued.base_total)
+            else:
+                # Replay this device's increments on top of the acknowledged cloud value.
+                # A view still showing a value from before a pull can save less than the
+                # acknowledged one; that counts from its own value instead of resetting.
+                changes[key] = (
+                    ack.cloud_score + max(queued.score - ack.local_score, 0),
+                    ack.cloud_total + max(queued.total - ack.local_total, 0),
+                    ack.version,
+                    ack.cloud_score,
+                    ack.cloud_total,
+                )
+        return changes
+
+    def _start_sending(self) -> None:
+        if self._sending or not self._pending or self.lifecycle.closed:
+            return
+        self._sending = True
+        self.lifecycle.run_task(self._send_loop)
+
+    async def _send_loop(self) -> None:
+        try:
+            while self._pending:
+                user_id, entries = next(iter(self._pending.items()))
+                if not entries:
+                    del self._pending[user_id]
+                    continue
+                batch = dict(entries)
+                stored: Optional[dict[str, Versioned]] = None
+                try:
+                    # Bases must come from the cloud's current state, not a stale session
+                    if await self.pull(user_id):
+                        with PROGRESS_SECONDS.time(operation="save", backend="cloud"):
+                            stored = await self.sender(user_id, self._changes(user_id, batch))
+                except Exception:
+                    logger.debug("Cloud progress sync failed", exc_info=True)
+
+                if stored is not None:
+                    self._backoff = MIN_BACKOFF
+                    self._acknowledge(user_id, batch, stored)
+                    try:
+                        # Pick up what other devices wrote since this session's first pull
+                        await self.pull(user_id, refresh=True)
+                    except Exception:
+                        logger.debug("Cloud progress refresh failed", exc_info=True)
+                    try:
+                        await self.persist()
+                    except Exception:
+                        logger.debug("Could not persist the cloud outbox", exc_info=True)
+                else:
+                    delay = self._backoff * random.uniform(0.5, 1.0)
+                    self._backoff = min(self._backoff * 2, MAX_BACKOFF)
+                    await asyncio.sleep(delay)
+        finally:
+            self._sending = False
+
+    def _acknowledge(self, user_id: str, batch: dict[str, Pending], stored: dict[str, Versioned]) -> None:
+        acked = self._acked.setdefault(user_id, {})
+        current = self._pending.get(user_id, {})
+        for key, queued in batch.items():
+            if key in stored:
+                cloud_score, cloud_total, version = stored[key]
+                acked[key] = Ack(version, cloud_score, cloud_total, queued.score, queued.total)
+            # Keep entries that were updated again while the batch was in flight;
+            # the next push sends them relative to the new acknowledgement
+            if current.get(key) == queued:
+                del current[key]
+            elif key in current and queued.reset:
+                current[key] = current[key]._replace(reset=False)
+        if not current:
+            self._pending.pop(user_id, None)
+
+
+def _encode(
+    pending: dict[str, dict[str, Pending]],
+    acked: dict[str, dict[str, Ack]],
+    since: dict[str, int],
+) -> dict[str, Any]:
+    return {
+        "v": OUTBOX_VERSION,
+        "pending": {
+            user_id: {key: [*queued[:4], int(queued.reset)] for key, queued in entries.items()}
+            for user_id, entries in pending.items()
+            if entries
+        },
+        "acked": {user_id: {key: list(ack) for key, ack in acks.items()} for user_id, acks in acked.items() if acks},
+        "since": {user_id: cursor for user_id, cursor in since.items() if cursor},
+    }
+
+
+def _decode(
+    stored: Any,
+) -> tuple[dict[str, dict[str, Pending]], dict[str, dict[str, Ack]], dict[str, int]]:
+    if not isinstance(stored, dict):
+        return {}, {}, {}
+    if stored.get("v") != OUTBOX_VERSION:
+        # Version 1 stored only the pending map
+        return _decode_pending(stored), {}, {}
+
+    acked = {
+        str(user_id): {key: Ack(*(int(part) for part in value)) for key, value in acks.items()}
+        for user_id, acks in (stored.get("acked") or {}).items()
+        if isinstance(acks, dict)
+    }
+    since = {str(user_id): int(cursor) for user_id, cursor in (stored.get("since") or {}).items()}
+    return _decode_pending(stored.get("pending")), acked, since
+
+
+def _decode_pending(stored: Any) -> dict[str, dict[str, Pending]]:
+    if not isinstance(stored, dict):
+        return {}
+    return {
+        str(user_id): {key: _decode_entry(value) for key, value in entries.items()}
+        for user_id, entries in stored.items()
+        if isinstance(entries, dict)
+    }
+
+
+def _decode_entry(value: Any) -> Pending:
+    # Entries written before bases and resets were recorded hold only [score, total]
+    score, total, base_score, base_total, reset = (*value, 0, 0, 0)[:5]
+    return Pending(int(score), int(total), int(base_score), int(base_total), bool(reset))
@@ -0,0 +1,237 @@
+"""
+Lightweight tracing spans for the progress and chat paths.
+
+Spans nest through a context variable, so children opened inside an ``async``
+function (or a thread started with ``asyncio.to_thread``) attach to the right
+parent automatically. ``SessionLifecycle.run_task`` carries the caller's span
+into tasks it starts on the page loop via :func:`bind_context`.
+
+Configuration
+-------------
+``TRACE_SAMPLE_RATE``
+    Fraction of root spans (new traces) that are recorded; ``0`` (default)
+    turns tracing off and leaves only a context-variable lookup per span.
+``TRACE_EXPORT``
+    ``jsonl:<path>`` (default ``jsonl:traces.jsonl``) appends one span per line;
+    ``otlp:<url>`` posts OTLP/JSON batches, e.g. ``otlp:http://127.0.0.1:4318/v1/traces``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+EXPORT_TARGET = os.getenv("TRACE_EXPORT", "jsonl:traces.jsonl")
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 5.0
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def as_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "duration_ms": (self.end_ns - self.start_ns) / 1e6,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    def as_otlp(self) -> dict:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [{"key": k, "value": {"stringValue": str(v)}} for k, v in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class _NotSampled:
+    """Marks a trace that was not sampled so its children are skipped too."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+NOT_SAMPLED = _NotSampled()
+
+_current: ContextVar[Optional[Span | _NotSampled]] = ContextVar("current_span", default=None)
+
+
+class BatchExporter:
+    """Buffers finished spans and writes them from a background thread in batches."""
+
+    def __init__(self, target: str = EXPORT_TARGET, batch_size: int = BATCH_SIZE, interval: float = FLUSH_INTERVAL) -> None:
+        self.kind, _, self.destination = target.partition(":")
+        if self.kind not in ("jsonl", "otlp"):
+            raise ValueError(f"Unsupported TRACE_EXPORT target: {target}")
+        self.batch_size = batch_size
+        self.interval = interval
+        self._queue: queue.SimpleQueue[Span] = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, span: Span) -> None:
+        self._queue.put(span)
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.flush)
+
+    def _drain(self) -> list[Span]:
+        spans: list[Span] = []
+        while len(spans) < self.batch_size:
+            try:
+                spans.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return spans
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+
+    def flush(self) -> None:
+        while True:
+            spans = self._drain()
+            if not spans:
+                return
+            try:
+                self._export(spans)
+            except Exception:
+                logger.warning("Dropped %d spans: export to %s failed", len(spans), self.destination, exc_info=True)
+
+    def _export(self, spans: list[Span]) -> None:
+        if self.kind == "jsonl":
+            with open(self.destination, "a", encoding="utf-8") as handle:
+                handle.write("".join(json.dumps(span.as_dict(), default=str) + "\n" for span in spans))
+            return
+
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "italia-learning-toolkit"}}]},
+                    "scopeSpans": [{"scope": {"name": "app.tracing"}, "spans": [span.as_otlp() for span in spans]}],
+                }
+            ]
+        }
+        requests.post(self.destination, json=payload, timeout=5).raise_for_status()
+
+
+EXPORTER: Optional[BatchExporter] = BatchExporter() if SAMPLE_RATE > 0 else None
+
+
+@contextmanager
+def start_span(name: str, **attributes: Any) -> Iterator[Span | _NotSampled]:
+    """
+    Open a span as a child of the current one, or start a sampled-or-not trace.
+
+    Exceptions propagate unchanged; the span records their class name.
+    """
+    parent = _current.get()
+    if EXPORTER is None or parent is NOT_SAMPLED or (parent is None and random.random() >= SAMPLE_RATE):
+        token = _current.set(NOT_SAMPLED)
+        try:
+            yield NOT_SAMPLED
+        finally:
+            _current.reset(token)
+        return
+
+    span = Span(
+        name=name,
+        trace_id=parent.trace_id if isinstance(parent, Span) else os.urandom(16).hex(),
+        span_id=os.urandom(8).hex(),
+        parent_id=parent.span_id if isinstance(parent, Span) else None,
+        start_ns=time.time_ns(),
+        attributes=attributes,
+    )
+    token = _current.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.error = type(exc).__name__
+        raise
+    finally:
+        _current.reset(token)
+        span.end_ns = time.time_ns()
+        EXPORTER.submit(span)
+
+
+def traced(name: str) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Wrap an async function in a span called ``name``."""
+
+    def decorate(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with start_span(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def bind_context(handler: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Return ``handler`` bound to the caller's current span.
+
+    ``Page.run_task`` copies the caller's context into the task, so the span
+    would carry over anyway; binding it explicitly keeps the parent fixed to
+    the span that was current when the task was started, whatever else the
+    task inherits. Other context state, such as the caller's update batch,
+    is cleared separately (see :meth:`app.session.SessionLifecycle.run_task`).
+    """
+    parent = _current.get()
+    if parent is None:
+        return handler
+
+    @functools.wraps(handler)
+    async def with_parent(*args: Any, **kwargs: Any) -> Any:
+        token = _current.set(parent)
+        try:
+            return await handler(*args, **kwargs)
+        finally:
+            _current.reset(token)
+
+    return with_parent
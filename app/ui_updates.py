@@ -0,0 +1,176 @@
+"""Coalesce control updates so one interaction costs one websocket message."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Coroutine, Generator, Iterator, Optional
+
+import flet as ft
+
+from app.metrics import HANDLER_SECONDS
+from app.profiling import SESSION_PROFILES, run_profiled, run_profiled_async
+
+_active_batch: ContextVar[Optional["UpdateBatch"]] = ContextVar("active_update_batch", default=None)
+
+
+class UpdateBatch:
+    """
+    Collects dirty controls for one page and sends them in a single update.
+
+    Controls are de-duplicated by identity and flushed in the order they were
+    first marked, which keeps the resulting patch deterministic.
+    """
+
+    def __init__(self, page: ft.Page) -> None:
+        self.page = page
+        self._dirty: dict[int, ft.Control] = {}
+
+    def mark(self, *controls: ft.Control) -> None:
+        for control in controls:
+            self._dirty.setdefault(id(control), control)
+
+    def flush(self) -> None:
+        """Send every control marked since the last flush as one page update."""
+        if not self._dirty:
+            return
+        controls = [control for control in self._dirty.values() if getattr(control, "page", None)]
+        self._dirty.clear()
+        if controls:
+            self.page.update(*controls)
+
+
+def current_batch() -> Optional[UpdateBatch]:
+    return _active_batch.get()
+
+
+def schedule_update(*controls: ft.Control) -> None:
+    """
+    Update ``controls`` now, or defer them to the active batch if there is one.
+
+    Outside a batch several controls are still sent together through
+    ``Page.update`` instead of one message per control.
+    """
+    if not controls:
+        return
+
+    batch = _active_batch.get()
+    if batch is not None:
+        batch.mark(*controls)
+        return
+
+    if len(controls) == 1:
+        controls[0].update()
+    else:
+        controls[0].page.update(*controls)
+
+
+@contextmanager
+def batch_updates(page: ft.Page) -> Iterator[UpdateBatch]:
+    """
+    Defer updates issued inside the block and flush them once on exit.
+
+    Nested blocks join the outermost batch so only one flush happens.
+    """
+    batch = _active_batch.get()
+    if batch is not None:
+        yield batch
+        return
+
+    batch = UpdateBatch(page)
+    token = _active_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        _active_batch.reset(token)
+        batch.flush()
+
+
+def detach_batch(handler: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Return ``handler`` (a coroutine function) set to run outside any update batch.
+
+    ``Page.run_task`` copies the caller's context into the new task, so a task
+    started from a batched handler would otherwise keep marking controls into
+    that handler's batch after it has been flushed, and never send them.
+    """
+
+    @functools.wraps(handler)
+    async def unbatched(*args: Any, **kwargs: Any) -> Any:
+        _active_batch.set(None)
+        return await handler(*args, **kwargs)
+
+    return unbatched
+
+
+class _BusyTime:
+    """
+    Await a coroutine while adding up the time its steps run on the loop.
+
+    Time spent suspended (sleeps, network calls, other tasks) is not counted,
+    so a handler that waits on the chat API is measured by its own work only.
+    """
+
+    def __init__(self, coroutine: Coroutine[Any, Any, Any]) -> None:
+        self.coroutine = coroutine
+        self.seconds = 0.0
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        steps = self.coroutine.__await__()
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            start = time.perf_counter()
+            try:
+                yielded = steps.send(value) if error is None else steps.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.seconds += time.perf_counter() - start
+            try:
+                value, error = (yield yielded), None
+            except BaseException as exc:  # delivered into the coroutine, e.g. cancellation
+                value, error = None, exc
+
+
+def batched(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorate a view method (sync or async) so its updates are flushed together.
+
+    The decorated object must expose the session page as ``self.page``. The
+    handler's running time, including the flush, is recorded in
+    ``HANDLER_SECONDS``; for coroutines that excludes the time spent awaiting,
+    such as the pause before an auto-advance or a chat API call. The call runs
+    under cProfile while its session is being profiled.
+    """
+    handler_name = method.__qualname__
+
+    if asyncio.iscoroutinefunction(method):
+
+        async def run(self, *args: Any, **kwargs: Any) -> Any:
+            with batch_updates(self.page):
+                if SESSION_PROFILES:
+                    return await run_profiled_async(self.page.session_id, method, self, *args, **kwargs)
+                return await method(self, *args, **kwargs)
+
+        @functools.wraps(method)
+        async def async_wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            timed = _BusyTime(run(self, *args, **kwargs))
+            try:
+                return await timed
+            finally:
+                HANDLER_SECONDS.observe(timed.seconds, handler=handler_name)
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        with HANDLER_SECONDS.time(handler=handler_name), batch_updates(self.page):
+            if SESSION_PROFILES:
+                return run_profiled(self.page.session_id, method, self, *args, **kwargs)
+            return method(self, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,355 @@
+"""
+Multi-process web deployment: a supervisor, N Flet workers and a sticky front router.
+
+Each worker is a normal ``web.py`` process bound to a private local port. The
+router accepts public connections, reads the HTTP request head, and pins the
+client to one worker with rendezvous hashing over the client address (the
+first ``X-Forwarded-For`` hop when running behind a platform proxy). Because
+the hash only changes for clients of a worker that leaves the healthy set, a
+websocket session keeps reconnecting to the same worker and finds its Flet
+session there.
+
+``GET /_workers`` on the public port returns per-worker health as JSON and
+``SIGHUP`` triggers a rolling, one-worker-at-a-time restart. Each worker stops
+taking new clients and is restarted only once its last websocket has closed;
+a worker still serving sessions after ``WEB_DRAIN_TIMEOUT`` seconds (default
+900) is left running and the restart stops there. ``SIGUSR1`` forces the
+restart, stopping workers whatever their open connections, including one the
+current restart is waiting on.
+
+Workers are probed with ``GET /``; one that accepts connections but does not
+answer with a 200 within ``PROBE_TIMEOUT`` counts as unhealthy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+HEALTH_PATH = "/_workers"
+PROBE_PATH = "/"
+PROBE_TIMEOUT = 2.0
+MAX_HEAD_BYTES = 64 * 1024
+
+
+@dataclass
+class WorkerProcess:
+    index: int
+    port: int
+    process: Optional[subprocess.Popen] = None
+    healthy: bool = False
+    draining: bool = False
+    restarts: int = 0
+    connections: int = 0
+    started_at: float = 0.0
+    last_check: float = 0.0
+    last_error: str = ""
+    _backoff: float = field(default=1.0, repr=False)
+    _respawn_at: float = field(default=0.0, repr=False)
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def status(self) -> dict:
+        return {
+            "index": self.index,
+            "port": self.port,
+            "pid": self.process.pid if self.process else None,
+            "alive": self.alive,
+            "healthy": self.healthy,
+            "draining": self.draining,
+            "restarts": self.restarts,
+            "connections": self.connections,
+            "uptime": round(time.time() - self.started_at, 1) if self.alive else 0,
+            "last_check": self.last_check,
+            "last_error": self.last_error,
+        }
+
+
+class Supervisor:
+    """
+    Runs worker processes and the sticky router in front of them.
+
+    Parameters
+    ----------
+    script:
+        Entry script each worker runs (``web.py``).
+    workers:
+        Number of worker processes.
+    host, port:
+        Public address the router listens on.
+    base_port:
+        First private port for workers; worker ``i`` listens on ``base_port + i``.
+    grace_period:
+        Seconds a worker gets to exit after SIGTERM, and to become healthy
+        after a restart.
+    drain_timeout:
+        Seconds a rolling restart waits for a worker's sessions to close
+        (``WEB_DRAIN_TIMEOUT``, default 900).
+    """
+
+    def __init__(
+        self,
+        script: str,
+        workers: int,
+        *,
+        host: str = "0.0.0.0",
+        port: int = 8550,
+        base_port: Optional[int] = None,
+        health_interval: float = 2.0,
+        grace_period: float = 20.0,
+        drain_timeout: Optional[float] = None,
+    ) -> None:
+        self.script = script
+        self.host = host
+        self.port = port
+        self.health_interval = health_interval
+        self.grace_period = grace_period
+        self.drain_timeout = drain_timeout if drain_timeout is not None else float(os.getenv("WEB_DRAIN_TIMEOUT", "900"))
+        first_port = base_port or int(os.getenv("WEB_WORKER_BASE_PORT", str(port + 100)))
+        self.workers = [WorkerProcess(index=i, port=first_port + i) for i in range(workers)]
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._stopping = asyncio.Event()
+        self._restarting = False
+        self._forced = False
+
+    # Worker processes
+
+    def _spawn(self, worker: WorkerProcess) -> None:
+        env = dict(os.environ)
+        env.update(
+            {
+                "PORT": str(worker.port),
+                "WEB_HOST": "127.0.0.1",
+                "WEB_WORKERS": "1",
+                "WEB_WORKER_INDEX": str(worker.index),
+            }
+        )
+        worker.process = subprocess.Popen([sys.executable, self.script], env=env)
+        worker.started_at = time.time()
+        worker.healthy = False
+        logger.info("Started worker %d (pid %d) on port %d", worker.index, worker.process.pid, worker.port)
+
+    async def _stop(self, worker: WorkerProcess) -> None:
+        if not worker.alive:
+            return
+        assert worker.process is not None
+        worker.process.terminate()
+        deadline = time.monotonic() + self.grace_period
+        while worker.alive and time.monotonic() < deadline:
+            await asyncio.sleep(0.2)
+        if worker.alive:
+            logger.warning("Worker %d ignored SIGTERM, killing it", worker.index)
+            worker.process.kill()
+        worker.healthy = False
+
+    async def _check(self, worker: WorkerProcess) -> None:
+        worker.last_check = time.time()
+        if not worker.alive:
+            worker.healthy = False
+            return
+        try:
+            status = await asyncio.wait_for(_probe(worker.port), timeout=PROBE_TIMEOUT)
+        except (OSError, ValueError, asyncio.IncompleteReadError, asyncio.TimeoutError) as exc:
+            worker.healthy = False
+            worker.last_error = str(exc) or type(exc).__name__
+            return
+        worker.healthy = status == 200
+        worker.last_error = "" if worker.healthy else f"GET {PROBE_PATH} returned {status}"
+        if worker.healthy:
+            worker._backoff = 1.0
+
+    async def _health_loop(self) -> None:
+        while not self._stopping.is_set():
+            now = time.monotonic()
+            for worker in self.workers:
+                await self._check(worker)
+                if worker.alive or worker.draining:
+                    continue
+                if not worker._respawn_at:
+                    code = worker.process.returncode if worker.process else None
+                    logger.warning("Worker %d exited (%s), restarting in %.0fs", worker.index, code, worker._backoff)
+                    worker._respawn_at = now + worker._backoff
+                    worker._backoff = min(worker._backoff * 2, 30.0)
+                elif now >= worker._respawn_at:
+                    worker._respawn_at = 0.0
+                    worker.restarts += 1
+                    self._spawn(worker)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.health_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def rolling_restart(self, force: bool = False) -> None:
+        """
+        Restart workers one at a time: drain each, stop it once its connections
+        have closed, and wait for it to become healthy.
+
+        Without ``force`` a worker whose sessions are still open after
+        ``drain_timeout`` is left running and the restart ends there. A forced
+        call also cuts short the drain of a restart already in progress.
+        """
+        if force:
+            self._forced = True
+        if self._restarting:
+            return
+        self._restarting = True
+        try:
+            for worker in self.workers:
+                logger.info("Rolling restart: draining worker %d", worker.index)
+                worker.draining = True
+                deadline = time.monotonic() + self.drain_timeout
+                while worker.connections and not self._forced and time.monotonic() < deadline:
+                    await asyncio.sleep(0.5)
+                if worker.connections and not self._forced:
+                    logger.warning(
+                        "Rolling restart stopped: worker %d still has %d connections after %.0fs; send SIGUSR1 to force it",
+                        worker.index,
+                        worker.connections,
+                        self.drain_timeout,
+                    )
+                    worker.draining = False
+                    return
+                if worker.connections:
+                    logger.warning("Rolling restart forced: stopping worker %d with %d connections", worker.index, worker.connections)
+                await self._stop(worker)
+                worker.restarts += 1
+                self._spawn(worker)
+                deadline = time.monotonic() + self.grace_period
+                while not worker.healthy and time.monotonic() < deadline:
+                    await asyncio.sleep(0.5)
+                    await self._check(worker)
+                worker.draining = False
+        finally:
+            self._restarting = False
+            self._forced = False
+
+    # Routing
+
+    def _pick(self, client_key: str) -> Optional[WorkerProcess]:
+        candidates = [w for w in self.workers if w.healthy and not w.draining]
+        if not candidates:
+            candidates = [w for w in self.workers if w.alive]
+        if not candidates:
+            return None
+        return max(
+            candidates,
+            key=lambda w: hashlib.blake2b(f"{client_key}|{w.index}".encode(), digest_size=8).digest(),
+        )
+
+    @staticmethod
+    def _client_key(head: bytes, peer: str) -> str:
+        for line in head.split(b"\r\n")[1:]:
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"x-forwarded-for" and value.strip():
+                return value.split(b",")[0].strip().decode("latin-1")
+        return peer
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info("peername")
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+
+        if head.split(b" ", 2)[1:2] == [HEALTH_PATH.encode()]:
+            body = json.dumps({"workers": [w.status() for w in self.workers]}).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+            writer.close()
+            return
+
+        worker = self._pick(self._client_key(head, peer[0] if peer else ""))
+        if worker is None:
+            writer.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            writer.close()
+            return
+
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", worker.port)
+        except OSError:
+            worker.healthy = False
+            writer.close()
+            return
+
+        worker.connections += 1
+        try:
+            upstream_writer.write(head)
+            await asyncio.gather(_pipe(reader, upstream_writer), _pipe(upstream_reader, writer))
+        finally:
+            worker.connections -= 1
+
+    # Entry point
+
+    async def serve(self) -> None:
+        for worker in self.workers:
+            self._spawn(worker)
+
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, self._stopping.set)
+        loop.add_signal_handler(signal.SIGINT, self._stopping.set)
+        loop.add_signal_handler(signal.SIGHUP, lambda: asyncio.ensure_future(self.rolling_restart()))
+        loop.add_signal_handler(signal.SIGUSR1, lambda: asyncio.ensure_future(self.rolling_restart(force=True)))
+
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_HEAD_BYTES)
+        logger.info("Routing %s:%d across %d workers", self.host, self.port, len(self.workers))
+        health = asyncio.create_task(self._health_loop())
+        try:
+            await self._stopping.wait()
+        finally:
+            self._server.close()
+            health.cancel()
+            await asyncio.gather(*(self._stop(worker) for worker in self.workers))
+
+
+async def _probe(port: int) -> int:
+    """Send ``GET PROBE_PATH`` to a worker and return the response status code."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(f"GET {PROBE_PATH} HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        status_line = await reader.readuntil(b"\r\n")
+    finally:
+        writer.close()
+    parts = status_line.split(b" ", 2)
+    if len(parts) < 2 or not parts[0].startswith(b"HTTP/"):
+        raise ValueError(f"not an HTTP response: {status_line[:80]!r}")
+    return int(parts[1])
+
+
+async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            chunk = await reader.read(65536)
+            if not chunk:
+                break
+            writer.write(chunk)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+def run_supervisor(script: str, workers: int, *, host: str, port: int) -> None:
+    """Block running ``workers`` copies of ``script`` behind a sticky router."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    asyncio.run(Supervisor(script, workers, host=host, port=port).serve())
@@ -1,68 +1,64 @@
-"""Data modules for the Italian learning toolkit."""
+"""
+Data modules for the Italian learning toolkit.
 
-from .reference_sections import REFERENCE_SECTIONS
-from .exercise_data import (
-    ARTICLE_OPTIONS,
-    ARTICLE_QUESTIONS,
-    BODY_OPTIONS,
-    BODY_QUESTIONS,
-    CLOTHING_OPTIONS,
-    CLOTHING_QUESTIONS,
-    COLOR_OPTIONS,
-    COLOR_QUESTIONS,
-    DAY_MONTH_OPTIONS,
-    DAY_MONTH_QUESTIONS,
-    FAMILY_OPTIONS,
-    FAMILY_QUESTIONS,
-    GREETING_OPTIONS,
-    GREETING_QUESTIONS,
-    PIACERE_OPTIONS,
-    PIACERE_QUESTIONS,
-    POSSESSIVE_OPTIONS,
-    POSSESSIVE_QUESTIONS,
-    PREPOSITION_QUESTIONS,
-    PRONUNCIATION_OPTIONS,
-    PRONUNCIATION_QUESTIONS,
-    QUESTION_WORD_OPTIONS,
-    QUESTION_WORD_QUESTIONS,
-    TIME_OPTIONS,
-    TIME_QUESTIONS,
-    VERB_OPTIONS,
-    VERB_QUESTIONS,
-    WEATHER_OPTIONS,
-    WEATHER_QUESTIONS,
-)
+Each bank lives in its own module under ``data.banks`` and is imported the
+first time one of its names is accessed on this package, so ``import data``
+costs almost nothing until a bank is actually used. Items from files in the
+content directory (see :mod:`data.content`) are appended to the built-in
+bank on that first access.
 
-__all__ = [
-    "REFERENCE_SECTIONS",
-    "ARTICLE_QUESTIONS",
-    "ARTICLE_OPTIONS",
-    "BODY_OPTIONS",
-    "BODY_QUESTIONS",
-    "CLOTHING_OPTIONS",
-    "CLOTHING_QUESTIONS",
-    "COLOR_OPTIONS",
-    "COLOR_QUESTIONS",
-    "DAY_MONTH_OPTIONS",
-    "DAY_MONTH_QUESTIONS",
-    "FAMILY_OPTIONS",
-    "FAMILY_QUESTIONS",
-    "GREETING_OPTIONS",
-    "GREETING_QUESTIONS",
-    "PIACERE_OPTIONS",
-    "PIACERE_QUESTIONS",
-    "POSSESSIVE_OPTIONS",
-    "POSSESSIVE_QUESTIONS",
-    "PREPOSITION_QUESTIONS",
-    "PRONUNCIATION_OPTIONS",
-    "PRONUNCIATION_QUESTIONS",
-    "QUESTION_WORD_OPTIONS",
-    "QUESTION_WORD_QUESTIONS",
-    "TIME_OPTIONS",
-    "TIME_QUESTIONS",
-    "VERB_QUESTIONS",
-    "VERB_OPTIONS",
-    "WEATHER_OPTIONS",
-    "WEATHER_QUESTIONS",
-]
+Banks are served from the current content snapshot (:mod:`data.snapshot`) as
+tuples of read-only mappings. Attribute lookups are not cached on the package,
+so after a hot reload ``data.VERB_QUESTIONS`` returns the new bank while
+anything already holding the old one keeps a consistent copy.
+"""
 
+from importlib import import_module
+from typing import Any
+
+_LAZY_ATTRIBUTES = {
+    "REFERENCE_SECTIONS": "reference_sections",
+    "ARTICLE_QUESTIONS": "banks.articles",
+    "ARTICLE_OPTIONS": "banks.articles",
+    "BODY_OPTIONS": "banks.body",
+    "BODY_QUESTIONS": "banks.body",
+    "CLOTHING_OPTIONS": "banks.clothing",
+    "CLOTHING_QUESTIONS": "banks.clothing",
+    "COLOR_OPTIONS": "banks.colors",
+    "COLOR_QUESTIONS": "banks.colors",
+    "DAY_MONTH_OPTIONS": "banks.days_months",
+    "DAY_MONTH_QUESTIONS": "banks.days_months",
+    "FAMILY_OPTIONS": "banks.family",
+    "FAMILY_QUESTIONS": "banks.family",
+    "GREETING_OPTIONS": "banks.greetings",
+    "GREETING_QUESTIONS": "banks.greetings",
+    "NOUNS": "banks.nouns",
+    "PIACERE_OPTIONS": "banks.piacere",
+    "PIACERE_QUESTIONS": "banks.piacere",
+    "POSSESSIVE_OPTIONS": "banks.possessives",
+    "POSSESSIVE_QUESTIONS": "banks.possessives",
+    "PREPOSITION_QUESTIONS": "banks.prepositions",
+    "PRONUNCIATION_OPTIONS": "banks.pronunciation",
+    "PRONUNCIATION_QUESTIONS": "banks.pronunciation",
+    "QUESTION_WORD_OPTIONS": "banks.question_words",
+    "QUESTION_WORD_QUESTIONS": "banks.question_words",
+    "TIME_OPTIONS": "banks.telling_time",
+    "TIME_QUESTIONS": "banks.telling_time",
+    "VERB_QUESTIONS": "banks.verbs",
+    "VERB_OPTIONS": "banks.verbs",
+    "VERBS": "banks.verb_lexicon",
+    "WEATHER_OPTIONS": "banks.weather",
+    "WEATHER_QUESTIONS": "banks.weather",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(".snapshot", __name__).current().get(name)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,8 @@
+"""
+Exercise question banks for the Italian Learning Toolkit, one module per topic.
+
+Update or extend the lists in these modules to add more practice material.
+New modules must also be listed in ``data/__init__.py`` so they load lazily.
+Content can also be added without code changes through files in the content
+directory; see ``data/content.py``.
+"""
@@ -0,0 +1,102 @@
+"""Definite article practice (il, lo, la, l', i, gli, le)."""
+
+ARTICLE_QUESTIONS = [
+    {
+        "english": "the cat",
+        "italian": "gatto",
+        "number": "singular",
+        "gender": "masculine",
+        "correct": "IL",
+        "explanation": "Il gatto → standard masculine singular form.",
+    },
+    {
+        "english": "the cats",
+        "italian": "gatti",
+        "number": "plural",
+        "gender": "masculine",
+        "correct": "I",
+        "explanation": "I gatti → plural of il.",
+    },
+    {
+        "english": "the sandwich",
+        "italian": "panino",
+        "number": "singular",
+        "gender": "masculine",
+        "correct": "IL",
+        "explanation": "Il panino → consonant-starting masculine singular noun.",
+    },
+    {
+        "english": "the sandwiches",
+        "italian": "panini",
+        "number": "plural",
+        "gender": "masculine",
+        "correct": "I",
+        "explanation": "I panini → plural of il.",
+    },
+    {
+        "english": "the shelf",
+        "italian": "scaffale",
+        "number": "singular",
+        "gender": "masculine",
+        "correct": "LO",
+        "explanation": "Lo scaffale → s + consonant takes lo.",
+    },
+    {
+        "english": "the shelves",
+        "italian": "scaffali",
+        "number": "plural",
+        "gender": "masculine",
+        "correct": "GLI",
+        "explanation": "Gli scaffali → plural of lo.",
+    },
+    {
+        "english": "the sugar",
+        "italian": "zucchero",
+        "number": "singular",
+        "gender": "masculine",
+        "correct": "LO",
+        "explanation": "Lo zucchero → words starting with z take lo.",
+    },
+    {
+        "english": "the sugars",
+        "italian": "zuccheri",
+        "number": "plural",
+        "gender": "masculine",
+        "correct": "GLI",
+        "explanation": "Gli zuccheri → plural of lo.",
+    },
+    {
+        "english": "the pizza",
+        "italian": "pizza",
+        "number": "singular",
+        "gender": "feminine",
+        "correct": "LA",
+        "explanation": "La pizza → standard feminine singular.",
+    },
+    {
+        "english": "the pizzas",
+        "italian": "pizze",
+        "number": "plural",
+        "gender": "feminine",
+        "correct": "LE",
+        "explanation": "Le pizze → plural feminine article.",
+    },
+    {
+        "english": "the orange",
+        "italian": "arancia",
+        "number": "singular",
+        "gender": "feminine",
+        "correct": "L'",
+        "explanation": "L'arancia → vowel-starting noun uses l'.",
+    },
+    {
+        "english": "the oranges",
+        "italian": "arancie",
+        "number": "plural",
+        "gender": "feminine",
+        "correct": "LE",
+        "explanation": "Le arancie → feminine plural article.",
+    },
+]
+
+ARTICLE_OPTIONS = ["IL", "LO", "LA", "L'", "I", "GLI", "LE"]
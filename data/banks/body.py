@@ -0,0 +1,66 @@
+"""Body part vocabulary."""
+
+BODY_QUESTIONS = [
+    {
+        "english": "head",
+        "correct": "testa",
+        "explanation": "La testa → head",
+    },
+    {
+        "english": "eyes",
+        "correct": "occhi",
+        "explanation": "Gli occhi → eyes",
+    },
+    {
+        "english": "nose",
+        "correct": "naso",
+        "explanation": "Il naso → nose",
+    },
+    {
+        "english": "mouth",
+        "correct": "bocca",
+        "explanation": "La bocca → mouth",
+    },
+    {
+        "english": "ears",
+        "correct": "orecchie",
+        "explanation": "Le orecchie → ears",
+    },
+    {
+        "english": "hands",
+        "correct": "mani",
+        "explanation": "Le mani → hands",
+    },
+    {
+        "english": "feet",
+        "correct": "piedi",
+        "explanation": "I piedi → feet",
+    },
+    {
+        "english": "legs",
+        "correct": "gambe",
+        "explanation": "Le gambe → legs",
+    },
+    {
+        "english": "arms",
+        "correct": "braccia",
+        "explanation": "Le braccia → arms",
+    },
+    {
+        "english": "stomach/belly",
+        "correct": "pancia",
+        "explanation": "La pancia → stomach/belly",
+    },
+    {
+        "english": "back",
+        "correct": "schiena",
+        "explanation": "La schiena → back",
+    },
+    {
+        "english": "my head hurts",
+        "correct": "mi fa male la testa",
+        "explanation": "Mi fa male (singular) → my head hurts",
+    },
+]
+
+BODY_OPTIONS = ["testa", "occhi", "occhio", "naso", "bocca", "orecchie", "mani", "mano", "piedi", "piede", "gambe", "gamba", "braccia", "braccio", "pancia", "schiena", "capelli", "denti", "collo", "mi fa male la testa", "mi fanno male i denti"]
@@ -0,0 +1,66 @@
+"""Clothing vocabulary."""
+
+CLOTHING_QUESTIONS = [
+    {
+        "english": "T-shirt",
+        "correct": "maglietta",
+        "explanation": "Maglietta → T-shirt.",
+    },
+    {
+        "english": "button-up shirt",
+        "correct": "camicia",
+        "explanation": "Camicia → button-up shirt.",
+    },
+    {
+        "english": "jacket",
+        "correct": "giacca",
+        "explanation": "Giacca → jacket.",
+    },
+    {
+        "english": "pants",
+        "correct": "pantaloni",
+        "explanation": "Pantaloni → pants.",
+    },
+    {
+        "english": "shoes",
+        "correct": "scarpe",
+        "explanation": "Scarpe → shoes.",
+    },
+    {
+        "english": "hat",
+        "correct": "cappello",
+        "explanation": "Cappello → hat.",
+    },
+    {
+        "english": "dress",
+        "correct": "vestito",
+        "explanation": "Vestito → dress.",
+    },
+    {
+        "english": "coat",
+        "correct": "cappotto",
+        "explanation": "Cappotto → coat.",
+    },
+    {
+        "english": "scarf",
+        "correct": "sciarpa",
+        "explanation": "Sciarpa → scarf.",
+    },
+    {
+        "english": "gloves",
+        "correct": "guanti",
+        "explanation": "Guanti → gloves.",
+    },
+    {
+        "english": "boots",
+        "correct": "stivali",
+        "explanation": "Stivali → boots.",
+    },
+    {
+        "english": "skirt",
+        "correct": "gonna",
+        "explanation": "Gonna → skirt.",
+    },
+]
+
+CLOTHING_OPTIONS = ["maglietta", "camicia", "giacca", "pantaloni", "scarpe", "cappello", "vestito", "cappotto", "sciarpa", "guanti", "stivali", "gonna", "calze", "felpa", "maglione"]
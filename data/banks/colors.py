@@ -0,0 +1,56 @@
+"""Color adjectives and agreement."""
+
+COLOR_QUESTIONS = [
+    {
+        "noun_phrase": "la macchina (red)",
+        "correct": "rossa",
+        "explanation": "La macchina rossa → feminine singular, so 'rosso' becomes 'rossa'.",
+    },
+    {
+        "noun_phrase": "il cappello (red)",
+        "correct": "rosso",
+        "explanation": "Il cappello rosso → masculine singular form.",
+    },
+    {
+        "noun_phrase": "le macchine (red)",
+        "correct": "rosse",
+        "explanation": "Le macchine rosse → feminine plural, so 'rosso' becomes 'rosse'.",
+    },
+    {
+        "noun_phrase": "i cappelli (red)",
+        "correct": "rossi",
+        "explanation": "I cappelli rossi → masculine plural, so 'rosso' becomes 'rossi'.",
+    },
+    {
+        "noun_phrase": "la macchina (purple)",
+        "correct": "viola",
+        "explanation": "La macchina viola → 'viola' is invariable, stays the same.",
+    },
+    {
+        "noun_phrase": "il cappello (blue)",
+        "correct": "blu",
+        "explanation": "Il cappello blu → 'blu' is invariable, stays the same.",
+    },
+    {
+        "noun_phrase": "le macchine (green)",
+        "correct": "verdi",
+        "explanation": "Le macchine verdi → 'verde' agrees in number: verdi for plural.",
+    },
+    {
+        "noun_phrase": "la camicia (white)",
+        "correct": "bianca",
+        "explanation": "La camicia bianca → feminine singular: bianco → bianca.",
+    },
+    {
+        "noun_phrase": "i pantaloni (black)",
+        "correct": "neri",
+        "explanation": "I pantaloni neri → masculine plural: nero → neri.",
+    },
+    {
+        "noun_phrase": "le scarpe (yellow)",
+        "correct": "gialle",
+        "explanation": "Le scarpe gialle → feminine plural: giallo → gialle.",
+    },
+]
+
+COLOR_OPTIONS = ["rosso", "rossa", "rossi", "rosse", "viola", "blu", "verde", "verdi", "bianco", "bianca", "bianchi", "bianche", "nero", "nera", "neri", "nere", "giallo", "gialla", "gialli", "gialle"]
@@ -0,0 +1,101 @@
+"""Days of the week and months of the year."""
+
+DAY_MONTH_QUESTIONS = [
+    {
+        "english": "Monday",
+        "correct": "lunedì",
+        "explanation": "Lunedì → Monday.",
+    },
+    {
+        "english": "Tuesday",
+        "correct": "martedì",
+        "explanation": "Martedì → Tuesday.",
+    },
+    {
+        "english": "Wednesday",
+        "correct": "mercoledì",
+        "explanation": "Mercoledì → Wednesday.",
+    },
+    {
+        "english": "Thursday",
+        "correct": "giovedì",
+        "explanation": "Giovedì → Thursday.",
+    },
+    {
+        "english": "Friday",
+        "correct": "venerdì",
+        "explanation": "Venerdì → Friday.",
+    },
+    {
+        "english": "Saturday",
+        "correct": "sabato",
+        "explanation": "Sabato → Saturday.",
+    },
+    {
+        "english": "Sunday",
+        "correct": "domenica",
+        "explanation": "Domenica → Sunday.",
+    },
+    {
+        "english": "January",
+        "correct": "gennaio",
+        "explanation": "Gennaio → January.",
+    },
+    {
+        "english": "February",
+        "correct": "febbraio",
+        "explanation": "Febbraio → February.",
+    },
+    {
+        "english": "March",
+        "correct": "marzo",
+        "explanation": "Marzo → March.",
+    },
+    {
+        "english": "April",
+        "correct": "aprile",
+        "explanation": "Aprile → April.",
+    },
+    {
+        "english": "May",
+        "correct": "maggio",
+        "explanation": "Maggio → May.",
+    },
+    {
+        "english": "June",
+        "correct": "giugno",
+        "explanation": "Giugno → June.",
+    },
+    {
+        "english": "July",
+        "correct": "luglio",
+        "explanation": "Luglio → July.",
+    },
+    {
+        "english": "August",
+        "correct": "agosto",
+        "explanation": "Agosto → August.",
+    },
+    {
+        "english": "September",
+        "correct": "settembre",
+        "explanation": "Settembre → September.",
+    },
+    {
+        "english": "October",
+        "correct": "ottobre",
+        "explanation": "Ottobre → October.",
+    },
+    {
+        "english": "November",
+        "correct": "novembre",
+        "explanation": "Novembre → November.",
+    },
+    {
+        "english": "December",
+        "correct": "dicembre",
+        "explanation": "Dicembre → December.",
+    },
+]
+
+DAY_MONTH_OPTIONS = ["lunedì", "martedì", "mercoledì", "giovedì", "venerdì", "sabato", "domenica", "gennaio", "febbraio", "marzo", "aprile", "maggio", "giugno", "luglio", "agosto", "settembre", "ottobre", "novembre", "dicembre"]
@@ -0,0 +1,66 @@
+"""Family vocabulary."""
+
+FAMILY_QUESTIONS = [
+    {
+        "english": "mother",
+        "correct": "madre",
+        "explanation": "Madre → mother",
+    },
+    {
+        "english": "father",
+        "correct": "padre",
+        "explanation": "Padre → father",
+    },
+    {
+        "english": "brother",
+        "correct": "fratello",
+        "explanation": "Fratello → brother",
+    },
+    {
+        "english": "sister",
+        "correct": "sorella",
+        "explanation": "Sorella → sister",
+    },
+    {
+        "english": "grandfather",
+        "correct": "nonno",
+        "explanation": "Nonno → grandfather",
+    },
+    {
+        "english": "grandmother",
+        "correct": "nonna",
+        "explanation": "Nonna → grandmother",
+    },
+    {
+        "english": "uncle",
+        "correct": "zio",
+        "explanation": "Zio → uncle",
+    },
+    {
+        "english": "aunt",
+        "correct": "zia",
+        "explanation": "Zia → aunt",
+    },
+    {
+        "english": "son",
+        "correct": "figlio",
+        "explanation": "Figlio → son",
+    },
+    {
+        "english": "daughter",
+        "correct": "figlia",
+        "explanation": "Figlia → daughter",
+    },
+    {
+        "english": "parents",
+        "correct": "genitori",
+        "explanation": "Genitori → parents",
+    },
+    {
+        "english": "relatives",
+        "correct": "parenti",
+        "explanation": "Parenti → relatives",
+    },
+]
+
+FAMILY_OPTIONS = ["madre", "mamma", "padre", "papà", "fratello", "sorella", "zio", "zia", "nonno", "nonna", "nonni", "cugino", "cugina", "nipote", "figlio", "figlia", "genitori", "parenti", "famiglia"]
@@ -0,0 +1,56 @@
+"""Greetings for everyday situations."""
+
+GREETING_QUESTIONS = [
+    {
+        "situation": "You meet someone at 9 AM",
+        "correct": "Buongiorno",
+        "explanation": "Buongiorno is used for 'good morning' or 'good day'.",
+    },
+    {
+        "situation": "You greet a friend casually",
+        "correct": "Ciao",
+        "explanation": "Ciao means 'hi' or 'bye' in informal settings.",
+    },
+    {
+        "situation": "You arrive at a dinner at 7 PM",
+        "correct": "Buonasera",
+        "explanation": "Buonasera means 'good evening' and is used in the evening hours.",
+    },
+    {
+        "situation": "You're going to bed",
+        "correct": "Buona notte",
+        "explanation": "Buona notte means 'good night' when going to sleep.",
+    },
+    {
+        "situation": "You're leaving someone in the evening and want to wish them well",
+        "correct": "Buona serata",
+        "explanation": "Buona serata means 'have a good evening'.",
+    },
+    {
+        "situation": "Formal goodbye",
+        "correct": "Arrivederci",
+        "explanation": "Arrivederci is a formal way to say goodbye.",
+    },
+    {
+        "situation": "You just met someone for the first time (informal)",
+        "correct": "Piacere di conoscerti",
+        "explanation": "Piacere di conoscerti means 'nice to meet you' in informal contexts.",
+    },
+    {
+        "situation": "You just met someone for the first time (formal)",
+        "correct": "Piacere di conoscerla",
+        "explanation": "Piacere di conoscerla means 'nice to meet you' in formal contexts.",
+    },
+    {
+        "situation": "Leaving a friend saying 'see you later'",
+        "correct": "Ci vediamo",
+        "explanation": "Ci vediamo means 'see you' in an informal way.",
+    },
+    {
+        "situation": "Wishing someone a good day as you part",
+        "correct": "Buona giornata",
+        "explanation": "Buona giornata means 'have a good day'.",
+    },
+]
+
+GREETING_OPTIONS = ["Buongiorno", "Ciao", "Buonasera", "Buona notte", "Buona serata", "Arrivederci", "Piacere di conoscerti", "Piacere di conoscerla", "Ci vediamo", "Buona giornata", "Salve"]
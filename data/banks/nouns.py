@@ -0,0 +1,60 @@
+"""Noun lexicon for the generated article and preposition drills (see ``data/morphology.py``)."""
+
+NOUNS = [
+    # Masculine, most consonants: il / i
+    {"lemma": "gatto", "gender": "masculine", "plural": "gatti", "english": "cat", "english_plural": "cats"},
+    {"lemma": "libro", "gender": "masculine", "plural": "libri", "english": "book", "english_plural": "books"},
+    {"lemma": "tavolo", "gender": "masculine", "plural": "tavoli", "english": "table", "english_plural": "tables"},
+    {"lemma": "ragazzo", "gender": "masculine", "plural": "ragazzi", "english": "boy", "english_plural": "boys"},
+    {"lemma": "cane", "gender": "masculine", "plural": "cani", "english": "dog", "english_plural": "dogs"},
+    {"lemma": "giardino", "gender": "masculine", "plural": "giardini", "english": "garden", "english_plural": "gardens"},
+    {"lemma": "treno", "gender": "masculine", "plural": "treni", "english": "train", "english_plural": "trains"},
+    {"lemma": "mercato", "gender": "masculine", "plural": "mercati", "english": "market", "english_plural": "markets"},
+    {"lemma": "negozio", "gender": "masculine", "plural": "negozi", "english": "shop", "english_plural": "shops"},
+    {"lemma": "bicchiere", "gender": "masculine", "plural": "bicchieri", "english": "glass", "english_plural": "glasses"},
+    {"lemma": "fiume", "gender": "masculine", "plural": "fiumi", "english": "river", "english_plural": "rivers"},
+    {"lemma": "medico", "gender": "masculine", "plural": "medici", "english": "doctor", "english_plural": "doctors"},
+    {"lemma": "parco", "gender": "masculine", "plural": "parchi", "english": "park", "english_plural": "parks"},
+    {"lemma": "cinema", "gender": "masculine", "plural": "cinema", "english": "cinema", "english_plural": "cinemas"},
+    # Masculine, s + consonant, z, gn, ps, x, y: lo / gli
+    {"lemma": "studente", "gender": "masculine", "plural": "studenti", "english": "student", "english_plural": "students"},
+    {"lemma": "zaino", "gender": "masculine", "plural": "zaini", "english": "backpack", "english_plural": "backpacks"},
+    {"lemma": "specchio", "gender": "masculine", "plural": "specchi", "english": "mirror", "english_plural": "mirrors"},
+    {"lemma": "sport", "gender": "masculine", "plural": "sport", "english": "sport", "english_plural": "sports"},
+    {"lemma": "zio", "gender": "masculine", "plural": "zii", "english": "uncle", "english_plural": "uncles"},
+    {"lemma": "gnomo", "gender": "masculine", "plural": "gnomi", "english": "gnome", "english_plural": "gnomes"},
+    {"lemma": "psicologo", "gender": "masculine", "plural": "psicologi", "english": "psychologist", "english_plural": "psychologists"},
+    {"lemma": "stadio", "gender": "masculine", "plural": "stadi", "english": "stadium", "english_plural": "stadiums"},
+    {"lemma": "sconto", "gender": "masculine", "plural": "sconti", "english": "discount", "english_plural": "discounts"},
+    {"lemma": "xilofono", "gender": "masculine", "plural": "xilofoni", "english": "xylophone", "english_plural": "xylophones"},
+    {"lemma": "yogurt", "gender": "masculine", "plural": "yogurt", "english": "yogurt", "english_plural": "yogurts"},
+    # Masculine, vowel or h + vowel: l' / gli
+    {"lemma": "amico", "gender": "masculine", "plural": "amici", "english": "friend", "english_plural": "friends"},
+    {"lemma": "albero", "gender": "masculine", "plural": "alberi", "english": "tree", "english_plural": "trees"},
+    {"lemma": "ospedale", "gender": "masculine", "plural": "ospedali", "english": "hospital", "english_plural": "hospitals"},
+    {"lemma": "ufficio", "gender": "masculine", "plural": "uffici", "english": "office", "english_plural": "offices"},
+    {"lemma": "aeroporto", "gender": "masculine", "plural": "aeroporti", "english": "airport", "english_plural": "airports"},
+    {"lemma": "orologio", "gender": "masculine", "plural": "orologi", "english": "watch", "english_plural": "watches"},
+    {"lemma": "hotel", "gender": "masculine", "plural": "hotel", "english": "hotel", "english_plural": "hotels"},
+    # Feminine, consonant: la / le
+    {"lemma": "casa", "gender": "feminine", "plural": "case", "english": "house", "english_plural": "houses"},
+    {"lemma": "macchina", "gender": "feminine", "plural": "macchine", "english": "car", "english_plural": "cars"},
+    {"lemma": "pizza", "gender": "feminine", "plural": "pizze", "english": "pizza", "english_plural": "pizzas"},
+    {"lemma": "strada", "gender": "feminine", "plural": "strade", "english": "street", "english_plural": "streets"},
+    {"lemma": "scuola", "gender": "feminine", "plural": "scuole", "english": "school", "english_plural": "schools"},
+    {"lemma": "zia", "gender": "feminine", "plural": "zie", "english": "aunt", "english_plural": "aunts"},
+    {"lemma": "finestra", "gender": "feminine", "plural": "finestre", "english": "window", "english_plural": "windows"},
+    {"lemma": "città", "gender": "feminine", "plural": "città", "english": "city", "english_plural": "cities"},
+    {"lemma": "chiave", "gender": "feminine", "plural": "chiavi", "english": "key", "english_plural": "keys"},
+    {"lemma": "mano", "gender": "feminine", "plural": "mani", "english": "hand", "english_plural": "hands"},
+    {"lemma": "piazza", "gender": "feminine", "plural": "piazze", "english": "square", "english_plural": "squares"},
+    {"lemma": "stazione", "gender": "feminine", "plural": "stazioni", "english": "station", "english_plural": "stations"},
+    # Feminine, vowel: l' / le
+    {"lemma": "amica", "gender": "feminine", "plural": "amiche", "english": "friend (female)", "english_plural": "friends (female)"},
+    {"lemma": "acqua", "gender": "feminine", "plural": "acque", "english": "water", "english_plural": "waters"},
+    {"lemma": "isola", "gender": "feminine", "plural": "isole", "english": "island", "english_plural": "islands"},
+    {"lemma": "estate", "gender": "feminine", "plural": "estati", "english": "summer", "english_plural": "summers"},
+    {"lemma": "università", "gender": "feminine", "plural": "università", "english": "university", "english_plural": "universities"},
+    {"lemma": "arancia", "gender": "feminine", "plural": "arance", "english": "orange", "english_plural": "oranges"},
+    {"lemma": "ora", "gender": "feminine", "plural": "ore", "english": "hour", "english_plural": "hours"},
+]
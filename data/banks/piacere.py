@@ -0,0 +1,46 @@
+"""Piacere and mancare constructions."""
+
+PIACERE_QUESTIONS = [
+    {
+        "english": "I like pizza",
+        "correct": "mi piace la pizza",
+        "explanation": "Mi piace (singular) → I like pizza",
+    },
+    {
+        "english": "I like spaghetti",
+        "correct": "mi piacciono gli spaghetti",
+        "explanation": "Mi piacciono (plural) → I like spaghetti",
+    },
+    {
+        "english": "you like it",
+        "correct": "ti piace",
+        "explanation": "Ti piace → you like it",
+    },
+    {
+        "english": "he likes it",
+        "correct": "gli piace",
+        "explanation": "Gli piace → he likes it",
+    },
+    {
+        "english": "she likes it",
+        "correct": "le piace",
+        "explanation": "Le piace → she likes it",
+    },
+    {
+        "english": "we like them",
+        "correct": "ci piacciono",
+        "explanation": "Ci piacciono (plural) → we like them",
+    },
+    {
+        "english": "I miss you",
+        "correct": "mi manchi",
+        "explanation": "Mi manchi → I miss you (you are the subject)",
+    },
+    {
+        "english": "you miss it",
+        "correct": "ti manca",
+        "explanation": "Ti manca → you miss it",
+    },
+]
+
+PIACERE_OPTIONS = ["mi piace", "mi piacciono", "ti piace", "ti piacciono", "gli piace", "le piace", "ci piace", "ci piacciono", "vi piace", "vi piacciono", "mi manca", "mi manchi", "ti manca", "gli manca", "le manca", "ci manca", "mi piace la pizza", "mi piacciono gli spaghetti"]
@@ -0,0 +1,51 @@
+"""Possessive adjectives and pronouns."""
+
+POSSESSIVE_QUESTIONS = [
+    {
+        "english": "my car (la macchina)",
+        "correct": "la mia macchina",
+        "explanation": "Feminine singular → la mia",
+    },
+    {
+        "english": "my mother",
+        "correct": "mia madre",
+        "explanation": "Family members often drop the article → mia madre",
+    },
+    {
+        "english": "my boyfriend",
+        "correct": "il mio ragazzo",
+        "explanation": "Masculine singular → il mio",
+    },
+    {
+        "english": "your house (la casa)",
+        "correct": "la tua casa",
+        "explanation": "Feminine singular → la tua",
+    },
+    {
+        "english": "his friends (gli amici)",
+        "correct": "i suoi amici",
+        "explanation": "Masculine plural → i suoi",
+    },
+    {
+        "english": "her sister",
+        "correct": "sua sorella",
+        "explanation": "Family members drop the article → sua sorella",
+    },
+    {
+        "english": "our parents (i genitori)",
+        "correct": "i nostri genitori",
+        "explanation": "Masculine plural → i nostri",
+    },
+    {
+        "english": "your (plural) children (i figli)",
+        "correct": "i vostri figli",
+        "explanation": "Masculine plural → i vostri",
+    },
+    {
+        "english": "their house (la casa)",
+        "correct": "la loro casa",
+        "explanation": "Loro never changes → la loro casa",
+    },
+]
+
+POSSESSIVE_OPTIONS = ["il mio", "la mia", "i miei", "le mie", "il tuo", "la tua", "i tuoi", "le tue", "il suo", "la sua", "i suoi", "le sue", "il nostro", "la nostra", "i nostri", "le nostre", "il vostro", "la vostra", "i vostri", "le vostre", "il loro", "la loro", "i loro", "le loro", "mio", "mia", "tuo", "tua", "suo", "sua", "la mia macchina", "mia madre", "il mio ragazzo", "la tua casa", "i suoi amici", "sua sorella", "i nostri genitori", "i vostri figli", "la loro casa"]
@@ -0,0 +1,62 @@
+"""Prepositions combined with definite articles (preposizioni articolate)."""
+
+PREPOSITION_QUESTIONS = [
+    {
+        "preposition": "di",
+        "article_phrase": "la polizia",
+        "result": "della polizia",
+        "english": "of the police",
+        "explanation": "di + la = della → la macchina della polizia.",
+    },
+    {
+        "preposition": "di",
+        "article_phrase": "il mattino",
+        "result": "del mattino",
+        "english": "of the morning",
+        "explanation": "di + il = del → le cinque del mattino.",
+    },
+    {
+        "preposition": "a",
+        "article_phrase": "il tavolo",
+        "result": "al tavolo",
+        "english": "to/at the table",
+        "explanation": "a + il = al → siediti al tavolo.",
+    },
+    {
+        "preposition": "a",
+        "article_phrase": "l'aeroporto",
+        "result": "all'aeroporto",
+        "english": "to the airport",
+        "explanation": "a + l' = all' → vado all'aeroporto.",
+    },
+    {
+        "preposition": "da",
+        "article_phrase": "gli Stati Uniti",
+        "result": "dagli Stati Uniti",
+        "english": "from the United States",
+        "explanation": "da + gli = dagli → vengo dagli Stati Uniti.",
+    },
+    {
+        "preposition": "da",
+        "article_phrase": "il 1950",
+        "result": "dal 1950",
+        "english": "since 1950",
+        "explanation": "da + il = dal → dal 1950.",
+    },
+    {
+        "preposition": "in",
+        "article_phrase": "la macchina",
+        "result": "nella macchina",
+        "english": "in the car",
+        "explanation": "in + la = nella → la chiave è nella macchina.",
+    },
+    {
+        "preposition": "su",
+        "article_phrase": "il tavolo",
+        "result": "sul tavolo",
+        "english": "on the table",
+        "explanation": "su + il = sul → la bottiglia è sul tavolo.",
+    },
+]
+
+# New practice questions for remaining reference topics
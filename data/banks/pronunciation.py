@@ -0,0 +1,56 @@
+"""Pronunciation practice."""
+
+PRONUNCIATION_QUESTIONS = [
+    {
+        "question": "How is 'CI' pronounced in Italian?",
+        "correct": "chee",
+        "explanation": "CI sounds like 'chee' as in formaggio (for-MAH-joh).",
+    },
+    {
+        "question": "How is 'CE' pronounced?",
+        "correct": "cheh",
+        "explanation": "CE sounds like 'cheh' as in certo (CHEHR-toh).",
+    },
+    {
+        "question": "What sound does 'GI' make?",
+        "correct": "jee",
+        "explanation": "GI sounds like 'jee' as in the English word 'jeans'.",
+    },
+    {
+        "question": "How do you pronounce 'GE'?",
+        "correct": "jeh",
+        "explanation": "GE sounds like 'jeh' as in gelato (jeh-LAH-toh).",
+    },
+    {
+        "question": "What sound does 'SCI' make?",
+        "correct": "shee",
+        "explanation": "SCI sounds like 'shee' as in scimmia (SHEE-mee-ah).",
+    },
+    {
+        "question": "How is 'SCE' pronounced?",
+        "correct": "sheh",
+        "explanation": "SCE sounds like 'sheh' as in scelta (SHEL-tah).",
+    },
+    {
+        "question": "What sound does 'GN' make?",
+        "correct": "ny (like Spanish ñ)",
+        "explanation": "GN sounds like Spanish ñ as in gnocchi (NYOH-kee).",
+    },
+    {
+        "question": "How is 'GLI' pronounced?",
+        "correct": "ly",
+        "explanation": "GLI sounds like 'ly' as in maglietta (mah-LYEH-tah).",
+    },
+    {
+        "question": "Is the letter H silent in Italian?",
+        "correct": "Yes",
+        "explanation": "H is always silent, so 'ho', 'hai', 'ha' sound like 'o', 'ai', 'a'.",
+    },
+    {
+        "question": "How do you pronounce 'CH' before E or I?",
+        "correct": "hard K",
+        "explanation": "CH produces a hard K sound before E/I, as in gnocchi or bruschetta.",
+    },
+]
+
+PRONUNCIATION_OPTIONS = ["chee", "cheh", "jee", "jeh", "shee", "sheh", "ny (like Spanish ñ)", "ly", "Yes", "No", "hard K", "soft C"]
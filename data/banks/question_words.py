@@ -0,0 +1,56 @@
+"""Question words (parole interrogative)."""
+
+QUESTION_WORD_QUESTIONS = [
+    {
+        "meaning": "what / thing",
+        "correct": "Cosa",
+        "explanation": "Cosa → what / thing (Cosa fai oggi? What are you doing today?)",
+    },
+    {
+        "meaning": "which / what kind",
+        "correct": "Che",
+        "explanation": "Che → which / what kind (Che macchina hai? What kind of car do you have?)",
+    },
+    {
+        "meaning": "which (specific choice)",
+        "correct": "Quale",
+        "explanation": "Quale → which (Quale gusto preferisce? Which flavor do you prefer?)",
+    },
+    {
+        "meaning": "why / because",
+        "correct": "Perché",
+        "explanation": "Perché → why / because (Perché studi l'italiano? Why do you study Italian?)",
+    },
+    {
+        "meaning": "how",
+        "correct": "Come",
+        "explanation": "Come → how (Come stai? How are you?)",
+    },
+    {
+        "meaning": "where",
+        "correct": "Dove",
+        "explanation": "Dove → where (Dov'è? Where is it? Di dove sei? Where are you from?)",
+    },
+    {
+        "meaning": "when",
+        "correct": "Quando",
+        "explanation": "Quando → when (Quando è il tuo compleanno? When is your birthday?)",
+    },
+    {
+        "meaning": "how much",
+        "correct": "Quanto",
+        "explanation": "Quanto/Quanta → how much (singular)",
+    },
+    {
+        "meaning": "how many",
+        "correct": "Quanti",
+        "explanation": "Quanti/Quante → how many (plural)",
+    },
+    {
+        "meaning": "who",
+        "correct": "Chi",
+        "explanation": "Chi → who (Chi è? Who is it?)",
+    },
+]
+
+QUESTION_WORD_OPTIONS = ["Cosa", "Che", "Quale", "Perché", "Come", "Dove", "Quando", "Quanto", "Quanti", "Chi"]
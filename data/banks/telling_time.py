@@ -0,0 +1,51 @@
+"""Telling the time in Italian."""
+
+TIME_QUESTIONS = [
+    {
+        "time": "1:00",
+        "correct": "È l'una",
+        "explanation": "È l'una → it's one o'clock (singular).",
+    },
+    {
+        "time": "2:00",
+        "correct": "Sono le due",
+        "explanation": "Sono le due → it is two o'clock (plural form for all hours except 1).",
+    },
+    {
+        "time": "12:00 noon",
+        "correct": "È mezzogiorno",
+        "explanation": "È mezzogiorno → it's noon.",
+    },
+    {
+        "time": "12:00 midnight",
+        "correct": "È mezzanotte",
+        "explanation": "È mezzanotte → it's midnight.",
+    },
+    {
+        "time": "5:15",
+        "correct": "Sono le cinque e un quarto",
+        "explanation": "Sono le cinque e quindici or sono le cinque e un quarto → 5:15.",
+    },
+    {
+        "time": "5:30",
+        "correct": "Sono le cinque e mezza",
+        "explanation": "Sono le cinque e trenta or sono le cinque e mezza → 5:30.",
+    },
+    {
+        "time": "5:45",
+        "correct": "Sono le sei meno un quarto",
+        "explanation": "Sono le cinque e quarantacinque or sono le sei meno un quarto → 5:45.",
+    },
+    {
+        "time": "3:00",
+        "correct": "Sono le tre",
+        "explanation": "Sono le tre → it is three o'clock.",
+    },
+    {
+        "time": "10:00",
+        "correct": "Sono le dieci",
+        "explanation": "Sono le dieci → it is ten o'clock.",
+    },
+]
+
+TIME_OPTIONS = ["È l'una", "Sono le due", "È mezzogiorno", "È mezzanotte", "Sono le cinque e un quarto", "Sono le cinque e mezza", "Sono le sei meno un quarto", "Sono le tre", "Sono le dieci"]
@@ -0,0 +1,64 @@
+"""Verb lexicon for the generated conjugation drills (see ``data/conjugation.py``).
+
+``english`` is the bare infinitive and ``english_past`` the simple past; only
+the first word is inflected ("have to" → "has to"). ``participle`` is needed
+only when it is irregular and ``isc`` marks -ire verbs like finire (finisco).
+"""
+
+VERBS = [
+    # Irregular (forms come from the override table in data/conjugation.py)
+    {"infinitive": "essere", "english": "be", "english_past": "was", "auxiliary": "essere", "participle": "stato"},
+    {"infinitive": "avere", "english": "have", "english_past": "had", "auxiliary": "avere"},
+    {"infinitive": "stare", "english": "stay", "english_past": "stayed", "auxiliary": "essere"},
+    {"infinitive": "andare", "english": "go", "english_past": "went", "auxiliary": "essere"},
+    {"infinitive": "fare", "english": "do", "english_past": "did", "auxiliary": "avere", "participle": "fatto"},
+    {"infinitive": "dare", "english": "give", "english_past": "gave", "auxiliary": "avere"},
+    {"infinitive": "dire", "english": "say", "english_past": "said", "auxiliary": "avere", "participle": "detto"},
+    {"infinitive": "venire", "english": "come", "english_past": "came", "auxiliary": "essere", "participle": "venuto"},
+    {"infinitive": "volere", "english": "want", "english_past": "wanted", "auxiliary": "avere"},
+    {"infinitive": "potere", "english": "be able to", "english_past": "was able to", "auxiliary": "avere"},
+    {"infinitive": "dovere", "english": "have to", "english_past": "had to", "auxiliary": "avere"},
+    {"infinitive": "sapere", "english": "know", "english_past": "knew", "auxiliary": "avere"},
+    {"infinitive": "bere", "english": "drink", "english_past": "drank", "auxiliary": "avere"},
+    {"infinitive": "uscire", "english": "go out", "english_past": "went out", "auxiliary": "essere"},
+    {"infinitive": "tenere", "english": "keep", "english_past": "kept", "auxiliary": "avere"},
+    {"infinitive": "rimanere", "english": "remain", "english_past": "remained", "auxiliary": "essere", "participle": "rimasto"},
+    # Regular -are
+    {"infinitive": "parlare", "english": "speak", "english_past": "spoke", "auxiliary": "avere"},
+    {"infinitive": "mangiare", "english": "eat", "english_past": "ate", "auxiliary": "avere"},
+    {"infinitive": "lavorare", "english": "work", "english_past": "worked", "auxiliary": "avere"},
+    {"infinitive": "abitare", "english": "live", "english_past": "lived", "auxiliary": "avere"},
+    {"infinitive": "cercare", "english": "look for", "english_past": "looked for", "auxiliary": "avere"},
+    {"infinitive": "pagare", "english": "pay", "english_past": "paid", "auxiliary": "avere"},
+    {"infinitive": "studiare", "english": "study", "english_past": "studied", "auxiliary": "avere"},
+    {"infinitive": "cominciare", "english": "start", "english_past": "started", "auxiliary": "avere"},
+    {"infinitive": "arrivare", "english": "arrive", "english_past": "arrived", "auxiliary": "essere"},
+    {"infinitive": "comprare", "english": "buy", "english_past": "bought", "auxiliary": "avere"},
+    {"infinitive": "ascoltare", "english": "listen", "english_past": "listened", "auxiliary": "avere"},
+    {"infinitive": "aspettare", "english": "wait", "english_past": "waited", "auxiliary": "avere"},
+    {"infinitive": "giocare", "english": "play", "english_past": "played", "auxiliary": "avere"},
+    {"infinitive": "tornare", "english": "come back", "english_past": "came back", "auxiliary": "essere"},
+    # Regular -ere
+    {"infinitive": "credere", "english": "believe", "english_past": "believed", "auxiliary": "avere"},
+    {"infinitive": "vendere", "english": "sell", "english_past": "sold", "auxiliary": "avere"},
+    {"infinitive": "ripetere", "english": "repeat", "english_past": "repeated", "auxiliary": "avere"},
+    {"infinitive": "vedere", "english": "see", "english_past": "saw", "auxiliary": "avere", "participle": "visto"},
+    {"infinitive": "prendere", "english": "take", "english_past": "took", "auxiliary": "avere", "participle": "preso"},
+    {"infinitive": "scrivere", "english": "write", "english_past": "wrote", "auxiliary": "avere", "participle": "scritto"},
+    {"infinitive": "leggere", "english": "read", "english_past": "read", "auxiliary": "avere", "participle": "letto"},
+    {"infinitive": "mettere", "english": "put", "english_past": "put", "auxiliary": "avere", "participle": "messo"},
+    {"infinitive": "chiudere", "english": "close", "english_past": "closed", "auxiliary": "avere", "participle": "chiuso"},
+    {"infinitive": "vivere", "english": "live", "english_past": "lived", "auxiliary": "essere", "participle": "vissuto"},
+    {"infinitive": "correre", "english": "run", "english_past": "ran", "auxiliary": "avere", "participle": "corso"},
+    # Regular -ire
+    {"infinitive": "dormire", "english": "sleep", "english_past": "slept", "auxiliary": "avere"},
+    {"infinitive": "partire", "english": "leave", "english_past": "left", "auxiliary": "essere"},
+    {"infinitive": "sentire", "english": "hear", "english_past": "heard", "auxiliary": "avere"},
+    {"infinitive": "aprire", "english": "open", "english_past": "opened", "auxiliary": "avere", "participle": "aperto"},
+    {"infinitive": "offrire", "english": "offer", "english_past": "offered", "auxiliary": "avere", "participle": "offerto"},
+    {"infinitive": "finire", "english": "finish", "english_past": "finished", "auxiliary": "avere", "isc": True},
+    {"infinitive": "capire", "english": "understand", "english_past": "understood", "auxiliary": "avere", "isc": True},
+    {"infinitive": "preferire", "english": "prefer", "english_past": "preferred", "auxiliary": "avere", "isc": True},
+    {"infinitive": "pulire", "english": "clean", "english_past": "cleaned", "auxiliary": "avere", "isc": True},
+    {"infinitive": "spedire", "english": "send", "english_past": "sent", "auxiliary": "avere", "isc": True},
+]
@@ -0,0 +1,150 @@
+"""Essere, stare and avere conjugation practice."""
+
+VERB_QUESTIONS = [
+    {
+        "verb": "essere",
+        "pronoun": "io",
+        "english": "I am",
+        "correct": "sono",
+        "explanation": "io sono → I am (identity).",
+    },
+    {
+        "verb": "essere",
+        "pronoun": "tu",
+        "english": "you are",
+        "correct": "sei",
+        "explanation": "tu sei → you are.",
+    },
+    {
+        "verb": "essere",
+        "pronoun": "lui/lei",
+        "english": "he/she is",
+        "correct": "è",
+        "explanation": "lui/lei è → he or she is.",
+    },
+    {
+        "verb": "essere",
+        "pronoun": "noi",
+        "english": "we are",
+        "correct": "siamo",
+        "explanation": "noi siamo → we are.",
+    },
+    {
+        "verb": "essere",
+        "pronoun": "voi",
+        "english": "you all are",
+        "correct": "siete",
+        "explanation": "voi siete → you (plural) are.",
+    },
+    {
+        "verb": "essere",
+        "pronoun": "loro",
+        "english": "they are",
+        "correct": "sono",
+        "explanation": "loro sono → they are.",
+    },
+    {
+        "verb": "stare",
+        "pronoun": "io",
+        "english": "I am (doing)",
+        "correct": "sto",
+        "explanation": "io sto → I am doing/staying.",
+    },
+    {
+        "verb": "stare",
+        "pronoun": "tu",
+        "english": "you are (doing)",
+        "correct": "stai",
+        "explanation": "tu stai → you are doing/staying.",
+    },
+    {
+        "verb": "stare",
+        "pronoun": "lui/lei",
+        "english": "he/she is (doing)",
+        "correct": "sta",
+        "explanation": "lui/lei sta → he or she is doing/staying.",
+    },
+    {
+        "verb": "stare",
+        "pronoun": "noi",
+        "english": "we are (doing)",
+        "correct": "stiamo",
+        "explanation": "noi stiamo → we are doing/staying.",
+    },
+    {
+        "verb": "stare",
+        "pronoun": "voi",
+        "english": "you all are (doing)",
+        "correct": "state",
+        "explanation": "voi state → you all are doing/staying.",
+    },
+    {
+        "verb": "stare",
+        "pronoun": "loro",
+        "english": "they are (doing)",
+        "correct": "stanno",
+        "explanation": "loro stanno → they are doing/staying.",
+    },
+    {
+        "verb": "avere",
+        "pronoun": "io",
+        "english": "I have",
+        "correct": "ho",
+        "explanation": "io ho → I have.",
+    },
+    {
+        "verb": "avere",
+        "pronoun": "tu",
+        "english": "you have",
+        "correct": "hai",
+        "explanation": "tu hai → you have.",
+    },
+    {
+        "verb": "avere",
+        "pronoun": "lui/lei",
+        "english": "he/she has",
+        "correct": "ha",
+        "explanation": "lui/lei ha → he or she has.",
+    },
+    {
+        "verb": "avere",
+        "pronoun": "noi",
+        "english": "we have",
+        "correct": "abbiamo",
+        "explanation": "noi abbiamo → we have.",
+    },
+    {
+        "verb": "avere",
+        "pronoun": "voi",
+        "english": "you all have",
+        "correct": "avete",
+        "explanation": "voi avete → you all have.",
+    },
+    {
+        "verb": "avere",
+        "pronoun": "loro",
+        "english": "they have",
+        "correct": "hanno",
+        "explanation": "loro hanno → they have.",
+    },
+]
+
+VERB_OPTIONS = [
+    "sono",
+    "sei",
+    "è",
+    "siamo",
+    "siete",
+    "stanno",
+    "sto",
+    "stai",
+    "sta",
+    "stiamo",
+    "state",
+    "ho",
+    "hai",
+    "ha",
+    "abbiamo",
+    "avete",
+    "hanno",
+]
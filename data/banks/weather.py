@@ -0,0 +1,51 @@
+"""Weather expressions."""
+
+WEATHER_QUESTIONS = [
+    {
+        "english": "It's sunny",
+        "correct": "C'è il sole",
+        "explanation": "C'è il sole or è soleggiato → it's sunny.",
+    },
+    {
+        "english": "It's hot",
+        "correct": "Fa caldo",
+        "explanation": "Fa caldo → it's hot.",
+    },
+    {
+        "english": "It's cold",
+        "correct": "Fa freddo",
+        "explanation": "Fa freddo → it's cold.",
+    },
+    {
+        "english": "It's raining",
+        "correct": "Sta piovendo",
+        "explanation": "Sta piovendo → it's raining.",
+    },
+    {
+        "english": "It's snowing",
+        "correct": "Sta nevicando",
+        "explanation": "Sta nevicando → it's snowing.",
+    },
+    {
+        "english": "It's foggy",
+        "correct": "C'è la nebbia",
+        "explanation": "C'è la nebbia → it's foggy.",
+    },
+    {
+        "english": "It's windy",
+        "correct": "C'è vento",
+        "explanation": "C'è vento → it's windy.",
+    },
+    {
+        "english": "It's cloudy",
+        "correct": "È nuvoloso",
+        "explanation": "È nuvoloso → it's cloudy.",
+    },
+    {
+        "english": "It's chilly",
+        "correct": "Fa fresco",
+        "explanation": "Fa fresco → it's chilly/cool.",
+    },
+]
+
+WEATHER_OPTIONS = ["C'è il sole", "Fa caldo", "Fa freddo", "Sta piovendo", "Sta nevicando", "C'è la nebbia", "C'è vento", "È nuvoloso", "Fa fresco", "Sta grandinando"]
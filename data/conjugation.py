@@ -0,0 +1,326 @@
+"""
+Verb conjugation for regular -are, -ere and -ire verbs plus an irregular table.
+
+Every verb in the lexicon (``data.VERBS``) is conjugated once into a flat
+tuple of forms indexed by ``(verb, tense, person)``; drills, answer options
+and the generated reference section are all lookups into it. The table is
+rebuilt only when a content reload publishes a new lexicon.
+
+Regular rules cover the usual spelling changes: -care/-gare keep the hard
+sound (cerchi, pagherò), -iare drops the stem's i before another i (mangi,
+studiamo, mangerò) and -ire verbs marked ``isc`` insert -isc- (finisco).
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from functools import lru_cache
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+import data
+
+TENSES = ("presente", "imperfetto", "futuro", "passato prossimo")
+PERSONS = ("io", "tu", "lui/lei", "noi", "voi", "loro")
+ENGLISH_SUBJECTS = ("I", "you", "he/she", "we", "you all", "they")
+FORMS_PER_VERB = len(TENSES) * len(PERSONS)
+
+_PRESENT_ENDINGS = {
+    "are": ("o", "i", "a", "iamo", "ate", "ano"),
+    "ere": ("o", "i", "e", "iamo", "ete", "ono"),
+    "ire": ("o", "i", "e", "iamo", "ite", "ono"),
+}
+_ISC_ENDINGS = ("isco", "isci", "isce", "iamo", "ite", "iscono")
+_IMPERFECT_ENDINGS = ("vo", "vi", "va", "vamo", "vate", "vano")
+_FUTURE_ENDINGS = ("ò", "ai", "à", "emo", "ete", "anno")
+_PARTICIPLE_ENDINGS = {"are": "ato", "ere": "uto", "ire": "ito"}
+
+# Overrides for irregular verbs; anything missing follows the regular rules
+IRREGULAR: dict[str, dict[str, Any]] = {
+    "essere": {
+        "presente": ("sono", "sei", "è", "siamo", "siete", "sono"),
+        "imperfetto": ("ero", "eri", "era", "eravamo", "eravate", "erano"),
+        "future_stem": "sar",
+    },
+    "avere": {"presente": ("ho", "hai", "ha", "abbiamo", "avete", "hanno"), "future_stem": "avr"},
+    "stare": {"presente": ("sto", "stai", "sta", "stiamo", "state", "stanno"), "future_stem": "star"},
+    "andare": {"presente": ("vado", "vai", "va", "andiamo", "andate", "vanno"), "future_stem": "andr"},
+    "fare": {
+        "presente": ("faccio", "fai", "fa", "facciamo", "fate", "fanno"),
+        "imperfect_stem": "face",
+        "future_stem": "far",
+    },
+    "dare": {"presente": ("do", "dai", "dà", "diamo", "date", "danno"), "future_stem": "dar"},
+    "dire": {
+        "presente": ("dico", "dici", "dice", "diciamo", "dite", "dicono"),
+        "imperfect_stem": "dice",
+    },
+    "venire": {
+        "presente": ("vengo", "vieni", "viene", "veniamo", "venite", "vengono"),
+        "future_stem": "verr",
+    },
+    "volere": {
+        "presente": ("voglio", "vuoi", "vuole", "vogliamo", "volete", "vogliono"),
+        "future_stem": "vorr",
+    },
+    "potere": {
+        "presente": ("posso", "puoi", "può", "possiamo", "potete", "possono"),
+        "future_stem": "potr",
+    },
+    "dovere": {
+        "presente": ("devo", "devi", "deve", "dobbiamo", "dovete", "devono"),
+        "future_stem": "dovr",
+    },
+    "sapere": {"presente": ("so", "sai", "sa", "sappiamo", "sapete", "sanno"), "future_stem": "sapr"},
+    "bere": {
+        "presente": ("bevo", "bevi", "beve", "beviamo", "bevete", "bevono"),
+        "imperfect_stem": "beve",
+        "future_stem": "berr",
+        "participle": "bevuto",
+    },
+    "uscire": {"presente": ("esco", "esci", "esce", "usciamo", "uscite", "escono")},
+    "tenere": {
+        "presente": ("tengo", "tieni", "tiene", "teniamo", "tenete", "tengono"),
+        "future_stem": "terr",
+    },
+    "rimanere": {
+        "presente": ("rimango", "rimani", "rimane", "rimaniamo", "rimanete", "rimangono"),
+        "future_stem": "rimarr",
+    },
+    "vedere": {"future_stem": "vedr"},
+    "vivere": {"future_stem": "vivr"},
+}
+
+_ENGLISH_BE = (("am", "are", "is", "are", "are", "are"), ("was", "were", "was", "were", "were", "were"))
+
+
+def _flag(value: Any) -> bool:
+    # Content files deliver booleans as strings
+    return value is True or str(value).strip().lower() in ("1", "true", "yes")
+
+
+def _present(infinitive: str, isc: bool) -> tuple[str, ...]:
+    stem, group = infinitive[:-3], infinitive[-3:]
+    if group == "ire" and isc:
+        return tuple(stem + ending for ending in _ISC_ENDINGS)
+    forms = []
+    for ending in _PRESENT_ENDINGS[group]:
+        if ending.startswith("i") and stem.endswith("i"):
+            forms.append(stem + ending[1:])
+        elif ending.startswith(("i", "e")) and stem.endswith(("c", "g")) and group == "are":
+            forms.append(stem + "h" + ending)
+        else:
+            forms.append(stem + ending)
+    return tuple(forms)
+
+
+def _future_stem(infinitive: str) -> str:
+    stem, group = infinitive[:-3], infinitive[-3:]
+    if group != "are":
+        return infinitive[:-1]
+    if stem.endswith(("c", "g")):
+        return stem + "her"
+    if stem.endswith(("ci", "gi")):
+        return stem[:-1] + "er"
+    return stem + "er"
+
+
+def _participle(entry: Mapping[str, Any], overrides: Mapping[str, Any]) -> str:
+    infinitive = entry["infinitive"]
+    return entry.get("participle") or overrides.get("participle") or infinitive[:-3] + _PARTICIPLE_ENDINGS[infinitive[-3:]]
+
+
+def conjugate(entry: Mapping[str, Any]) -> tuple[str, ...]:
+    """Return the ``len(TENSES) * len(PERSONS)`` forms of one lexicon entry, tense by tense."""
+    infinitive = entry["infinitive"]
+    overrides = IRREGULAR.get(infinitive, {})
+
+    present = overrides.get("presente") or _present(infinitive, _flag(entry.get("isc")))
+    imperfect_stem = overrides.get("imperfect_stem", infinitive[:-2])
+    imperfect = overrides.get("imperfetto") or tuple(imperfect_stem + ending for ending in _IMPERFECT_ENDINGS)
+    future_stem = overrides.get("future_stem") or _future_stem(infinitive)
+    future = tuple(future_stem + ending for ending in _FUTURE_ENDINGS)
+
+    participle = _participle(entry, overrides)
+    if entry.get("auxiliary") == "essere":
+        # Masculine agreement with the subject: sono andato, siamo andati
+        auxiliary = IRREGULAR["essere"]["presente"]
+        participles = (participle,) * 3 + (participle[:-1] + "i",) * 3
+    else:
+        auxiliary = IRREGULAR["avere"]["presente"]
+        participles = (participle,) * 6
+    perfect = tuple(f"{aux} {part}" for aux, part in zip(auxiliary, participles))
+    return (*present, *imperfect, *future, *perfect)
+
+
+def _feminine(form: str) -> str:
+    """sono andato → sono andata, siamo andati → siamo andate."""
+    head, _, participle = form.rpartition(" ")
+    return f"{head} {participle[:-1]}{'a' if participle.endswith('o') else 'e'}"
+
+
+class ConjugationTable:
+    """
+    Conjugated forms of a whole lexicon in one flat tuple.
+
+    Parameters
+    ----------
+    verbs:
+        Lexicon entries with at least ``infinitive``, ``english``,
+        ``english_past`` and ``auxiliary``.
+    """
+
+    def __init__(self, verbs: Sequence[Mapping[str, Any]]) -> None:
+        self.source = verbs
+        self.verbs = tuple(verbs)
+        self.index = {entry["infinitive"]: position for position, entry in enumerate(self.verbs)}
+        self.forms = tuple(form for entry in self.verbs for form in conjugate(entry))
+        # Feminine passato prossimo of essere verbs (sono andata, siamo andate); the table is masculine
+        self.feminine_forms = tuple(
+            dict.fromkeys(
+                _feminine(form)
+                for entry in self.verbs
+                if entry.get("auxiliary") == "essere"
+                for form in self.tense_forms(entry["infinitive"], "passato prossimo")
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.forms)
+
+    def _offset(self, verb: str, tense: str, person: str) -> int:
+        return self.index[verb] * FORMS_PER_VERB + TENSES.index(tense) * len(PERSONS) + PERSONS.index(person)
+
+    def form(self, verb: str, tense: str, person: str) -> str:
+        return self.forms[self._offset(verb, tense, person)]
+
+    def tense_forms(self, verb: str, tense: str) -> tuple[str, ...]:
+        start = self._offset(verb, tense, PERSONS[0])
+        return self.forms[start : start + len(PERSONS)]
+
+    def accepted(self, verb: str, tense: str, person: str) -> tuple[str, ...]:
+        """Every right answer: the table's form plus, for essere verbs, the feminine agreement."""
+        correct = self.form(verb, tense, person)
+        if tense == "passato prossimo" and self.verbs[self.index[verb]].get("auxiliary") == "essere":
+            return correct, _feminine(correct)
+        return (correct,)
+
+    def options(self, verb: str, tense: str, person: str, count: int = 4, rng: Optional[random.Random] = None) -> list[str]:
+        """The correct form plus distractors from the same verb: other persons, then other tenses."""
+        rng = rng or random
+        correct = self.form(verb, tense, person)
+        same_tense = [form for form in dict.fromkeys(self.tense_forms(verb, tense)) if form != correct]
+        other_tenses = [
+            form
+            for form in dict.fromkeys(self.form(verb, other, person) for other in TENSES if other != tense)
+            if form != correct and form not in same_tense
+        ]
+        distractors = rng.sample(same_tense, min(count - 2, len(same_tense)))
+        pool = other_tenses + [form for form in same_tense if form not in distractors]
+        distractors += rng.sample(pool, min(count - 1 - len(distractors), len(pool)))
+        options = [correct, *distractors]
+        rng.shuffle(options)
+        return options
+
+
+_table: Optional[ConjugationTable] = None
+_table_lock = threading.Lock()
+
+
+def table() -> ConjugationTable:
+    """Return the table for the live lexicon, rebuilding it after a content reload."""
+    global _table
+    verbs = data.VERBS
+    current = _table
+    # Each snapshot hands out one tuple per bank, so identity tells whether the lexicon changed
+    if current is None or current.source is not verbs:
+        with _table_lock:
+            if _table is None or _table.source is not verbs:
+                _table = ConjugationTable(verbs)
+            current = _table
+    return current
+
+
+def _inflect_english(phrase: str, person: int, past: bool) -> str:
+    head, _, rest = phrase.partition(" ")
+    if head == "be":
+        head = _ENGLISH_BE[past][person]
+    elif head == "was":
+        head = _ENGLISH_BE[True][person]
+    elif person == 2 and not past:
+        if head == "have":
+            head = "has"
+        elif head.endswith(("s", "sh", "ch", "x", "o")):
+            head += "es"
+        elif head.endswith("y") and head[-2:-1] not in "aeiou":
+            head = head[:-1] + "ies"
+        else:
+            head += "s"
+    return f"{head} {rest}".strip()
+
+
+def english(entry: Mapping[str, Any], tense: str, person: int) -> str:
+    subject = ENGLISH_SUBJECTS[person]
+    if tense == "presente":
+        return f"{subject} {_inflect_english(entry['english'], person, past=False)}"
+    if tense == "imperfetto":
+        return f"{subject} used to {entry['english']}"
+    if tense == "futuro":
+        return f"{subject} will {entry['english']}"
+    return f"{subject} {_inflect_english(entry['english_past'], person, past=True)}"
+
+
+def verb_questions(rng: Optional[random.Random] = None) -> Iterator[dict[str, Any]]:
+    """Yield conjugation drills forever, each with its own answer options."""
+    rng = rng or random.Random()
+    while True:
+        conjugations = table()
+        if not conjugations.forms:
+            return
+        offset = rng.randrange(len(conjugations))
+        verb_position, rest = divmod(offset, FORMS_PER_VERB)
+        tense_position, person_position = divmod(rest, len(PERSONS))
+        entry = conjugations.verbs[verb_position]
+        tense, person = TENSES[tense_position], PERSONS[person_position]
+        correct = conjugations.forms[offset]
+        yield {
+            "verb": entry["infinitive"],
+            "tense": tense,
+            "pronoun": person,
+            "english": english(entry, tense, person_position),
+            "correct": correct,
+            "accepted": conjugations.accepted(entry["infinitive"], tense, person),
+            "options": conjugations.options(entry["infinitive"], tense, person, rng=rng),
+            "explanation": f"{entry['infinitive']}, {tense}: {person} {correct} → {english(entry, tense, person_position)}.",
+        }
+
+
+@lru_cache(maxsize=4)
+def _reference_section(conjugations: ConjugationTable) -> Mapping[str, str]:
+    lines = [
+        "Generated from the verb lexicon: the four most common indicative tenses for every verb.",
+        "Order: io, tu, lui/lei, noi, voi, loro.",
+    ]
+    for entry in sorted(conjugations.verbs, key=lambda entry: entry["infinitive"]):
+        verb = entry["infinitive"]
+        irregular = " • irregular" if verb in IRREGULAR else ""
+        lines += ["", f"{verb.upper()} (to {entry['english']}) • auxiliary {entry['auxiliary']}{irregular}"]
+        lines += [f"- {tense}: {', '.join(conjugations.tense_forms(verb, tense))}" for tense in TENSES]
+    return {"title": "Verb Conjugation Tables", "content": "\n".join(lines)}
+
+
+_sections: tuple[Any, Any, tuple[Any, ...]] = (None, None, ())
+
+
+def reference_sections() -> tuple[Any, ...]:
+    """``data.REFERENCE_SECTIONS`` followed by the generated conjugation tables.
+
+    The result is the same object until the sections or the lexicon change.
+    """
+    global _sections
+    sections, conjugations = data.REFERENCE_SECTIONS, table()
+    cached_sections, cached_table, combined = _sections
+    if cached_sections is not sections or cached_table is not conjugations:
+        combined = (*sections, _reference_section(conjugations))
+        _sections = (sections, conjugations, combined)
+    return combined
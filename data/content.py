@@ -0,0 +1,236 @@
+"""
+Question banks loaded from files in a content directory.
+
+A file named after a bank attribute adds items to that bank, e.g.
+``content/verb_questions.jsonl`` extends ``VERB_QUESTIONS`` and
+``content/verb_options.csv`` extends ``VERB_OPTIONS``. Supported formats:
+
+``.jsonl``
+    One JSON object (or, for option lists, one JSON string) per line.
+``.csv``
+    A header row naming the fields; option lists use a single column.
+``.json``
+    A JSON array.
+``.yaml`` / ``.yml``
+    A YAML list; needs the optional ``PyYAML`` package.
+
+Answers of external questions are added to the matching options list.
+JSONL and CSV are parsed as a stream. Every item is validated against the
+fields its view reads (:data:`SCHEMAS`) and invalid items are skipped with a
+warning naming the file and line. Each file's validated items are cached in
+``CONTENT_CACHE_DIR`` together with the file's mtime, size and SHA-256, so a
+start only reparses files whose content actually changed.
+
+``CONTENT_DIR`` (default ``content/`` next to this package) and
+``CONTENT_CACHE_DIR`` (default ``.content_cache/``) are read from the
+environment.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+try:
+    import yaml
+except ImportError:  # optional dependency
+    yaml = None
+
+logger = logging.getLogger(__name__)
+
+_ROOT = Path(__file__).resolve().parent.parent
+CONTENT_DIR = Path(os.getenv("CONTENT_DIR", _ROOT / "content"))
+CACHE_DIR = Path(os.getenv("CONTENT_CACHE_DIR", _ROOT / ".content_cache"))
+CACHE_FORMAT = 1
+
+EXTENSIONS = (".jsonl", ".csv", ".json", ".yaml", ".yml")
+
+# Any one of these keys can serve as a generic exercise's prompt
+_PROMPT_KEYS = ("question", "situation", "meaning", "time", "english", "noun_phrase")
+_GENERIC = {"required": ("correct", "explanation"), "any_of": _PROMPT_KEYS}
+
+SCHEMAS: dict[str, dict[str, tuple[str, ...]]] = {
+    "ARTICLE_QUESTIONS": {"required": ("english", "italian", "number", "gender", "correct", "explanation")},
+    "VERB_QUESTIONS": {"required": ("verb", "pronoun", "english", "correct", "explanation")},
+    "PREPOSITION_QUESTIONS": {"required": ("preposition", "article_phrase", "result", "english", "explanation")},
+    "REFERENCE_SECTIONS": {"required": ("title", "content")},
+    "NOUNS": {"required": ("lemma", "gender", "plural", "english", "english_plural")},
+    "VERBS": {"required": ("infinitive", "english", "english_past", "auxiliary")},
+    "BODY_QUESTIONS": _GENERIC,
+    "CLOTHING_QUESTIONS": _GENERIC,
+    "COLOR_QUESTIONS": _GENERIC,
+    "DAY_MONTH_QUESTIONS": _GENERIC,
+    "FAMILY_QUESTIONS": _GENERIC,
+    "GREETING_QUESTIONS": _GENERIC,
+    "PIACERE_QUESTIONS": _GENERIC,
+    "POSSESSIVE_QUESTIONS": _GENERIC,
+    "PRONUNCIATION_QUESTIONS": _GENERIC,
+    "QUESTION_WORD_QUESTIONS": _GENERIC,
+    "TIME_QUESTIONS": _GENERIC,
+    "WEATHER_QUESTIONS": _GENERIC,
+}
+
+
+class ContentError(ValueError):
+    """An item in a content file does not match its bank's schema."""
+
+
+def validate_item(bank: str, item: Any) -> Any:
+    """Return ``item`` in its canonical form or raise :class:`ContentError`."""
+    if bank.endswith("_OPTIONS"):
+        if isinstance(item, dict) and len(item) == 1:
+            (item,) = item.values()
+        if not isinstance(item, str) or not item.strip():
+            raise ContentError(f"expected a non-empty option string, got {item!r:.60}")
+        return item.strip()
+
+    if not isinstance(item, dict):
+        raise ContentError(f"expected an object, got {type(item).__name__}")
+    schema = SCHEMAS.get(bank, _GENERIC)
+    missing = [key for key in schema.get("required", ()) if not item.get(key)]
+    if missing:
+        raise ContentError(f"missing {', '.join(missing)}")
+    any_of = schema.get("any_of")
+    if any_of and not any(item.get(key) for key in any_of):
+        raise ContentError(f"needs one of {', '.join(any_of)}")
+    return {str(key): value.strip() if isinstance(value, str) else value for key, value in item.items() if value not in (None, "")}
+
+
+def _read_items(path: Path) -> Iterator[tuple[int, Any]]:
+    """Yield ``(line_or_index, raw_item)`` from a content file."""
+    suffix = path.suffix.lower()
+    with path.open(encoding="utf-8", newline="") as handle:
+        if suffix == ".jsonl":
+            for number, line in enumerate(handle, 1):
+                if line.strip():
+                    yield number, json.loads(line)
+        elif suffix == ".csv":
+            # Line 1 is the header
+            yield from enumerate(csv.DictReader(handle), 2)
+        elif suffix == ".json":
+            yield from enumerate(json.load(handle), 1)
+        elif yaml is None:
+            raise ContentError("YAML content needs PyYAML: pip install pyyaml")
+        else:
+            yield from enumerate(yaml.safe_load(handle) or [], 1)
+
+
+def compile_file(bank: str, path: Path) -> list[Any]:
+    """Parse and validate one file, skipping (and logging) invalid items."""
+    items: list[Any] = []
+    for position, raw in _read_items(path):
+        try:
+            items.append(validate_item(bank, raw))
+        except ContentError as exc:
+            logger.warning("%s:%d: skipped item for %s: %s", path, position, bank, exc)
+    return items
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CompiledCache:
+    """
+    On-disk cache of compiled content files.
+
+    An entry is reused without reading the file when its mtime and size are
+    unchanged, and after rehashing when only the mtime moved (a ``touch`` or
+    a checkout).
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR) -> None:
+        self.directory = directory
+
+    def _entry_path(self, path: Path) -> Path:
+        return self.directory / (hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest() + ".pickle")
+
+    def _read(self, entry_path: Path) -> Optional[dict[str, Any]]:
+        try:
+            with entry_path.open("rb") as handle:
+                entry = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        return entry if isinstance(entry, dict) and entry.get("format") == CACHE_FORMAT else None
+
+    def _write(self, entry_path: Path, entry: dict[str, Any]) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temporary = entry_path.with_suffix(".tmp")
+            with temporary.open("wb") as handle:
+                pickle.dump(entry, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, entry_path)
+        except OSError:
+            logger.warning("Could not write content cache %s", entry_path, exc_info=True)
+
+    def load(self, bank: str, path: Path) -> list[Any]:
+        stat = path.stat()
+        entry_path = self._entry_path(path)
+        entry = self._read(entry_path)
+        if entry is not None and entry["bank"] == bank:
+            if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                return entry["items"]
+            digest = _file_hash(path)
+            if entry["sha256"] == digest:
+                entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                self._write(entry_path, entry)
+                return entry["items"]
+        else:
+            digest = _file_hash(path)
+
+        items = compile_file(bank, path)
+        self._write(
+            entry_path,
+            {
+                "format": CACHE_FORMAT,
+                "bank": bank,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": digest,
+                "items": items,
+            },
+        )
+        logger.info("Compiled %d items for %s from %s", len(items), bank, path)
+        return items
+
+
+CACHE = CompiledCache()
+
+
+def content_files(bank: str, directory: Path = CONTENT_DIR) -> list[Path]:
+    """Return the content files for ``bank`` in a stable order."""
+    stem = bank.lower()
+    return [directory / f"{stem}{suffix}" for suffix in EXTENSIONS if (directory / f"{stem}{suffix}").is_file()]
+
+
+def external_items(bank: str, directory: Path = CONTENT_DIR, cache: CompiledCache = CACHE) -> list[Any]:
+    """Return the validated items the content directory adds to ``bank``."""
+    items: list[Any] = []
+    for path in content_files(bank, directory):
+        try:
+            items.extend(cache.load(bank, path))
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not load %s for %s: %s", path, bank, exc)
+    return items
+
+
+def extend_bank(bank: str, builtin: list[Any], directory: Path = CONTENT_DIR) -> list[Any]:
+    """Return the built-in bank followed by its external items, without duplicate options."""
+    extra = external_items(bank, directory)
+    if bank.endswith("_OPTIONS"):
+        # Answers to external questions must be selectable even if no options file lists them
+        questions = bank[: -len("_OPTIONS")] + "_QUESTIONS"
+        extra += [item["correct"] for item in external_items(questions, directory) if isinstance(item.get("correct"), str)]
+        seen = set(builtin)
+        extra = [option for option in extra if not (option in seen or seen.add(option))]
+    return builtin + extra if extra else builtin
@@ -0,0 +1,163 @@
+"""
+Definite articles and articulated prepositions derived from a noun lexicon.
+
+Implements the rules from the "Articles" and "Prepositions + Articles"
+reference sections:
+
+* masculine singular takes **lo** before s + consonant, z, gn, ps, pn, x and y,
+  **l'** before a vowel (or h + vowel) and **il** otherwise; the plurals are
+  **gli** and **i**;
+* feminine singular takes **l'** before a vowel and **la** otherwise; the
+  plural is always **le**;
+* di, a, da, in and su fuse with the article (di + il = del, in + gli =
+  negli, su + l' = sull', ...).
+
+:func:`article_questions` and :func:`preposition_questions` are endless
+generators of items in the same shape as ``ARTICLE_QUESTIONS`` and
+``PREPOSITION_QUESTIONS``; each item is built when it is drawn, so only the
+lexicon (``data.NOUNS``) is held in memory. Rule lookups are memoized.
+"""
+
+from __future__ import annotations
+
+import random
+import unicodedata
+from functools import lru_cache
+from typing import Iterator, Mapping, Optional
+
+import data
+
+VOWELS = frozenset("aeiou")
+LO_PREFIXES = ("gn", "ps", "pn", "x", "y", "z")
+
+ARTICLE_RULES = {
+    ("masculine", "il"): "standard masculine singular before most consonants",
+    ("masculine", "lo"): "masculine singular before s + consonant, z, gn, ps, x or y",
+    ("masculine", "l'"): "masculine singular before a vowel",
+    ("masculine", "i"): "plural of il",
+    ("masculine", "gli"): "plural of lo and l'",
+    ("feminine", "la"): "standard feminine singular before a consonant",
+    ("feminine", "l'"): "feminine singular before a vowel",
+    ("feminine", "le"): "feminine plural for every noun",
+}
+
+PREPOSITIONS = ("di", "a", "da", "in", "su")
+PREPOSITION_ENGLISH = {"di": "of", "a": "to/at", "da": "from", "in": "in", "su": "on"}
+_PREPOSITION_STEMS = {"di": "de", "a": "a", "da": "da", "in": "ne", "su": "su"}
+_ARTICLE_ENDINGS = {"il": "l", "lo": "llo", "la": "lla", "l'": "ll'", "i": "i", "gli": "gli", "le": "lle"}
+
+
+def _plain(letter: str) -> str:
+    """Strip accents so à, è, ì... count as vowels."""
+    return unicodedata.normalize("NFD", letter)[0].lower()
+
+
+def _starts_with_vowel(word: str) -> bool:
+    first = _plain(word[0])
+    if first == "h" and len(word) > 1:
+        first = _plain(word[1])
+    return first in VOWELS
+
+
+def _takes_lo(word: str) -> bool:
+    lowered = word.lower()
+    if lowered.startswith(LO_PREFIXES):
+        return True
+    return lowered[0] == "s" and len(lowered) > 1 and _plain(lowered[1]) not in VOWELS
+
+
+@lru_cache(maxsize=4096)
+def definite_article(word: str, gender: str, number: str) -> str:
+    """Return the definite article for ``word`` (the form it precedes)."""
+    if gender == "feminine":
+        if number == "plural":
+            return "le"
+        return "l'" if _starts_with_vowel(word) else "la"
+    special = _starts_with_vowel(word) or _takes_lo(word)
+    if number == "plural":
+        return "gli" if special else "i"
+    if _starts_with_vowel(word):
+        return "l'"
+    return "lo" if special else "il"
+
+
+def with_article(article: str, word: str) -> str:
+    return f"{article}{word}" if article.endswith("'") else f"{article} {word}"
+
+
+@lru_cache(maxsize=None)
+def fusion_table() -> Mapping[tuple[str, str], str]:
+    """Every ``(preposition, article) -> articulated preposition`` pair."""
+    return {
+        (preposition, article): _PREPOSITION_STEMS[preposition] + ending
+        for preposition in PREPOSITIONS
+        for article, ending in _ARTICLE_ENDINGS.items()
+    }
+
+
+def articulate(preposition: str, article: str) -> str:
+    return fusion_table()[(preposition, article)]
+
+
+def split_article_phrase(phrase: str) -> Optional[tuple[str, str]]:
+    """Split ``"la polizia"`` or ``"l'acqua"`` into article and rest, if it starts with one."""
+    lowered = phrase.lower()
+    if lowered.startswith("l'"):
+        return "l'", phrase[2:]
+    article, _, rest = phrase.partition(" ")
+    if article.lower() in _ARTICLE_ENDINGS and rest:
+        return article.lower(), rest
+    return None
+
+
+def combinations(article_phrase: str) -> list[str]:
+    """Return ``article_phrase`` fused with every preposition, e.g. for answer options."""
+    parts = split_article_phrase(article_phrase)
+    if parts is None:
+        return []
+    article, rest = parts
+    return [with_article(articulate(preposition, article), rest) for preposition in PREPOSITIONS]
+
+
+def _inflect(noun: Mapping[str, str], number: str) -> tuple[str, str]:
+    if number == "plural":
+        return noun["plural"], noun["english_plural"]
+    return noun["lemma"], noun["english"]
+
+
+def article_questions(rng: Optional[random.Random] = None) -> Iterator[dict[str, str]]:
+    """Yield article drills forever, drawn at random from the current lexicon."""
+    rng = rng or random.Random()
+    while True:
+        noun = rng.choice(data.NOUNS)
+        number = rng.choice(("singular", "plural"))
+        italian, english = _inflect(noun, number)
+        article = definite_article(italian, noun["gender"], number)
+        phrase = with_article(article, italian)
+        yield {
+            "english": f"the {english}",
+            "italian": italian,
+            "number": number,
+            "gender": noun["gender"],
+            "correct": article.upper(),
+            "explanation": f"{phrase[0].upper()}{phrase[1:]} → {ARTICLE_RULES[(noun['gender'], article)]}.",
+        }
+
+
+def preposition_questions(rng: Optional[random.Random] = None) -> Iterator[dict[str, str]]:
+    """Yield articulated-preposition drills forever, drawn at random from the current lexicon."""
+    rng = rng or random.Random()
+    while True:
+        noun = rng.choice(data.NOUNS)
+        number = rng.choice(("singular", "plural"))
+        preposition = rng.choice(PREPOSITIONS)
+        italian, english = _inflect(noun, number)
+        article = definite_article(italian, noun["gender"], number)
+        fused = articulate(preposition, article)
+        yield {
+            "preposition": preposition,
+            "article_phrase": with_article(article, italian),
+            "result": with_article(fused, italian),
+            "english": f"{PREPOSITION_ENGLISH[preposition]} the {english}",
+            "explanation": f"{preposition} + {article} = {fused} → {with_article(fused, italian)}.",
+        }
@@ -0,0 +1,167 @@
+"""
+Italian number words and clock phrases, generated on demand.
+
+:func:`number_to_words` spells any integer from 0 up to a billion as Italian
+writes it (2026 → duemilaventisei, 23 → ventitré); the pieces below a
+thousand are memoized, so composing large numbers is a few cache lookups.
+:func:`clock_phrase` says a 24-hour time the way it is spoken (17:45 → Sono
+le sei meno un quarto, 13:20 → È l'una e venti).
+
+:func:`time_questions` and :func:`number_questions` are endless generators of
+items for ``GenericExerciseView``; each item carries its own ``options`` so
+no bank has to list every answer.
+"""
+
+from __future__ import annotations
+
+import random
+from functools import lru_cache
+from typing import Iterator, Optional
+
+UNITS = (
+    "zero", "uno", "due", "tre", "quattro", "cinque", "sei", "sette", "otto", "nove",
+    "dieci", "undici", "dodici", "tredici", "quattordici", "quindici", "sedici",
+    "diciassette", "diciotto", "diciannove",
+)
+TENS = ("", "", "venti", "trenta", "quaranta", "cinquanta", "sessanta", "settanta", "ottanta", "novanta")
+MAX_NUMBER = 10**9
+
+_HOURS = ("mezzanotte", "l'una", "le due", "le tre", "le quattro", "le cinque", "le sei", "le sette",
+          "le otto", "le nove", "le dieci", "le undici", "mezzogiorno")
+
+
+@lru_cache(maxsize=1000)
+def _below_thousand(number: int) -> str:
+    """Words for 0 < number < 1000, without the final accent on -tre."""
+    hundreds, rest = divmod(number, 100)
+    words = "" if hundreds == 0 else "cento" if hundreds == 1 else UNITS[hundreds] + "cento"
+    if rest == 0:
+        return words
+    if rest < 20:
+        tail = UNITS[rest]
+    else:
+        tens, units = divmod(rest, 10)
+        tail = TENS[tens]
+        if units:
+            # venti + uno → ventuno, trenta + otto → trentotto
+            tail = (tail[:-1] if units in (1, 8) else tail) + UNITS[units]
+    if words and tail.startswith("ott"):
+        words = words[:-1]  # cento + ottanta → centottanta
+    return words + tail
+
+
+def _accent(words: str) -> str:
+    # A compound ending in tre is written -tré: ventitré, centotré (but tre alone, tremila)
+    head, _, last = words.rpartition(" ")
+    if last.endswith("tre") and last != "tre":
+        last = last[:-3] + "tré"
+    return f"{head} {last}" if head else last
+
+
+@lru_cache(maxsize=4096)
+def number_to_words(number: int) -> str:
+    """Spell ``number`` (0 ≤ number ≤ 1,000,000,000) in Italian."""
+    if not 0 <= number <= MAX_NUMBER:
+        raise ValueError(f"number out of range: {number}")
+    if number == 0:
+        return UNITS[0]
+    if number == MAX_NUMBER:
+        return "un miliardo"
+    millions, rest = divmod(number, 1_000_000)
+    thousands, units = divmod(rest, 1000)
+    parts = []
+    if millions:
+        parts.append("un milione" if millions == 1 else f"{_below_thousand(millions)} milioni")
+    words = ""
+    if thousands:
+        words = "mille" if thousands == 1 else _below_thousand(thousands) + "mila"
+    if units:
+        words += _below_thousand(units)
+    if words:
+        parts.append(words)
+    return _accent(" ".join(parts))
+
+
+def _hour_phrase(hour: int) -> str:
+    """``"Sono le sei"``, ``"È l'una"``, ``"È mezzogiorno"`` for a 24-hour ``hour``."""
+    name = _HOURS[hour] if hour <= 12 else _HOURS[hour - 12]
+    verb = "Sono" if name.startswith("le ") else "È"
+    return f"{verb} {name}"
+
+
+def _minute_words(minute: int) -> str:
+    return {15: "un quarto", 30: "mezza"}.get(minute) or _accent(_below_thousand(minute))
+
+
+@lru_cache(maxsize=24 * 60)
+def clock_phrase(hour: int, minute: int) -> str:
+    """Say ``hour:minute`` (24-hour clock) in Italian; from :40 on, count down to the next hour."""
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"invalid time: {hour}:{minute:02d}")
+    if minute == 0:
+        return _hour_phrase(hour)
+    if minute >= 40:
+        return f"{_hour_phrase((hour + 1) % 24)} meno {_minute_words(60 - minute)}"
+    return f"{_hour_phrase(hour)} e {_minute_words(minute)}"
+
+
+def _options(correct: str, candidates: list[str], rng: random.Random, count: int = 4) -> list[str]:
+    distractors = [candidate for candidate in dict.fromkeys(candidates) if candidate != correct]
+    options = [correct, *rng.sample(distractors, min(count - 1, len(distractors)))]
+    rng.shuffle(options)
+    return options
+
+
+def time_questions(rng: Optional[random.Random] = None) -> Iterator[dict[str, object]]:
+    """Yield clock drills forever at five-minute steps, with near-miss distractors."""
+    rng = rng or random.Random()
+    while True:
+        hour, minute = rng.randrange(24), rng.randrange(0, 60, 5)
+        correct = clock_phrase(hour, minute)
+        # Off by an hour, by a quarter, or counting the minutes the wrong way
+        near = [
+            clock_phrase((hour + 1) % 24, minute),
+            clock_phrase((hour - 1) % 24, minute),
+            clock_phrase(hour, (minute + 15) % 60),
+            clock_phrase(hour, (minute - 15) % 60),
+            clock_phrase(hour, (60 - minute) % 60),
+        ]
+        explanation = f"{hour}:{minute:02d} → {correct}."
+        if minute >= 40:
+            explanation += f" Past :40 Italians count down to the next hour ({60 - minute} minutes to go)."
+        yield {
+            "time": f"{hour}:{minute:02d}",
+            "correct": correct,
+            "options": _options(correct, near, rng),
+            "explanation": explanation,
+        }
+
+
+def _number_notes(words: str) -> str:
+    notes = []
+    if words.endswith("tré"):
+        notes.append("a final tre takes an accent")
+    if any(f"{tens[:-1]}{unit}" in words for tens in TENS[2:] for unit in ("uno", "otto")):
+        notes.append("tens drop their final vowel before uno and otto")
+    if "mila" in words:
+        notes.append("thousands are mila (mille for one thousand), written as one word")
+    return f" Note: {'; '.join(notes)}." if notes else ""
+
+
+def number_questions(rng: Optional[random.Random] = None) -> Iterator[dict[str, object]]:
+    """Yield number and year drills forever; distractors are nearby numbers spelled out."""
+    rng = rng or random.Random()
+    while True:
+        number = rng.choice((rng.randrange(100), rng.randrange(100, 1000), rng.randrange(1900, 2100), rng.randrange(1000, 100_000)))
+        correct = number_to_words(number)
+        near = [number + delta for delta in (1, -1, 10, -10, 100, -100, 1000, -1000)]
+        digits = str(number)
+        if len(digits) > 1:
+            near.append(int(digits[:-2] + digits[-1] + digits[-2]))
+        candidates = [number_to_words(candidate) for candidate in near if 0 <= candidate <= MAX_NUMBER]
+        yield {
+            "question": f"How do you write {number} in Italian?",
+            "correct": correct,
+            "options": _options(correct, candidates, rng),
+            "explanation": f"{number} → {correct}.{_number_notes(correct)}",
+        }
@@ -0,0 +1,99 @@
+"""
+Immutable, swappable snapshots of every question bank.
+
+Readers take the current :class:`Snapshot` with :func:`current` and never see
+it change: banks are frozen into tuples of read-only mappings. A content
+reload builds a complete new snapshot off to the side and publishes it with a
+single reference assignment, so a session that already picked a question
+from the old snapshot simply finishes with it, and nobody waits for the
+rebuild. Banks are still compiled lazily, on first access per snapshot.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import threading
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
+
+from data.content import extend_bank
+
+logger = logging.getLogger(__name__)
+
+
+def _freeze(bank: Iterable[Any]) -> tuple[Any, ...]:
+    return tuple(MappingProxyType(dict(item)) if isinstance(item, Mapping) else item for item in bank)
+
+
+class Snapshot:
+    """
+    Every bank at one content version.
+
+    Parameters
+    ----------
+    version:
+        Increases by one with each published reload.
+    modules:
+        Bank name to the ``data`` submodule holding its built-in items.
+    """
+
+    def __init__(self, version: int, modules: Mapping[str, str]) -> None:
+        self.version = version
+        self._modules = modules
+        self._banks: dict[str, tuple[Any, ...]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> tuple[Any, ...]:
+        bank = self._banks.get(name)
+        if bank is not None:
+            return bank
+        module_name = self._modules.get(name)
+        if module_name is None:
+            raise KeyError(name)
+        with self._lock:
+            if name not in self._banks:
+                module = importlib.import_module(f"data.{module_name}")
+                self._banks[name] = _freeze(extend_bank(name, list(getattr(module, name))))
+            return self._banks[name]
+
+    def loaded(self) -> tuple[str, ...]:
+        return tuple(self._banks)
+
+
+_current: Snapshot | None = None
+_publish_lock = threading.Lock()
+
+
+def current() -> Snapshot:
+    global _current
+    snapshot = _current
+    if snapshot is None:
+        from data import _LAZY_ATTRIBUTES
+
+        with _publish_lock:
+            if _current is None:
+                _current = Snapshot(1, _LAZY_ATTRIBUTES)
+            snapshot = _current
+    return snapshot
+
+
+def rebuild(changed_modules: Iterable[str] = ()) -> Snapshot:
+    """
+    Reload changed bank modules, compile a new snapshot and publish it.
+
+    Banks the old snapshot had already loaded are compiled before the swap,
+    so the first reader after a reload does not pay for them.
+    """
+    global _current
+    old = current()
+    for module_name in changed_modules:
+        importlib.reload(importlib.import_module(f"data.{module_name}"))
+
+    snapshot = Snapshot(old.version + 1, old._modules)
+    for name in old.loaded():
+        snapshot.get(name)
+    with _publish_lock:
+        _current = snapshot
+    logger.info("Published content snapshot %d (%d banks preloaded)", snapshot.version, len(old.loaded()))
+    return snapshot
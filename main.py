@@ -2,129 +2,127 @@ from __future__ import annotations
 
 import asyncio
 import random
+import threading
+from typing import Any, Iterator, Mapping, Optional, Sequence
 
 import flet as ft
 
+from app.answer_matching import EXACT, AnswerIndex, index_for
 from app.chat_client import ChatClient, ChatClientError, ChatMessage
+from app.content_reload import start_content_watcher
+from app.loop_monitor import start_loop_monitor
+from app.metrics import PROGRESS_SECONDS
+from app.profiling import attach_loop
+from app.session import SessionLifecycle, session_lifecycle
+from app.session_state import session_state
+from app.tracing import start_span, traced
+from app.ui_updates import batch_updates, batched, current_batch, schedule_update
 from config import OPENAI_API_KEY
-from data import (
-    ARTICLE_OPTIONS,
-    ARTICLE_QUESTIONS,
-    BODY_OPTIONS,
-    BODY_QUESTIONS,
-    CLOTHING_OPTIONS,
-    CLOTHING_QUESTIONS,
-    COLOR_OPTIONS,
-    COLOR_QUESTIONS,
-    DAY_MONTH_OPTIONS,
-    DAY_MONTH_QUESTIONS,
-    FAMILY_OPTIONS,
-    FAMILY_QUESTIONS,
-    GREETING_OPTIONS,
-    GREETING_QUESTIONS,
-    PIACERE_OPTIONS,
-    PIACERE_QUESTIONS,
-    POSSESSIVE_OPTIONS,
-    POSSESSIVE_QUESTIONS,
-    PREPOSITION_QUESTIONS,
-    PRONUNCIATION_OPTIONS,
-    PRONUNCIATION_QUESTIONS,
-    QUESTION_WORD_OPTIONS,
-    QUESTION_WORD_QUESTIONS,
-    REFERENCE_SECTIONS,
-    TIME_OPTIONS,
-    TIME_QUESTIONS,
-    VERB_OPTIONS,
-    VERB_QUESTIONS,
-    WEATHER_OPTIONS,
-    WEATHER_QUESTIONS,
-)
+import data
+from data import conjugation, morphology, numbers
 
 SIDEBAR_BG = "#1f2530"
 CARD_BG = "#151b24"
 CHAT_PANEL_BG = "#1c2230"
 ASSISTANT_BUBBLE_BG = "#1f2530"
 
+# Share of questions drawn from the rule-based generators rather than the hand-written banks
+GENERATED_SHARE = 0.6
+
+# Questions per quiz page and choices shown per question
+QUIZ_SIZE = 10
+QUIZ_CHOICES = 4
+
 
 def safe_update(*controls: ft.Control | None) -> None:
-    for control in controls:
-        if control is not None and getattr(control, "page", None):
-            control.update()
+    attached = [control for control in controls if control is not None and getattr(control, "page", None)]
+    schedule_update(*attached)
+
+
+def show_snack_bar(page: ft.Page, message: str) -> None:
+    """Show a message in the session's shared snack bar without a full page update."""
+    snack_bar = page.session.get("snack_bar")
+    if snack_bar is None:
+        snack_bar = ft.SnackBar(ft.Text(message))
+        page.session.set("snack_bar", snack_bar)
+        page.open(snack_bar)
+        return
+
+    snack_bar.content.value = message
+    snack_bar.open = True
+    safe_update(snack_bar)
 
 
+@traced("get_user_id")
 async def get_user_id(page: ft.Page) -> str:
-    """Get user ID from storage."""
+    """Get user ID from the session cache, reading storage on first use."""
     try:
-        user_id = await page.client_storage.get_async("user_id") or ""
-        return str(user_id) if user_id else ""
+        return await session_state(page).get_user_id()
     except Exception:
         return ""
 
 
 async def set_user_id(page: ft.Page, user_id: str) -> None:
-    """Save user ID to storage."""
-    try:
-        await page.client_storage.set_async("user_id", user_id)
-    except Exception:
-        pass
+    """Save user ID to the session cache; storage is written in the background."""
+    session_state(page).set_user_id(user_id)
 
 
+@traced("load_progress")
 async def load_progress(page: ft.Page, key: str) -> tuple[int, int]:
-    """Load saved progress from client storage and cloud."""
+    """Load saved progress from the session's progress blob, synced with the cloud once per session."""
     user_id = await get_user_id(page)
     
-    # Try cloud first if user_id is set
+    # Pull changes made on other devices before the first read; later reads stay local
     if user_id:
-        try:
-            from progress_api import load_progress_cloud
-            cloud_score, cloud_total = await load_progress_cloud(user_id, key)
-            if cloud_total > 0:
-                return cloud_score, cloud_total
-        except Exception:
-            pass
+        await session_state(page).sync_from_cloud(user_id)
     
-    # Fall back to local storage
     try:
-        score = await page.client_storage.get_async(f"{key}_score") or 0
-        total = await page.client_storage.get_async(f"{key}_total") or 0
-        return int(score), int(total)
+        with PROGRESS_SECONDS.time(operation="load", backend="local"), start_span("progress_store.get", key=key):
+            return await session_state(page).get_progress(key)
     except Exception:
         return 0, 0
 
 
-async def save_progress(page: ft.Page, key: str, score: int, total: int) -> None:
-    """Save progress to client storage and cloud."""
-    # Save locally first
+@traced("save_progress")
+async def save_progress(page: ft.Page, key: str, score: int, total: int, reset: bool = False) -> None:
+    """
+    Save progress to the session cache (persisted in the background) and the cloud.
+
+    Pass ``reset=True`` when the user reset the exercise, so the cloud value is
+    replaced instead of having this device's answers added to it.
+    """
+    # Update the session cache first
+    previous = (0, 0)
     try:
-        await page.client_storage.set_async(f"{key}_score", score)
-        await page.client_storage.set_async(f"{key}_total", total)
+        with PROGRESS_SECONDS.time(operation="save", backend="local"), start_span("progress_store.set", key=key):
+            previous = await session_state(page).save_progress(key, score, total)
     except Exception:
         pass
     
-    # Also save to cloud if user_id is set
+    # Queue the cloud write; the outbox sends it in the background and retries
     user_id = await get_user_id(page)
     if user_id:
         try:
-            from progress_api import save_progress_cloud
-            await save_progress_cloud(user_id, key, score, total)
+            await session_state(page).queue_cloud_save(user_id, key, score, total, base=previous, reset=reset)
         except Exception:
-            pass  # Silently fail if cloud unavailable
+            pass  # Local progress is already saved
 
 
 class ReferenceView:
     def __init__(self, page: ft.Page, chat_client: ChatClient) -> None:
         self.page = page
+        self.lifecycle = session_lifecycle(page)
         self.chat_client = chat_client
         self.selected_index = 0
         self.topic_tiles: list[ft.ListTile] = []
         self.title_text = ft.Text(
-            REFERENCE_SECTIONS[self.selected_index]["title"],
+            conjugation.reference_sections()[self.selected_index]["title"],
             weight=ft.FontWeight.BOLD,
             size=20,
             color=ft.Colors.WHITE,
         )
         self.reference_text = ft.Text(
-            REFERENCE_SECTIONS[self.selected_index]["content"],
+            conjugation.reference_sections()[self.selected_index]["content"],
             selectable=True,
             size=13,
             no_wrap=False,
@@ -137,21 +135,25 @@ class ReferenceView:
             on_click=self._on_explain_selection,
             visible=False,
         )
+        self.explain_dialog: ft.AlertDialog | None = None
+        self.selected_text_field: ft.TextField | None = None
         self.view = self._build()
 
     def _build(self) -> ft.Control:
-        self.topic_tiles = [self._build_tile(i, section["title"]) for i, section in enumerate(REFERENCE_SECTIONS)]
+        self.sections = conjugation.reference_sections()
+        self.topic_tiles = [self._build_tile(i, section["title"]) for i, section in enumerate(self.sections)]
+        self.topic_column = ft.Column(
+            controls=self.topic_tiles,
+            spacing=2,
+            scroll=ft.ScrollMode.AUTO,
+        )
 
         sidebar = ft.Container(
             content=ft.Column(
                 [
                     ft.Text("Topics", weight=ft.FontWeight.BOLD, size=16, color=ft.Colors.WHITE),
                     ft.Divider(height=1),
-                    ft.Column(
-                        controls=self.topic_tiles,
-                        spacing=2,
-                        scroll=ft.ScrollMode.AUTO,
-                    ),
+                    self.topic_column,
                 ],
                 spacing=8,
                 scroll=ft.ScrollMode.AUTO,
@@ -208,13 +210,26 @@ class ReferenceView:
             on_click=lambda _: self._select_topic(index),
         )
 
+    def _refresh_topics(self) -> None:
+        """Rebuild the topic list when a content reload replaced the sections."""
+        sections = conjugation.reference_sections()
+        if sections is self.sections:
+            return
+        self.sections = sections
+        self.topic_tiles = [self._build_tile(i, section["title"]) for i, section in enumerate(sections)]
+        self.topic_column.controls = self.topic_tiles
+        safe_update(self.topic_column)
+
+    @batched
     def _select_topic(self, index: int) -> None:
+        self._refresh_topics()
+        index = min(index, len(self.sections) - 1)
         self.selected_index = index
         for i, tile in enumerate(self.topic_tiles):
             tile.selected = i == index
-            safe_update(tile)
+        safe_update(*self.topic_tiles)
 
-        section = REFERENCE_SECTIONS[index]
+        section = self.sections[index]
         self.title_text.value = section["title"]
         self.reference_text.value = section["content"]
         safe_update(self.title_text, self.reference_text)
@@ -239,35 +254,39 @@ class ReferenceView:
         """Get ChatGPT explanation for selected text."""
         # Since Flet doesn't support getting selected text directly,
         # we'll use a dialog to let users paste the text they want explained
-        self.selected_text_field = ft.TextField(
-            multiline=True,
-            min_lines=2,
-            max_lines=5,
-            autofocus=True,
-        )
-        self.page.dialog = ft.AlertDialog(
-            title=ft.Text("Explain Italian Text"),
-            content=ft.Column(
-                [
-                    ft.Text("Paste or type the Italian text you want explained:"),
-                    self.selected_text_field,
+        if self.explain_dialog is None:
+            self.selected_text_field = ft.TextField(
+                multiline=True,
+                min_lines=2,
+                max_lines=5,
+                autofocus=True,
+            )
+            self.explain_dialog = ft.AlertDialog(
+                title=ft.Text("Explain Italian Text"),
+                content=ft.Column(
+                    [
+                        ft.Text("Paste or type the Italian text you want explained:"),
+                        self.selected_text_field,
+                    ],
+                    tight=True,
+                ),
+                actions=[
+                    ft.TextButton("Cancel", on_click=lambda _: self._close_dialog()),
+                    ft.ElevatedButton("Explain", on_click=lambda _: self.lifecycle.run_task(self._explain_text)),
                 ],
-                tight=True,
-            ),
-            actions=[
-                ft.TextButton("Cancel", on_click=lambda _: self._close_dialog()),
-                ft.ElevatedButton("Explain", on_click=lambda _: self.page.run_task(self._explain_text)),
-            ],
-        )
-        self.page.dialog.open = True
-        self.page.update()
+            )
+        else:
+            self.selected_text_field.value = ""
+        # Opening through the overlay only patches the dialog, not the whole page
+        self.page.open(self.explain_dialog)
 
     def _close_dialog(self) -> None:
         """Close the dialog."""
-        if self.page.dialog:
-            self.page.dialog.open = False
-            self.page.update()
+        if self.explain_dialog is not None and self.explain_dialog.open:
+            self.explain_dialog.open = False
+            safe_update(self.explain_dialog)
 
+    @batched
     async def _explain_text(self) -> None:
         """Get explanation from ChatGPT."""
         selected_text = self.selected_text_field.value.strip()
@@ -282,6 +301,8 @@ class ReferenceView:
         self.explanation_text.value = "Getting explanation from ChatGPT..."
         self.explanation_text.color = ft.Colors.BLUE_200
         safe_update(self.explanation_text)
+        # Send the closed dialog and loading state before waiting on the API
+        current_batch().flush()
 
         try:
             # Call ChatGPT to explain the text
@@ -310,23 +331,34 @@ class ReferenceView:
 
 
 class ArticleExerciseView:
+    # Banks are looked up per question so a content reload reaches open sessions
+    @property
+    def questions(self) -> Sequence[Mapping[str, str]]:
+        return data.ARTICLE_QUESTIONS
+
+    @property
+    def options(self) -> Sequence[str]:
+        return data.ARTICLE_OPTIONS
+
     def __init__(self, page: ft.Page) -> None:
         self.page = page
-        self.questions = ARTICLE_QUESTIONS
-        self.options = ARTICLE_OPTIONS
+        self.lifecycle = session_lifecycle(page)
         self.storage_key = "article_exercise"
+        self.generated = morphology.article_questions()
+        self._draw_lock = threading.Lock()
 
         self.current: dict[str, str] | None = None
         self.score = 0
         self.total = 0
         
         # Load saved progress
-        page.run_task(self._load_progress)
+        self.lifecycle.run_task(self._load_progress)
 
         self.prompt_text = ft.Text("", size=18, weight=ft.FontWeight.BOLD)
+        self._shown_options = self.options
         self.option_group = ft.RadioGroup(
             content=ft.Column(
-                controls=[ft.Radio(value=option, label=option) for option in self.options],
+                controls=[ft.Radio(value=option, label=option) for option in self._shown_options],
                 spacing=8,
             )
         )
@@ -364,13 +396,28 @@ class ArticleExerciseView:
 
         self._load_new_question()
 
+    # Question protocol, shared with QuizView
+    def draw_question(self) -> Mapping[str, Any]:
+        if random.random() < GENERATED_SHARE:
+            # Handlers run on executor threads and the auto-advance on the loop;
+            # a generator cannot be advanced by two of them at once
+            with self._draw_lock:
+                return next(self.generated)
+        return random.choice(self.questions)
+
+    def prompt_for(self, item: Mapping[str, Any]) -> str:
+        return f"Which article matches {item['english']}? ({item['italian']} • {item['number']} {item['gender']})"
+
+    def options_for(self, item: Mapping[str, Any]) -> Sequence[str]:
+        return self.options
+
+    def answer_for(self, item: Mapping[str, Any]) -> str:
+        return item["correct"]
+
     def _load_new_question(self) -> None:
-        self.current = random.choice(self.questions)
-        prompt = (
-            f"Which article matches {self.current['english']}? "
-            f"({self.current['italian']} • {self.current['number']} {self.current['gender']})"
-        )
-        self.prompt_text.value = prompt
+        self._refresh_options()
+        self.current = self.draw_question()
+        self.prompt_text.value = self.prompt_for(self.current)
 
         self.option_group.value = None
 
@@ -382,9 +429,11 @@ class ArticleExerciseView:
 
         self._update_score_text()
 
+    @batched
     def _on_new_question(self, _: ft.ControlEvent) -> None:
         self._load_new_question()
 
+    @batched
     def _on_check_answer(self, _: ft.ControlEvent) -> None:
         if not self.option_group.value:
             self._show_snack_bar("Select an article before checking.")
@@ -410,17 +459,19 @@ class ArticleExerciseView:
 
         self._update_score_text()
         # Save progress
-        self.page.run_task(self._save_progress)
+        self.lifecycle.run_task(self._save_progress, persist=True)
 
         # Auto-advance to next question if correct
         if is_correct:
-            self.page.run_task(self._auto_advance)
+            self.lifecycle.run_task(self._auto_advance)
 
+    @batched
     async def _auto_advance(self) -> None:
         """Auto-advance to next question after a short delay."""
         await asyncio.sleep(1.2)
         self._load_new_question()
 
+    @batched
     async def _load_progress(self) -> None:
         """Load saved progress from storage."""
         score, total = await load_progress(self.page, self.storage_key)
@@ -428,16 +479,17 @@ class ArticleExerciseView:
         self.total = total
         self._update_score_text()
 
-    async def _save_progress(self) -> None:
+    async def _save_progress(self, reset: bool = False) -> None:
         """Save current progress to storage."""
-        await save_progress(self.page, self.storage_key, self.score, self.total)
+        await save_progress(self.page, self.storage_key, self.score, self.total, reset)
 
+    @batched
     def _on_reset_progress(self, _: ft.ControlEvent) -> None:
         """Reset progress to zero."""
         self.score = 0
         self.total = 0
         self._update_score_text()
-        self.page.run_task(self._save_progress)
+        self.lifecycle.run_task(self._save_progress, True, persist=True)
         self._show_snack_bar("Progress reset!")
 
     def _update_score_text(self) -> None:
@@ -448,33 +500,51 @@ class ArticleExerciseView:
             self.score_text.value = f"Score: {self.score} / {self.total} ({percent:.0f}%)"
         safe_update(self.score_text)
 
+    def _refresh_options(self) -> None:
+        """Rebuild the choices when a content reload replaced the options list."""
+        options = self.options
+        if options is not self._shown_options:
+            self._shown_options = options
+            self.option_group.content.controls = [ft.Radio(value=option, label=option) for option in options]
+
     def _show_snack_bar(self, message: str) -> None:
-        self.page.snack_bar = ft.SnackBar(ft.Text(message))
-        self.page.snack_bar.open = True
-        self.page.update()
+        show_snack_bar(self.page, message)
 
 
 class VerbExerciseView:
+    # Banks are looked up per question so a content reload reaches open sessions
+    @property
+    def questions(self) -> Sequence[Mapping[str, str]]:
+        return data.VERB_QUESTIONS
+
+    @property
+    def options(self) -> Sequence[str]:
+        return data.VERB_OPTIONS
+
     def __init__(self, page: ft.Page) -> None:
         self.page = page
-        self.questions = VERB_QUESTIONS
-        self.options = VERB_OPTIONS
+        self.lifecycle = session_lifecycle(page)
         self.storage_key = "verb_exercise"
+        self.generated = conjugation.verb_questions()
+        self._draw_lock = threading.Lock()
 
         self.current: dict[str, str] | None = None
         self.score = 0
         self.total = 0
         
         # Load saved progress
-        page.run_task(self._load_progress)
+        self.lifecycle.run_task(self._load_progress)
 
         self.prompt_text = ft.Text("", size=18, weight=ft.FontWeight.BOLD)
+        self._shown_options = self.options
         self.option_group = ft.RadioGroup(
             content=ft.Column(
-                controls=[ft.Radio(value=option, label=option) for option in self.options],
+                controls=[ft.Radio(value=option, label=option) for option in self._shown_options],
                 spacing=8,
             )
         )
+        self.typed_mode = False
+        self.answer_field = ft.TextField(label="Type your answer", visible=False, on_submit=self._on_check_answer)
         self.feedback_text = ft.Text("", size=14)
         self.explanation_text = ft.Text("", size=13, color=ft.Colors.ON_SURFACE_VARIANT)
         self.score_text = ft.Text("Score: 0 / 0", weight=ft.FontWeight.BOLD)
@@ -484,6 +554,7 @@ class VerbExerciseView:
                 ft.ElevatedButton("Check answer", icon="check_circle", on_click=self._on_check_answer),
                 ft.OutlinedButton("New question", icon="refresh", on_click=self._on_new_question),
                 ft.OutlinedButton("Reset progress", icon="restart_alt", on_click=self._on_reset_progress),
+                ft.Switch(label="Type answers", value=False, on_change=self._on_toggle_typed),
             ],
             spacing=8,
             wrap=True,
@@ -493,13 +564,15 @@ class VerbExerciseView:
             [
                 ft.Text("Match verbs with pronouns", size=20, weight=ft.FontWeight.BOLD),
                 ft.Text(
-                    "Decide whether the sentence needs essere, stare, or avere — then pick the right conjugation.",
+                    "Decide whether the sentence needs essere, stare, or avere — then pick the right conjugation. "
+                    "Generated drills cover regular and irregular verbs across four tenses.",
                     size=14,
                     color=ft.Colors.ON_SURFACE_VARIANT,
                 ),
                 ft.Divider(),
                 self.prompt_text,
                 self.option_group,
+                self.answer_field,
                 actions,
                 self.feedback_text,
                 self.explanation_text,
@@ -513,41 +586,77 @@ class VerbExerciseView:
 
         self._load_new_question()
 
-    def _load_new_question(self) -> None:
-        self.current = random.choice(self.questions)
-        prompt = (
-            f"Select the correct form of '{self.current['verb']}' for pronoun '{self.current['pronoun']}' "
-            f"({self.current['english']})."
+    # Question protocol, shared with QuizView
+    def draw_question(self) -> Mapping[str, Any]:
+        if random.random() < GENERATED_SHARE:
+            # Handlers run on executor threads and the auto-advance on the loop;
+            # a generator cannot be advanced by two of them at once
+            with self._draw_lock:
+                return next(self.generated)
+        return random.choice(self.questions)
+
+    def prompt_for(self, item: Mapping[str, Any]) -> str:
+        tense = item.get("tense")
+        return (
+            f"Select the correct {f'{tense} form' if tense else 'form'} of '{item['verb']}' "
+            f"for pronoun '{item['pronoun']}' ({item['english']})."
         )
-        self.prompt_text.value = prompt
+
+    def options_for(self, item: Mapping[str, Any]) -> Sequence[str]:
+        # Generated drills carry their own options; hand-written ones share the bank's list
+        return item.get("options") or self.options
+
+    def answer_for(self, item: Mapping[str, Any]) -> str:
+        return item["correct"]
+
+    def _load_new_question(self) -> None:
+        self.current = self.draw_question()
+        self._refresh_options(self.options_for(self.current))
+        self.prompt_text.value = self.prompt_for(self.current)
 
         self.option_group.value = None
+        self.answer_field.value = ""
 
         self.feedback_text.value = ""
 
         self.explanation_text.value = ""
 
-        safe_update(self.prompt_text, self.option_group, self.feedback_text, self.explanation_text)
+        safe_update(self.prompt_text, self.option_group, self.answer_field, self.feedback_text, self.explanation_text)
 
         self._update_score_text()
 
+    @batched
     def _on_new_question(self, _: ft.ControlEvent) -> None:
         self._load_new_question()
 
+    @batched
     def _on_check_answer(self, _: ft.ControlEvent) -> None:
-        if not self.option_group.value:
+        assert self.current is not None
+        match = None
+        if self.typed_mode:
+            typed = (self.answer_field.value or "").strip()
+            if not typed:
+                self._show_snack_bar("Type a verb form before checking.")
+                return
+            # Every form the conjugator knows counts as a real answer, so a wrong person is not a typo
+            conjugations = conjugation.table()
+            index = index_for(self.options, conjugations.forms, conjugations.feminine_forms)
+            match = index.grade(typed, self.current["correct"], self.current.get("accepted", ()))
+            is_correct = match.accepted
+        elif not self.option_group.value:
             self._show_snack_bar("Select a verb form before checking.")
             return
-
-        assert self.current is not None
-        choice = self.option_group.value
+        else:
+            is_correct = self.option_group.value == self.current["correct"]
 
         self.total += 1
-        is_correct = choice == self.current["correct"]
 
         if is_correct:
             self.score += 1
-            self.feedback_text.value = "✔ Correct!"
+            if match is None or match.verdict == EXACT:
+                self.feedback_text.value = "✔ Correct!"
+            else:
+                self.feedback_text.value = f"✔ Correct! Watch the spelling: '{match.expected}'."
             self.feedback_text.color = ft.Colors.GREEN_400
         else:
             self.feedback_text.value = f"✘ Not quite. The correct form is '{self.current['correct']}'."
@@ -558,17 +667,19 @@ class VerbExerciseView:
 
         self._update_score_text()
         # Save progress
-        self.page.run_task(self._save_progress)
+        self.lifecycle.run_task(self._save_progress, persist=True)
 
         # Auto-advance to next question if correct
         if is_correct:
-            self.page.run_task(self._auto_advance)
+            self.lifecycle.run_task(self._auto_advance)
 
+    @batched
     async def _auto_advance(self) -> None:
         """Auto-advance to next question after a short delay."""
         await asyncio.sleep(1.2)
         self._load_new_question()
 
+    @batched
     async def _load_progress(self) -> None:
         """Load saved progress from storage."""
         score, total = await load_progress(self.page, self.storage_key)
@@ -576,16 +687,17 @@ class VerbExerciseView:
         self.total = total
         self._update_score_text()
 
-    async def _save_progress(self) -> None:
+    async def _save_progress(self, reset: bool = False) -> None:
         """Save current progress to storage."""
-        await save_progress(self.page, self.storage_key, self.score, self.total)
+        await save_progress(self.page, self.storage_key, self.score, self.total, reset)
 
+    @batched
     def _on_reset_progress(self, _: ft.ControlEvent) -> None:
         """Reset progress to zero."""
         self.score = 0
         self.total = 0
         self._update_score_text()
-        self.page.run_task(self._save_progress)
+        self.lifecycle.run_task(self._save_progress, True, persist=True)
         self._show_snack_bar("Progress reset!")
 
     def _update_score_text(self) -> None:
@@ -596,24 +708,42 @@ class VerbExerciseView:
             self.score_text.value = f"Score: {self.score} / {self.total} ({percent:.0f}%)"
         safe_update(self.score_text)
 
+    @batched
+    def _on_toggle_typed(self, e: ft.ControlEvent) -> None:
+        self.typed_mode = bool(e.control.value)
+        self.answer_field.visible = self.typed_mode
+        self.option_group.visible = not self.typed_mode
+        safe_update(self.answer_field, self.option_group)
+
+    def _refresh_options(self, options: Sequence[str]) -> None:
+        """Rebuild the choices when the question or a content reload changed them."""
+        if options is not self._shown_options:
+            self._shown_options = options
+            self.option_group.content.controls = [ft.Radio(value=option, label=option) for option in options]
+
     def _show_snack_bar(self, message: str) -> None:
-        self.page.snack_bar = ft.SnackBar(ft.Text(message))
-        self.page.snack_bar.open = True
-        self.page.update()
+        show_snack_bar(self.page, message)
 
 
 class PrepositionExerciseView:
+    # Looked up per question so a content reload reaches open sessions
+    @property
+    def questions(self) -> Sequence[Mapping[str, str]]:
+        return data.PREPOSITION_QUESTIONS
+
     def __init__(self, page: ft.Page) -> None:
         self.page = page
-        self.questions = PREPOSITION_QUESTIONS
+        self.lifecycle = session_lifecycle(page)
         self.storage_key = "preposition_exercise"
+        self.generated = morphology.preposition_questions()
+        self._draw_lock = threading.Lock()
 
         self.current: dict[str, str] | None = None
         self.score = 0
         self.total = 0
         
         # Load saved progress
-        page.run_task(self._load_progress)
+        self.lifecycle.run_task(self._load_progress)
 
         self.prompt_text = ft.Text("", size=18, weight=ft.FontWeight.BOLD)
         self.options_column = ft.Column(spacing=8)
@@ -656,21 +786,34 @@ class PrepositionExerciseView:
 
         self._load_new_question()
 
-    def _load_new_question(self) -> None:
-        self.current = random.choice(self.questions)
-        prompt = (
-            f"Combine '{self.current['preposition']}' with '{self.current['article_phrase']}' "
-            f"({self.current['english']})."
-        )
-        self.prompt_text.value = prompt
-
-        choices = {self.current["result"]}
-        while len(choices) < min(4, len(self.questions)):
-            choices.add(random.choice(self.questions)["result"])
-        options = list(choices)
+    # Question protocol, shared with QuizView
+    def draw_question(self) -> Mapping[str, Any]:
+        if random.random() < GENERATED_SHARE:
+            # Handlers run on executor threads and the auto-advance on the loop;
+            # a generator cannot be advanced by two of them at once
+            with self._draw_lock:
+                return next(self.generated)
+        return random.choice(self.questions)
+
+    def prompt_for(self, item: Mapping[str, Any]) -> str:
+        return f"Combine '{item['preposition']}' with '{item['article_phrase']}' ({item['english']})."
+
+    def options_for(self, item: Mapping[str, Any]) -> Sequence[str]:
+        # Distractors are the same phrase fused with the other prepositions
+        result = item["result"]
+        candidates = morphology.combinations(item["article_phrase"]) or [q["result"] for q in self.questions]
+        distractors = list({candidate for candidate in candidates if candidate != result})
+        options = [result, *random.sample(distractors, min(3, len(distractors)))]
         random.shuffle(options)
+        return options
 
-        self.options_column.controls = [ft.Radio(value=option, label=option) for option in options]
+    def answer_for(self, item: Mapping[str, Any]) -> str:
+        return item["result"]
+
+    def _load_new_question(self) -> None:
+        self.current = self.draw_question()
+        self.prompt_text.value = self.prompt_for(self.current)
+        self.options_column.controls = [ft.Radio(value=option, label=option) for option in self.options_for(self.current)]
         self.option_group.value = None
 
         self.feedback_text.value = ""
@@ -681,9 +824,11 @@ class PrepositionExerciseView:
 
         self._update_score_text()
 
+    @batched
     def _on_new_question(self, _: ft.ControlEvent) -> None:
         self._load_new_question()
 
+    @batched
     def _on_check_answer(self, _: ft.ControlEvent) -> None:
         if not self.option_group.value:
             self._show_snack_bar("Select an option before checking.")
@@ -708,17 +853,19 @@ class PrepositionExerciseView:
 
         self._update_score_text()
         # Save progress
-        self.page.run_task(self._save_progress)
+        self.lifecycle.run_task(self._save_progress, persist=True)
 
         # Auto-advance to next question if correct
         if is_correct:
-            self.page.run_task(self._auto_advance)
+            self.lifecycle.run_task(self._auto_advance)
 
+    @batched
     async def _auto_advance(self) -> None:
         """Auto-advance to next question after a short delay."""
         await asyncio.sleep(1.2)
         self._load_new_question()
 
+    @batched
     async def _load_progress(self) -> None:
         """Load saved progress from storage."""
         score, total = await load_progress(self.page, self.storage_key)
@@ -726,16 +873,17 @@ class PrepositionExerciseView:
         self.total = total
         self._update_score_text()
 
-    async def _save_progress(self) -> None:
+    async def _save_progress(self, reset: bool = False) -> None:
         """Save current progress to storage."""
-        await save_progress(self.page, self.storage_key, self.score, self.total)
+        await save_progress(self.page, self.storage_key, self.score, self.total, reset)
 
+    @batched
     def _on_reset_progress(self, _: ft.ControlEvent) -> None:
         """Reset progress to zero."""
         self.score = 0
         self.total = 0
         self._update_score_text()
-        self.page.run_task(self._save_progress)
+        self.lifecycle.run_task(self._save_progress, True, persist=True)
         self._show_snack_bar("Progress reset!")
 
     def _update_score_text(self) -> None:
@@ -747,19 +895,31 @@ class PrepositionExerciseView:
         safe_update(self.score_text)
 
     def _show_snack_bar(self, message: str) -> None:
-        self.page.snack_bar = ft.SnackBar(ft.Text(message))
-        self.page.snack_bar.open = True
-        self.page.update()
+        show_snack_bar(self.page, message)
 
 
 class GenericExerciseView:
     """Generic exercise view for simple question-answer format."""
 
-    def __init__(self, page: ft.Page, title: str, subtitle: str, questions: list[dict], options: list[str],
-                 storage_key: str, question_key: str = "question", answer_key: str = "correct") -> None:
+    # Banks are named rather than passed so each question uses the live content snapshot
+    @property
+    def questions(self) -> Sequence[Mapping[str, str]]:
+        return getattr(data, self.questions_bank) if self.questions_bank else ()
+
+    @property
+    def options(self) -> Sequence[str]:
+        return getattr(data, self.options_bank) if self.options_bank else ()
+
+    def __init__(self, page: ft.Page, title: str, subtitle: str, questions_bank: Optional[str],
+                 options_bank: Optional[str], storage_key: str, question_key: str = "question",
+                 answer_key: str = "correct", generator: Optional[Iterator[Mapping[str, Any]]] = None) -> None:
         self.page = page
-        self.questions = questions
-        self.options = options
+        self.lifecycle = session_lifecycle(page)
+        self.questions_bank = questions_bank
+        self.options_bank = options_bank
+        # Generated items carry their own options; without a bank every question is generated
+        self.generator = generator
+        self._draw_lock = threading.Lock()
         self.storage_key = storage_key
         self.question_key = question_key
         self.answer_key = answer_key
@@ -769,15 +929,18 @@ class GenericExerciseView:
         self.total = 0
 
         # Load saved progress
-        page.run_task(self._load_progress)
+        self.lifecycle.run_task(self._load_progress)
 
         self.prompt_text = ft.Text("", size=18, weight=ft.FontWeight.BOLD)
+        self._shown_options = self.options
         self.option_group = ft.RadioGroup(
             content=ft.Column(
-                controls=[ft.Radio(value=option, label=option) for option in self.options],
+                controls=[ft.Radio(value=option, label=option) for option in self._shown_options],
                 spacing=8,
             )
         )
+        self.typed_mode = False
+        self.answer_field = ft.TextField(label="Type your answer", visible=False, on_submit=self._on_check_answer)
         self.feedback_text = ft.Text("", size=14)
         self.explanation_text = ft.Text("", size=13, color=ft.Colors.ON_SURFACE_VARIANT)
         self.score_text = ft.Text("Score: 0 / 0", weight=ft.FontWeight.BOLD)
@@ -787,6 +950,7 @@ class GenericExerciseView:
                 ft.ElevatedButton("Check answer", icon="check_circle", on_click=self._on_check_answer),
                 ft.OutlinedButton("New question", icon="refresh", on_click=self._on_new_question),
                 ft.OutlinedButton("Reset progress", icon="restart_alt", on_click=self._on_reset_progress),
+                ft.Switch(label="Type answers", value=False, on_change=self._on_toggle_typed),
             ],
             spacing=8,
             wrap=True,
@@ -799,6 +963,7 @@ class GenericExerciseView:
                 ft.Divider(),
                 self.prompt_text,
                 self.option_group,
+                self.answer_field,
                 actions,
                 self.feedback_text,
                 self.explanation_text,
@@ -812,47 +977,79 @@ class GenericExerciseView:
 
         self._load_new_question()
 
-    def _load_new_question(self) -> None:
-        self.current = random.choice(self.questions)
+    # Question protocol, shared with QuizView
+    def draw_question(self) -> Mapping[str, Any]:
+        if self.generator is not None and (not self.questions_bank or random.random() < GENERATED_SHARE):
+            # Also advanced from QuizView, on another thread or the loop
+            with self._draw_lock:
+                return next(self.generator)
+        return random.choice(self.questions)
+
+    def prompt_for(self, item: Mapping[str, Any]) -> str:
         # Support different keys for different question types
-        if self.question_key in self.current:
-            self.prompt_text.value = self.current[self.question_key]
-        elif "situation" in self.current:
-            self.prompt_text.value = self.current["situation"]
-        elif "meaning" in self.current:
-            self.prompt_text.value = f"What is the Italian word for: {self.current['meaning']}?"
-        elif "time" in self.current:
-            self.prompt_text.value = f"How do you say '{self.current['time']}' in Italian?"
-        elif "english" in self.current:
-            self.prompt_text.value = f"Translate to Italian: {self.current['english']}"
-        elif "noun_phrase" in self.current:
-            self.prompt_text.value = f"What is the correct color form for: {self.current['noun_phrase']}?"
+        if self.question_key in item:
+            return item[self.question_key]
+        if "situation" in item:
+            return item["situation"]
+        if "meaning" in item:
+            return f"What is the Italian word for: {item['meaning']}?"
+        if "time" in item:
+            return f"How do you say '{item['time']}' in Italian?"
+        if "english" in item:
+            return f"Translate to Italian: {item['english']}"
+        if "noun_phrase" in item:
+            return f"What is the correct color form for: {item['noun_phrase']}?"
+        return ""
+
+    def options_for(self, item: Mapping[str, Any]) -> Sequence[str]:
+        return item.get("options") or self.options
+
+    def answer_for(self, item: Mapping[str, Any]) -> str:
+        return item[self.answer_key]
+
+    def _load_new_question(self) -> None:
+        self.current = self.draw_question()
+        self._refresh_options(self.options_for(self.current))
+        self.prompt_text.value = self.prompt_for(self.current)
 
         self.option_group.value = None
+        self.answer_field.value = ""
         self.feedback_text.value = ""
         self.explanation_text.value = ""
 
-        safe_update(self.prompt_text, self.option_group, self.feedback_text, self.explanation_text)
+        safe_update(self.prompt_text, self.option_group, self.answer_field, self.feedback_text, self.explanation_text)
         self._update_score_text()
 
+    @batched
     def _on_new_question(self, _: ft.ControlEvent) -> None:
         self._load_new_question()
 
+    @batched
     def _on_check_answer(self, _: ft.ControlEvent) -> None:
-        if not self.option_group.value:
-            self._show_snack_bar("Select an option before checking.")
-            return
-
         assert self.current is not None
-        choice = self.option_group.value
         correct_answer = self.current[self.answer_key]
+        match = None
+        if self.typed_mode:
+            typed = (self.answer_field.value or "").strip()
+            if not typed:
+                self._show_snack_bar("Type an answer before checking.")
+                return
+            match = self._answer_index().grade(typed, correct_answer)
+            is_correct = match.accepted
+        elif not self.option_group.value:
+            self._show_snack_bar("Select an option before checking.")
+            return
+        else:
+            is_correct = self.option_group.value == correct_answer
 
         self.total += 1
-        is_correct = choice == correct_answer
 
         if is_correct:
             self.score += 1
-            self.feedback_text.value = "✔ Correct!"
+            if match is None or match.verdict == EXACT:
+                self.feedback_text.value = "✔ Correct!"
+            else:
+                self.feedback_text.value = f"✔ Correct! Watch the spelling: '{correct_answer}'."
             self.feedback_text.color = ft.Colors.GREEN_400
         else:
             self.feedback_text.value = f"✘ Not quite. The correct answer is '{correct_answer}'."
@@ -863,17 +1060,19 @@ class GenericExerciseView:
 
         self._update_score_text()
         # Save progress
-        self.page.run_task(self._save_progress)
+        self.lifecycle.run_task(self._save_progress, persist=True)
 
         # Auto-advance to next question if correct
         if is_correct:
-            self.page.run_task(self._auto_advance)
+            self.lifecycle.run_task(self._auto_advance)
 
+    @batched
     async def _auto_advance(self) -> None:
         """Auto-advance to next question after a short delay."""
         await asyncio.sleep(1.2)
         self._load_new_question()
 
+    @batched
     async def _load_progress(self) -> None:
         """Load saved progress from storage."""
         score, total = await load_progress(self.page, self.storage_key)
@@ -881,16 +1080,17 @@ class GenericExerciseView:
         self.total = total
         self._update_score_text()
 
-    async def _save_progress(self) -> None:
+    async def _save_progress(self, reset: bool = False) -> None:
         """Save current progress to storage."""
-        await save_progress(self.page, self.storage_key, self.score, self.total)
+        await save_progress(self.page, self.storage_key, self.score, self.total, reset)
 
+    @batched
     def _on_reset_progress(self, _: ft.ControlEvent) -> None:
         """Reset progress to zero."""
         self.score = 0
         self.total = 0
         self._update_score_text()
-        self.page.run_task(self._save_progress)
+        self.lifecycle.run_task(self._save_progress, True, persist=True)
         self._show_snack_bar("Progress reset!")
 
     def _update_score_text(self) -> None:
@@ -901,10 +1101,178 @@ class GenericExerciseView:
             self.score_text.value = f"Score: {self.score} / {self.total} ({percent:.0f}%)"
         safe_update(self.score_text)
 
+    @batched
+    def _on_toggle_typed(self, e: ft.ControlEvent) -> None:
+        self.typed_mode = bool(e.control.value)
+        self.answer_field.visible = self.typed_mode
+        self.option_group.visible = not self.typed_mode
+        safe_update(self.answer_field, self.option_group)
+
+    def _answer_index(self) -> AnswerIndex:
+        """The vocabulary a typed answer is checked against: the question's own options or the bank's."""
+        assert self.current is not None
+        if "options" in self.current:
+            return AnswerIndex(self.current["options"])
+        return index_for(self.options, self.questions, answer_key=self.answer_key)
+
+    def _refresh_options(self, options: Sequence[str]) -> None:
+        """Rebuild the choices when the question or a content reload changed them."""
+        if options is not self._shown_options:
+            self._shown_options = options
+            self.option_group.content.controls = [ft.Radio(value=option, label=option) for option in options]
+
+    def _show_snack_bar(self, message: str) -> None:
+        show_snack_bar(self.page, message)
+
+
+class QuizView:
+    """
+    A page of questions from one exercise, answered together and graded in one event.
+
+    The quiz reuses an exercise view's questions, prompts and score. Grading
+    marks every question at once and adds the page to the exercise's score,
+    which the exercise view saves once for the whole page, so a page costs a
+    render and a grade instead of a check, a feedback render and an advance
+    per question.
+
+    Parameters
+    ----------
+    page:
+        The session page.
+    exercises:
+        Label to exercise view, in menu order.
+    size:
+        Questions per page.
+    """
+
+    def __init__(self, page: ft.Page, exercises: Mapping[str, Any], size: int = QUIZ_SIZE) -> None:
+        self.page = page
+        self.lifecycle = session_lifecycle(page)
+        self.exercises = dict(exercises)
+        self.size = size
+
+        self.exercise: Any = None
+        self.items: list[Mapping[str, Any]] = []
+        self.groups: list[ft.RadioGroup] = []
+        self.marks: list[ft.Text] = []
+
+        self.exercise_dropdown = ft.Dropdown(
+            label="Exercise",
+            value=next(iter(self.exercises)),
+            options=[ft.dropdown.Option(label) for label in self.exercises],
+            on_change=self._on_new_page,
+        )
+        self.questions_column = ft.Column(spacing=12)
+        self.summary_text = ft.Text("", weight=ft.FontWeight.BOLD)
+        self.grade_button = ft.ElevatedButton("Grade all", icon="fact_check", on_click=self._on_grade)
+
+        actions = ft.Row(
+            [
+                self.grade_button,
+                ft.OutlinedButton("New page", icon="refresh", on_click=self._on_new_page),
+            ],
+            spacing=8,
+            wrap=True,
+        )
+
+        self.view = ft.Column(
+            [
+                ft.Text("Quiz", size=20, weight=ft.FontWeight.BOLD),
+                ft.Text(
+                    f"Answer {size} questions, then grade them all at once.",
+                    size=14,
+                    color=ft.Colors.ON_SURFACE_VARIANT,
+                ),
+                self.exercise_dropdown,
+                ft.Divider(),
+                self.questions_column,
+                actions,
+                self.summary_text,
+            ],
+            spacing=16,
+            expand=True,
+            scroll=ft.ScrollMode.AUTO,
+        )
+
+        self._load_page()
+
+    def _choices(self, item: Mapping[str, Any]) -> list[str]:
+        answer = self.exercise.answer_for(item)
+        others = [option for option in dict.fromkeys(self.exercise.options_for(item)) if option != answer]
+        choices = [answer, *random.sample(others, min(QUIZ_CHOICES - 1, len(others)))]
+        random.shuffle(choices)
+        return choices
+
+    def _load_page(self) -> None:
+        self.exercise = self.exercises[self.exercise_dropdown.value]
+        self.items = [self.exercise.draw_question() for _ in range(self.size)]
+        self.groups = []
+        self.marks = []
+        cards = []
+        for number, item in enumerate(self.items, 1):
+            group = ft.RadioGroup(
+                content=ft.Column([ft.Radio(value=choice, label=choice) for choice in self._choices(item)], spacing=4)
+            )
+            mark = ft.Text("", size=13)
+            self.groups.append(group)
+            self.marks.append(mark)
+            cards.append(
+                ft.Container(
+                    content=ft.Column(
+                        [ft.Text(f"{number}. {self.exercise.prompt_for(item)}", weight=ft.FontWeight.BOLD), group, mark],
+                        spacing=6,
+                    ),
+                    bgcolor=CARD_BG,
+                    border_radius=8,
+                    padding=12,
+                )
+            )
+        self.questions_column.controls = cards
+        self.grade_button.disabled = False
+        self.summary_text.value = ""
+        safe_update(self.questions_column, self.grade_button, self.summary_text)
+
+    @batched
+    def _on_new_page(self, _: ft.ControlEvent) -> None:
+        self._load_page()
+
+    @batched
+    def _on_grade(self, _: ft.ControlEvent) -> None:
+        answered = sum(1 for group in self.groups if group.value)
+        if not answered:
+            self._show_snack_bar("Answer at least one question before grading.")
+            return
+
+        correct = 0
+        for item, group, mark in zip(self.items, self.groups, self.marks):
+            answer = self.exercise.answer_for(item)
+            if not group.value:
+                mark.value = f"Skipped. The answer is '{answer}'."
+                mark.color = ft.Colors.ON_SURFACE_VARIANT
+            elif group.value == answer:
+                correct += 1
+                mark.value = f"✔ {item['explanation']}"
+                mark.color = ft.Colors.GREEN_400
+            else:
+                mark.value = f"✘ The correct answer is '{answer}'. {item['explanation']}"
+                mark.color = ft.Colors.RED_400
+            group.disabled = True
+
+        skipped = len(self.items) - answered
+        self.summary_text.value = f"{correct} / {answered} correct" + (f" • {skipped} skipped" if skipped else "")
+        self.grade_button.disabled = True
+        safe_update(*self.groups, *self.marks, self.grade_button, self.summary_text)
+
+        # The exercise tab owns its progress; add the page to it and let the tab
+        # save, so there is one writer per key and one progress write per page
+        exercise = self.exercise
+        exercise.score += correct
+        exercise.total += answered
+        exercise._update_score_text()
+        self.lifecycle.run_task(exercise._save_progress, persist=True)
+
     def _show_snack_bar(self, message: str) -> None:
-        self.page.snack_bar = ft.SnackBar(ft.Text(message))
-        self.page.snack_bar.open = True
-        self.page.update()
+        show_snack_bar(self.page, message)
 
 
 def main(page: ft.Page) -> None:
@@ -914,7 +1282,14 @@ def main(page: ft.Page) -> None:
     page.theme_mode = ft.ThemeMode.DARK
     page.horizontal_alignment = ft.CrossAxisAlignment.STRETCH
     page.vertical_alignment = ft.CrossAxisAlignment.START
-    
+
+    # Tracks this session's tasks and views so they are released on disconnect
+    lifecycle = SessionLifecycle(page)
+    session_state(page)
+    attach_loop(page.loop)
+    start_loop_monitor(page.loop)
+    start_content_watcher()
+
     # Only set window size for desktop apps (not web)
     import os
     if os.getenv("FLET_WEB_MODE", "").lower() != "true":
@@ -938,31 +1313,32 @@ def main(page: ft.Page) -> None:
     async def save_user_id(user_id: str) -> None:
         """Save user ID and reload progress."""
         await set_user_id(page, user_id)
-        user_id_field.value = user_id
-        safe_update(user_id_field)
-        
-        # Reload progress from cloud
-        page.run_task(article_view._load_progress)
-        page.run_task(verb_view._load_progress)
-        page.run_task(preposition_view._load_progress)
-        
-        sync_status.value = f"Synced as: {user_id}" if user_id else "Local mode"
-        sync_status.color = ft.Colors.GREEN_400 if user_id else ft.Colors.ON_SURFACE_VARIANT
-        safe_update(sync_status)
-        page.snack_bar = ft.SnackBar(ft.Text(f"User ID saved! Progress will sync across devices." if user_id else "Using local storage only."))
-        page.snack_bar.open = True
-        page.update()
+
+        with batch_updates(page):
+            user_id_field.value = user_id
+            safe_update(user_id_field)
+
+            # Reload progress from cloud
+            for view in lifecycle.views:
+                if hasattr(view, "_load_progress"):
+                    lifecycle.run_task(view._load_progress)
+
+            sync_status.value = f"Synced as: {user_id}" if user_id else "Local mode"
+            sync_status.color = ft.Colors.GREEN_400 if user_id else ft.Colors.ON_SURFACE_VARIANT
+            safe_update(sync_status)
+            show_snack_bar(page, "User ID saved! Progress will sync across devices." if user_id else "Using local storage only.")
 
     def on_user_id_submit(e: ft.ControlEvent) -> None:
         user_id = user_id_field.value.strip()
-        page.run_task(save_user_id, user_id)
+        lifecycle.run_task(save_user_id, user_id)
 
     user_id_field.on_submit = lambda e: on_user_id_submit(e)
     save_user_id_btn = ft.ElevatedButton("Save ID", icon="cloud_sync", on_click=lambda _: on_user_id_submit(_))
 
     async def load_user_id() -> None:
-        """Load saved user ID."""
+        """Load saved user ID and resume any unsent cloud progress."""
         user_id = await get_user_id(page)
+        await session_state(page).resume_sync()
         user_id_field.value = user_id
         if user_id:
             sync_status.value = f"Synced as: {user_id}"
@@ -972,7 +1348,7 @@ def main(page: ft.Page) -> None:
             sync_status.color = ft.Colors.ON_SURFACE_VARIANT
         safe_update(user_id_field, sync_status)
 
-    page.run_task(load_user_id)
+    lifecycle.run_task(load_user_id)
 
     def toggle_theme(e: ft.ControlEvent) -> None:
         page.theme_mode = ft.ThemeMode.DARK if e.control.value else ft.ThemeMode.LIGHT
@@ -1013,51 +1389,83 @@ def main(page: ft.Page) -> None:
     # New exercise views
     pronunciation_view = GenericExerciseView(
         page, "Pronunciation Practice", "Test your Italian pronunciation knowledge",
-        PRONUNCIATION_QUESTIONS, PRONUNCIATION_OPTIONS, "pronunciation_exercise"
+        "PRONUNCIATION_QUESTIONS", "PRONUNCIATION_OPTIONS", "pronunciation_exercise"
     )
     greeting_view = GenericExerciseView(
         page, "Greetings Practice", "Choose the right greeting for each situation",
-        GREETING_QUESTIONS, GREETING_OPTIONS, "greeting_exercise"
+        "GREETING_QUESTIONS", "GREETING_OPTIONS", "greeting_exercise"
     )
     time_view = GenericExerciseView(
         page, "Telling Time Practice", "Practice telling time in Italian",
-        TIME_QUESTIONS, TIME_OPTIONS, "time_exercise"
+        "TIME_QUESTIONS", "TIME_OPTIONS", "time_exercise", generator=numbers.time_questions()
+    )
+    number_view = GenericExerciseView(
+        page, "Numbers & Years", "Write numbers and years out in Italian words",
+        None, None, "number_exercise", generator=numbers.number_questions()
     )
     weather_view = GenericExerciseView(
         page, "Weather Practice", "Translate weather descriptions to Italian",
-        WEATHER_QUESTIONS, WEATHER_OPTIONS, "weather_exercise"
+        "WEATHER_QUESTIONS", "WEATHER_OPTIONS", "weather_exercise"
     )
     color_view = GenericExerciseView(
         page, "Color Agreement Practice", "Practice color agreement with nouns",
-        COLOR_QUESTIONS, COLOR_OPTIONS, "color_exercise"
+        "COLOR_QUESTIONS", "COLOR_OPTIONS", "color_exercise"
     )
     clothing_view = GenericExerciseView(
         page, "Clothing Vocabulary", "Translate clothing items to Italian",
-        CLOTHING_QUESTIONS, CLOTHING_OPTIONS, "clothing_exercise"
+        "CLOTHING_QUESTIONS", "CLOTHING_OPTIONS", "clothing_exercise"
     )
     day_month_view = GenericExerciseView(
         page, "Days & Months", "Practice days of the week and months of the year",
-        DAY_MONTH_QUESTIONS, DAY_MONTH_OPTIONS, "day_month_exercise"
+        "DAY_MONTH_QUESTIONS", "DAY_MONTH_OPTIONS", "day_month_exercise"
     )
     question_word_view = GenericExerciseView(
         page, "Question Words", "Match Italian question words to their meanings",
-        QUESTION_WORD_QUESTIONS, QUESTION_WORD_OPTIONS, "question_word_exercise"
+        "QUESTION_WORD_QUESTIONS", "QUESTION_WORD_OPTIONS", "question_word_exercise"
     )
     possessive_view = GenericExerciseView(
         page, "Possessive Pronouns", "Practice Italian possessive pronouns",
-        POSSESSIVE_QUESTIONS, POSSESSIVE_OPTIONS, "possessive_exercise"
+        "POSSESSIVE_QUESTIONS", "POSSESSIVE_OPTIONS", "possessive_exercise"
     )
     family_view = GenericExerciseView(
         page, "Family Vocabulary", "Learn Italian family member names",
-        FAMILY_QUESTIONS, FAMILY_OPTIONS, "family_exercise"
+        "FAMILY_QUESTIONS", "FAMILY_OPTIONS", "family_exercise"
     )
     piacere_view = GenericExerciseView(
         page, "Piacere & Mancare", "Practice 'like' and 'miss' verb forms",
-        PIACERE_QUESTIONS, PIACERE_OPTIONS, "piacere_exercise"
+        "PIACERE_QUESTIONS", "PIACERE_OPTIONS", "piacere_exercise"
     )
     body_view = GenericExerciseView(
         page, "Body Parts", "Learn Italian body part vocabulary",
-        BODY_QUESTIONS, BODY_OPTIONS, "body_exercise"
+        "BODY_QUESTIONS", "BODY_OPTIONS", "body_exercise"
+    )
+
+    quiz_view = QuizView(
+        page,
+        {
+            "Articles": article_view,
+            "Verbs": verb_view,
+            "Prepositions": preposition_view,
+            "Time": time_view,
+            "Numbers": number_view,
+            "Greetings": greeting_view,
+            "Weather": weather_view,
+            "Colors": color_view,
+            "Clothing": clothing_view,
+            "Days & Months": day_month_view,
+            "Question Words": question_word_view,
+            "Possessive": possessive_view,
+            "Family": family_view,
+            "Piacere/Mancare": piacere_view,
+            "Body Parts": body_view,
+            "Pronunciation": pronunciation_view,
+        },
+    )
+
+    lifecycle.add_views(
+        reference_view, article_view, verb_view, preposition_view, pronunciation_view, greeting_view,
+        time_view, number_view, weather_view, color_view, clothing_view, day_month_view, question_word_view,
+        possessive_view, family_view, piacere_view, body_view, quiz_view,
     )
 
     # Simplified tab structure for mobile compatibility
@@ -1069,6 +1477,7 @@ def main(page: ft.Page) -> None:
             ft.Tab(text="Pronunciation", content=pronunciation_view.view),
             ft.Tab(text="Greetings", content=greeting_view.view),
             ft.Tab(text="Time", content=time_view.view),
+            ft.Tab(text="Numbers", content=number_view.view),
             ft.Tab(text="Weather", content=weather_view.view),
             ft.Tab(text="Colors", content=color_view.view),
             ft.Tab(text="Clothing", content=clothing_view.view),
@@ -1078,6 +1487,7 @@ def main(page: ft.Page) -> None:
             ft.Tab(text="Family", content=family_view.view),
             ft.Tab(text="Piacere/Mancare", content=piacere_view.view),
             ft.Tab(text="Body Parts", content=body_view.view),
+            ft.Tab(text="Quiz", content=quiz_view.view),
         ],
         scrollable=True,
         expand=True,
@@ -1,13 +1,42 @@
 """
 Simple progress sync API for cross-device progress tracking.
 This can be deployed as a separate service or integrated into the main app.
+
+Sync protocol
+-------------
+Each user's record keeps a monotonically increasing version counter (``_v``)
+and stamps every exercise entry with the version of the write that produced
+it. Clients remember the highest version they have seen and the acknowledged
+version of each exercise, then:
+
+* pull only entries newer than their cursor (:func:`pull_progress_changes`);
+* push only exercises that changed since their last acknowledged version
+  (:func:`push_progress_changes`), together with that base version. When
+  another device wrote the exercise in between, the server adds this
+  client's score/total increments on top instead of overwriting them.
+
+Set ``PROGRESS_SERVICE_URL`` to use the standalone progress service
+(:mod:`app.progress_service`), which serves exactly these pulls and pushes
+over a kept-alive connection. Otherwise JSONBin is used; it transfers the
+whole bin per request, which the client merges locally. The bin itself is
+stored in the compact, compressed format of :mod:`app.progress_codec`; plain
+records written by older versions are still read.
+
+Reads from either backend are conditional: the last response's ``ETag`` /
+``Last-Modified`` are sent back and a ``304`` reuses the cached body.
 """
 import json
 import os
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+from urllib.parse import quote
 
 import httpx
 
+from app.progress_codec import decode_record, encode_record
+from app.tracing import start_span, traced
+
 # Use a free cloud storage service or your own backend
 # Option 1: Use JSONBin.io (free tier available)
 # Option 2: Use your own backend API endpoint
@@ -17,65 +46,269 @@ PROGRESS_API_URL = os.getenv("PROGRESS_API_URL", "https://api.jsonbin.io/v3/b")
 JSONBIN_API_KEY = os.getenv("JSONBIN_API_KEY", "")
 JSONBIN_BIN_ID = os.getenv("JSONBIN_BIN_ID", "")
 
+# Option 3: the standalone progress service (python -m app.progress_service)
+PROGRESS_SERVICE_URL = os.getenv("PROGRESS_SERVICE_URL", "").rstrip("/")
+PROGRESS_SERVICE_TOKEN = os.getenv("PROGRESS_SERVICE_TOKEN", "")
 
-async def load_progress_cloud(user_id: str, exercise_key: str) -> tuple[int, int]:
-    """Load progress from cloud storage."""
+VERSION_FIELD = "_v"
+
+# (score, total, version) of one exercise as stored in the cloud
+VersionedProgress = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class ProgressChange:
+    """
+    New value for one exercise plus the acknowledged state it was derived from.
+
+    ``base_version`` is ``None`` for blind writes, which overwrite whatever the
+    cloud holds.
+    """
+
+    score: int
+    total: int
+    base_version: Optional[int] = None
+    base_score: int = 0
+    base_total: int = 0
+
+
+def merge_change(current: Optional[dict[str, Any]], change: ProgressChange) -> tuple[int, int]:
+    """Resolve a pushed change against the stored entry for the same exercise."""
+    if current is None or change.base_version is None or int(current.get("v", 0)) == change.base_version:
+        return change.score, change.total
+
+    delta_score = change.score - change.base_score
+    delta_total = change.total - change.base_total
+    if delta_score < 0 or delta_total < 0:
+        # The client reset its progress; that intent wins over concurrent answers
+        return change.score, change.total
+    return int(current.get("score", 0)) + delta_score, int(current.get("total", 0)) + delta_total
+
+
+def _headers() -> dict[str, str]:
+    return {
+        "X-Master-Key": JSONBIN_API_KEY,
+        "Content-Type": "application/json",
+    }
+
+
+# url -> (ETag, Last-Modified, body) of the last 200 response, for conditional reads
+_VALIDATOR_CACHE: "OrderedDict[str, tuple[Optional[str], Optional[str], bytes]]" = OrderedDict()
+VALIDATOR_CACHE_SIZE = 512
+
+
+async def _conditional_get(client: httpx.AsyncClient, url: str, headers: Optional[dict[str, str]] = None) -> tuple[int, bytes]:
+    """
+    GET ``url`` revalidating the cached copy, and return ``(status, body)``.
+
+    A ``304 Not Modified`` is answered from the cache and reported as ``200``,
+    so reconnects and reloads that find nothing new cost one empty response.
+    """
+    headers = dict(headers or {})
+    cached = _VALIDATOR_CACHE.get(url)
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    with start_span("http.get", url=url) as span:
+        response = await client.get(url, headers=headers)
+        span.set_attribute("status", response.status_code)
+        span.set_attribute("bytes", len(response.content))
+
+    if response.status_code == 304 and cached is not None:
+        _VALIDATOR_CACHE.move_to_end(url)
+        return 200, cached[2]
+    if response.status_code == 200:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _VALIDATOR_CACHE[url] = (etag, last_modified, response.content)
+            _VALIDATOR_CACHE.move_to_end(url)
+            while len(_VALIDATOR_CACHE) > VALIDATOR_CACHE_SIZE:
+                _VALIDATOR_CACHE.popitem(last=False)
+        else:
+            _VALIDATOR_CACHE.pop(url, None)
+    return response.status_code, response.content
+
+
+_service_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_service_client() -> httpx.AsyncClient:
+    """Return the shared service client so sessions reuse pooled connections."""
+    global _service_client
+    if _service_client is None:
+        headers = {"Authorization": f"Bearer {PROGRESS_SERVICE_TOKEN}"} if PROGRESS_SERVICE_TOKEN else {}
+        _service_client = httpx.AsyncClient(base_url=PROGRESS_SERVICE_URL, headers=headers, timeout=5.0)
+    return _service_client
+
+
+def _decode_entries(payload: dict[str, Any]) -> tuple[dict[str, VersionedProgress], int]:
+    entries = {key: (int(value[0]), int(value[1]), int(value[2])) for key, value in payload.get("e", {}).items()}
+    return entries, int(payload.get("v", 0))
+
+
+async def _pull_from_service(user_id: str, since: int) -> Optional[tuple[dict[str, VersionedProgress], int]]:
+    url = f"{PROGRESS_SERVICE_URL}/progress/{quote(user_id, safe='')}?since={since}"
+    with start_span("progress_service.get"):
+        status, body = await _conditional_get(_get_service_client(), url)
+    if status != 200:
+        return None
+    return _decode_entries(json.loads(body))
+
+
+async def _push_to_service(user_id: str, changes: dict[str, ProgressChange]) -> Optional[dict[str, VersionedProgress]]:
+    body = {
+        "changes": {
+            key: [change.score, change.total, change.base_version, change.base_score, change.base_total]
+            for key, change in changes.items()
+        }
+    }
+    with start_span("progress_service.patch"):
+        response = await _get_service_client().patch(f"/progress/{quote(user_id, safe='')}", json=body)
+    if response.status_code != 200:
+        return None
+    return _decode_entries(response.json())[0]
+
+
+async def _read_record(client: httpx.AsyncClient, user_id: Optional[str] = None) -> Optional[dict[str, Any]]:
+    url = f"{PROGRESS_API_URL}/{JSONBIN_BIN_ID}/latest"
+    with start_span("jsonbin.get"):
+        status, body = await _conditional_get(client, url, _headers())
+    if status != 200:
+        return None
+    return decode_record(json.loads(body).get("record", {}), user_id)
+
+
+async def _write_record(client: httpx.AsyncClient, data: dict[str, Any]) -> bool:
+    url = f"{PROGRESS_API_URL}/{JSONBIN_BIN_ID}"
+    with start_span("jsonbin.put"):
+        response = await client.put(url, json=encode_record(data), headers=_headers(), timeout=5.0)
+    return response.status_code in [200, 201]
+
+
+@traced("pull_progress_changes")
+async def pull_progress_changes(user_id: str, since: int = 0) -> Optional[tuple[dict[str, VersionedProgress], int]]:
+    """
+    Return the user's exercises written after version ``since`` and the new cursor.
+
+    ``None`` means the cloud could not be reached.
+    """
     if not user_id:
-        return 0, 0
-    
+        return None
+    if PROGRESS_SERVICE_URL:
+        try:
+            return await _pull_from_service(user_id, since)
+        except Exception:
+            return None
+    if not (JSONBIN_API_KEY and JSONBIN_BIN_ID):
+        return None
+
     try:
-        if JSONBIN_API_KEY and JSONBIN_BIN_ID:
-            # Use JSONBin.io
-            url = f"{PROGRESS_API_URL}/{JSONBIN_BIN_ID}/latest"
-            headers = {
-                "X-Master-Key": JSONBIN_API_KEY,
-                "Content-Type": "application/json",
-            }
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, timeout=5.0)
-                if response.status_code == 200:
-                    data = response.json().get("record", {})
-                    user_data = data.get(user_id, {})
-                    exercise_data = user_data.get(exercise_key, {})
-                    return int(exercise_data.get("score", 0)), int(exercise_data.get("total", 0))
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            data = await _read_record(client, user_id)
+    except Exception:
+        return None
+    if data is None:
+        return None
+
+    user_data = data.get(user_id, {})
+    changes = {
+        key: (int(entry.get("score", 0)), int(entry.get("total", 0)), int(entry.get("v", 0)))
+        for key, entry in user_data.items()
+        if key != VERSION_FIELD and (since == 0 or int(entry.get("v", 0)) > since)
+    }
+    return changes, int(user_data.get(VERSION_FIELD, 0))
+
+
+@traced("push_progress_changes")
+async def push_progress_changes(user_id: str, changes: dict[str, ProgressChange]) -> Optional[dict[str, VersionedProgress]]:
+    """
+    Apply changed exercises in one read-modify-write and return their stored values.
+
+    ``None`` means nothing was written and the push should be retried.
+    """
+    if not user_id or not changes:
+        return None
+    if PROGRESS_SERVICE_URL:
+        try:
+            return await _push_to_service(user_id, changes)
+        except Exception:
+            return None
+    if not (JSONBIN_API_KEY and JSONBIN_BIN_ID):
+        return None
+
+    try:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            data = await _read_record(client)
+            if data is None:
+                # Writing back a partial record would wipe every other user's progress
+                return None
+
+            user_data = data.setdefault(user_id, {})
+            version = int(user_data.get(VERSION_FIELD, 0))
+            stored: dict[str, VersionedProgress] = {}
+            for exercise_key, change in changes.items():
+                score, total = merge_change(user_data.get(exercise_key), change)
+                version += 1
+                user_data[exercise_key] = {"score": score, "total": total, "v": version}
+                stored[exercise_key] = (score, total, version)
+            user_data[VERSION_FIELD] = version
+
+            if await _write_record(client, data):
+                return stored
     except Exception:
         pass
-    
-    return 0, 0
+
+    return None
+
+
+@traced("load_progress_cloud")
+async def load_progress_cloud(user_id: str, exercise_key: str) -> tuple[int, int]:
+    """Load progress from cloud storage."""
+    pulled = await pull_progress_changes(user_id)
+    if pulled is None:
+        return 0, 0
+    score, total, _ = pulled[0].get(exercise_key, (0, 0, 0))
+    return score, total
 
 
+@traced("save_progress_cloud")
 async def save_progress_cloud(user_id: str, exercise_key: str, score: int, total: int) -> bool:
-    """Save progress to cloud storage."""
-    if not user_id:
-        return False
-    
+    """Save progress to cloud storage, overwriting the stored value."""
+    return await push_progress_changes(user_id, {exercise_key: ProgressChange(score, total)}) is not None
+
+
+@traced("load_leaderboard")
+async def load_leaderboard(exercise_key: str, limit: int = 20, after: Optional[str] = None) -> Optional[dict[str, Any]]:
+    """
+    Return one leaderboard page ``{"entries": [[user, score, total], ...], "next": cursor}``.
+
+    Leaderboards are maintained by the progress service; ``None`` without it.
+    """
+    if not PROGRESS_SERVICE_URL:
+        return None
+    params: dict[str, Any] = {"limit": limit}
+    if after:
+        params["after"] = after
     try:
-        if JSONBIN_API_KEY and JSONBIN_BIN_ID:
-            headers = {
-                "X-Master-Key": JSONBIN_API_KEY,
-                "Content-Type": "application/json",
-            }
-            
-            async with httpx.AsyncClient() as client:
-                # Get current data
-                get_url = f"{PROGRESS_API_URL}/{JSONBIN_BIN_ID}/latest"
-                response = await client.get(get_url, headers=headers, timeout=5.0)
-                if response.status_code == 200:
-                    data = response.json().get("record", {})
-                else:
-                    data = {}
-                
-                # Update user's progress
-                if user_id not in data:
-                    data[user_id] = {}
-                data[user_id][exercise_key] = {"score": score, "total": total}
-                
-                # Save back
-                put_url = f"{PROGRESS_API_URL}/{JSONBIN_BIN_ID}"
-                put_response = await client.put(put_url, json=data, headers=headers, timeout=5.0)
-                return put_response.status_code in [200, 201]
+        response = await _get_service_client().get(f"/leaderboard/{quote(exercise_key, safe='')}", params=params)
     except Exception:
-        pass
-    
-    return False
+        return None
+    return response.json() if response.status_code == 200 else None
+
 
+@traced("load_aggregates")
+async def load_aggregates(exercise_key: Optional[str] = None) -> Optional[dict[str, Any]]:
+    """Return learner count, score/total sums and accuracy for one exercise or all of them."""
+    if not PROGRESS_SERVICE_URL:
+        return None
+    path = f"/aggregates/{quote(exercise_key, safe='')}" if exercise_key else "/aggregates"
+    try:
+        response = await _get_service_client().get(path)
+    except Exception:
+        return None
+    return response.json() if response.status_code == 200 else None
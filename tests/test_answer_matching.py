@@ -0,0 +1,52 @@
+from app.answer_matching import ACCENT, EXACT, TYPO, WRONG, AnswerIndex
+from data.banks.verb_lexicon import VERBS
+from data.conjugation import ConjugationTable
+
+PRESENT = ["parlo", "parli", "parla", "parliamo", "parlate", "parlano"]
+
+
+def test_exact_and_accentless_answers():
+    index = AnswerIndex(["perché", "allora"])
+    assert index.grade("perché", "perché").verdict == EXACT
+    assert index.grade("Perche", "perché").verdict == ACCENT
+
+
+def test_near_miss_is_a_typo():
+    index = AnswerIndex(PRESENT)
+    assert index.grade("parliamp", "parliamo").verdict == TYPO
+
+
+def test_another_answer_is_wrong():
+    index = AnswerIndex(PRESENT)
+    match = index.grade("parli", "parlo")
+    assert match.verdict == WRONG
+    assert match.nearest == "parli"
+
+
+def test_tie_with_another_answer_is_wrong():
+    # "parlu" is one edit from "parlo" but just as close to "parla" and "parli"
+    index = AnswerIndex(PRESENT)
+    assert index.grade("parlu", "parlo").verdict == WRONG
+
+
+def test_tie_is_wrong_with_an_indexed_vocabulary():
+    index = AnswerIndex(PRESENT + [f"parola{number}" for number in range(20)])
+    assert index.grade("parlu", "parlo").verdict == WRONG
+
+
+def test_feminine_agreement_is_accepted_for_essere_verbs():
+    table = ConjugationTable(VERBS)
+    index = AnswerIndex([*table.forms, *table.feminine_forms])
+    accepted = table.accepted("andare", "passato prossimo", "io")
+    assert accepted == ("sono andato", "sono andata")
+
+    assert index.grade("sono andata", "sono andato", accepted).verdict == EXACT
+    match = index.grade("sono andatta", "sono andato", accepted)
+    assert match.verdict == TYPO
+    assert match.expected == "sono andata"
+    # The feminine plural belongs to another person
+    assert index.grade("sono andate", "sono andato", accepted).verdict == WRONG
+
+    plural = table.accepted("andare", "passato prossimo", "noi")
+    assert index.grade("siamo andate", "siamo andati", plural).verdict == EXACT
+    assert table.accepted("parlare", "passato prossimo", "io") == ("ho parlato",)
@@ -0,0 +1,42 @@
+from data.banks.verb_lexicon import VERBS
+from data.conjugation import IRREGULAR, ConjugationTable
+
+# Real past participles of the irregular verbs; the regular rule gets several of these wrong
+PARTICIPLES = {
+    "essere": "stato",
+    "avere": "avuto",
+    "stare": "stato",
+    "andare": "andato",
+    "fare": "fatto",
+    "dare": "dato",
+    "dire": "detto",
+    "venire": "venuto",
+    "volere": "voluto",
+    "potere": "potuto",
+    "dovere": "dovuto",
+    "sapere": "saputo",
+    "bere": "bevuto",
+    "uscire": "uscito",
+    "tenere": "tenuto",
+    "rimanere": "rimasto",
+    "vedere": "visto",
+    "vivere": "vissuto",
+}
+
+
+def test_every_irregular_verb_has_a_known_participle():
+    irregular = {entry["infinitive"] for entry in VERBS} & IRREGULAR.keys()
+    assert irregular <= PARTICIPLES.keys()
+
+
+def test_passato_prossimo_uses_real_participles():
+    table = ConjugationTable(VERBS)
+    for entry in VERBS:
+        verb = entry["infinitive"]
+        if verb not in PARTICIPLES:
+            continue
+        participle = PARTICIPLES[verb]
+        plural = participle[:-1] + "i" if entry["auxiliary"] == "essere" else participle
+        expected = (participle,) * 3 + (plural,) * 3
+        participles = tuple(form.split()[-1] for form in table.tense_forms(verb, "passato prossimo"))
+        assert participles == expected, verb
@@ -0,0 +1,31 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.progress_store import PROGRESS_BLOB_KEY, ProgressStore, decode_blob
+
+
+class FakeStorage:
+    def __init__(self, values: dict) -> None:
+        self.values = dict(values)
+
+    async def get_async(self, key: str):
+        return self.values.get(key)
+
+    async def set_async(self, key: str, value) -> None:
+        self.values[key] = value
+
+    async def get_keys_async(self, prefix: str) -> list[str]:
+        return [key for key in self.values if key.startswith(prefix)]
+
+    async def remove_async(self, key: str) -> None:
+        del self.values[key]
+
+
+def test_migration_only_touches_known_exercise_keys():
+    storage = FakeStorage({"verb_exercise_score": 3, "verb_exercise_total": 5, "game_high_score": 90, "quiz_total": 7})
+    store = ProgressStore(SimpleNamespace(client_storage=storage))
+
+    assert asyncio.run(store.get("verb_exercise")) == (3, 5)
+    assert store.snapshot() == {"verb_exercise": (3, 5)}
+    assert decode_blob(storage.values[PROGRESS_BLOB_KEY]) == {"verb_exercise": (3, 5)}
+    assert storage.values.keys() == {PROGRESS_BLOB_KEY, "game_high_score", "quiz_total"}
@@ -0,0 +1,179 @@
+import asyncio
+from typing import Optional
+
+from app.sync_queue import CloudOutbox
+from progress_api import ProgressChange, merge_change
+
+
+class FakeCloud:
+    """One user's record in memory, merged the way the progress backends merge it."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, dict[str, int]] = {}
+        self.version = 0
+
+    def write(self, key: str, score: int, total: int) -> None:
+        self.version += 1
+        self.entries[key] = {"score": score, "total": total, "v": self.version}
+
+    def value(self, key: str) -> tuple[int, int]:
+        entry = self.entries[key]
+        return entry["score"], entry["total"]
+
+    async def push(self, user_id: str, changes: dict) -> dict:
+        stored = {}
+        for key, change in changes.items():
+            score, total = merge_change(self.entries.get(key), ProgressChange(*change))
+            self.write(key, score, total)
+            stored[key] = (score, total, self.version)
+        return stored
+
+    async def pull(self, user_id: str, since: int) -> tuple[dict, int]:
+        newer = {key: (entry["score"], entry["total"], entry["v"]) for key, entry in self.entries.items() if entry["v"] > since}
+        return newer, self.version
+
+
+class FakeStorage:
+    def __init__(self) -> None:
+        self.values: dict = {}
+
+    async def get_async(self, key: str):
+        return self.values.get(key)
+
+    async def set_async(self, key: str, value) -> None:
+        self.values[key] = value
+
+
+class FakeLifecycle:
+    closed = False
+
+    def __init__(self) -> None:
+        self.tasks: list[asyncio.Task] = []
+
+    def run_task(self, handler, *args, persist: bool = False) -> asyncio.Task:
+        task = asyncio.ensure_future(handler(*args))
+        self.tasks.append(task)
+        return task
+
+    async def settle(self) -> None:
+        while not all(task.done() for task in self.tasks):
+            await asyncio.gather(*self.tasks)
+
+
+class Device:
+    def __init__(self, cloud: FakeCloud) -> None:
+        self.lifecycle = FakeLifecycle()
+        self.page = type("Page", (), {"client_storage": FakeStorage()})()
+        self.remote: dict[str, tuple[int, int]] = {}
+        self.outbox = CloudOutbox(self.page, self.lifecycle, cloud.push, cloud.pull, self._on_remote)
+
+    async def _on_remote(self, user_id: str, entries: dict) -> None:
+        self.remote.update(entries)
+
+    async def save(self, score: int, total: int, base: tuple[int, int] = (0, 0), reset: bool = False) -> None:
+        self.outbox.enqueue("user", "verbs", score, total, base=base, reset=reset)
+        await self.lifecycle.settle()
+
+    def shown(self) -> Optional[tuple[int, int]]:
+        return self.remote.get("verbs")
+
+
+def test_offline_answers_add_to_a_newer_cloud_value():
+    async def scenario():
+        cloud = FakeCloud()
+        cloud.write("verbs", 50, 60)  # from another device
+        device = Device(cloud)
+        await device.outbox.load()
+        # Answered offline from an empty exercise, then the cloud became reachable
+        await device.save(11, 13)
+
+        assert cloud.value("verbs") == (61, 73)
+        assert device.shown() == (61, 73)
+        assert len(device.outbox) == 0
+
+    asyncio.run(scenario())
+
+
+def test_offline_answers_count_from_the_loaded_value():
+    async def scenario():
+        cloud = FakeCloud()
+        cloud.write("verbs", 50, 60)
+        device = Device(cloud)
+        await device.outbox.load()
+        await device.save(12, 14, base=(10, 10))
+
+        assert cloud.value("verbs") == (52, 64)
+
+    asyncio.run(scenario())
+
+
+def test_explicit_reset_overwrites_the_cloud_value():
+    async def scenario():
+        cloud = FakeCloud()
+        cloud.write("verbs", 50, 60)
+        device = Device(cloud)
+        assert await device.outbox.pull("user")
+        assert device.shown() == (50, 60)
+
+        await device.save(0, 0, reset=True)
+        assert cloud.value("verbs") == (0, 0)
+
+        # Answers after the reset count up from zero again
+        await device.save(1, 1)
+        assert cloud.value("verbs") == (1, 1)
+
+    asyncio.run(scenario())
+
+
+def test_lower_value_without_reset_does_not_discard_the_cloud_value():
+    async def scenario():
+        cloud = FakeCloud()
+        cloud.write("verbs", 50, 60)
+        device = Device(cloud)
+        assert await device.outbox.pull("user")
+
+        await device.save(11, 13)
+        assert cloud.value("verbs") == (50, 60)
+
+    asyncio.run(scenario())
+
+
+def test_two_devices_incrementing_the_same_exercise_add_up():
+    async def scenario():
+        cloud = FakeCloud()
+        cloud.write("verbs", 10, 10)
+        first, second = Device(cloud), Device(cloud)
+        assert await first.outbox.pull("user")
+        assert await second.outbox.pull("user")
+
+        await first.save(12, 12)
+        await second.save(11, 11)
+        assert cloud.value("verbs") == (13, 13)
+        # The second push is followed by a pull that brings in the first device's answers
+        assert second.shown() == (13, 13)
+
+        await first.save(13, 13)
+        assert cloud.value("verbs") == (14, 14)
+        assert first.shown() == (14, 14)
+
+    asyncio.run(scenario())
+
+
+def test_outbox_survives_a_reload_with_its_base_and_reset_flag():
+    async def scenario():
+        cloud = FakeCloud()
+        device = Device(cloud)
+        await device.outbox.load()
+        device.lifecycle.closed = True  # offline session ending before anything is sent
+        device.outbox.enqueue("user", "verbs", 0, 0, reset=True)
+        device.outbox.enqueue("user", "verbs", 3, 4)
+        await device.outbox.persist()
+
+        cloud.write("verbs", 50, 60)
+        resumed = Device(cloud)
+        resumed.page.client_storage = device.page.client_storage
+        await resumed.outbox.load()
+        await resumed.lifecycle.settle()
+        assert cloud.value("verbs") == (3, 4)
+
+    asyncio.run(scenario())
@@ -0,0 +1,101 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.metrics import HANDLER_SECONDS
+from app.session import SessionLifecycle
+from app.ui_updates import batched, current_batch, schedule_update
+
+
+class FakePage:
+    """Just enough of ``ft.Page``; ``run_task`` schedules like Flet's, copying the caller's context."""
+
+    session_id = "test-session"
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.session = SimpleNamespace(set=lambda key, value: None)
+        self.update = MagicMock()
+
+    def run_task(self, handler, *args):
+        return asyncio.run_coroutine_threadsafe(handler(*args), self.loop)
+
+
+class View:
+    def __init__(self, page: FakePage, lifecycle: SessionLifecycle) -> None:
+        self.page = page
+        self.lifecycle = lifecycle
+        self.label = SimpleNamespace(page=page)
+        self.status = SimpleNamespace(page=page)
+        self.spawned = None
+
+    @batched
+    async def on_answer(self) -> None:
+        schedule_update(self.label)
+        self.spawned = self.lifecycle.run_task(self.advance)
+
+    @batched
+    async def advance(self) -> None:
+        await asyncio.sleep(0)
+        schedule_update(self.status)
+
+    async def advance_unbatched(self) -> None:
+        await asyncio.sleep(0)
+        assert current_batch() is None
+        schedule_update(self.status, self.label)
+
+
+def test_task_spawned_from_batched_handler_sends_its_updates():
+    async def scenario():
+        page = FakePage(asyncio.get_running_loop())
+        view = View(page, SessionLifecycle(page))
+        await view.on_answer()
+        page.update.assert_called_once_with(view.label)
+
+        await asyncio.wrap_future(view.spawned)
+        assert page.update.call_count == 2
+        page.update.assert_called_with(view.status)
+
+    asyncio.run(scenario())
+
+
+def test_unbatched_task_spawned_from_batched_handler_updates_directly():
+    async def scenario():
+        page = FakePage(asyncio.get_running_loop())
+        lifecycle = SessionLifecycle(page)
+        view = View(page, lifecycle)
+
+        @batched
+        async def on_click(self) -> None:
+            self.spawned = lifecycle.run_task(self.advance_unbatched)
+
+        await on_click(view)
+        await asyncio.wrap_future(view.spawned)
+        page.update.assert_called_once_with(view.status, view.label)
+
+    asyncio.run(scenario())
+
+
+def test_handler_time_excludes_awaits():
+    class Slow:
+        def __init__(self, page: FakePage) -> None:
+            self.page = page
+            self.label = SimpleNamespace(page=page)
+
+        @batched
+        async def on_click(self) -> str:
+            await asyncio.sleep(0.2)
+            schedule_update(self.label)
+            return "done"
+
+    async def scenario():
+        page = FakePage(asyncio.get_running_loop())
+        view = Slow(page)
+        _, before = HANDLER_SECONDS.snapshot(handler=Slow.on_click.__qualname__)
+        assert await view.on_click() == "done"
+        page.update.assert_called_once_with(view.label)
+        counts, after = HANDLER_SECONDS.snapshot(handler=Slow.on_click.__qualname__)
+        assert sum(counts) == 1
+        assert after - before < 0.1
+
+    asyncio.run(scenario())
@@ -1,6 +1,13 @@
 """
 Web entry point for cloud deployment.
 Run this file when deploying to web hosting platforms.
+
+Set ``WEB_WORKERS`` to run several Flet worker processes behind a sticky
+router (see ``app/workers.py``); the default of 1 runs a single process.
+
+Prometheus metrics are served on ``METRICS_PORT`` (default 9100, ``0``
+disables them). Worker ``i`` of a multi-worker deployment uses
+``METRICS_PORT + i``.
 """
 import os
 os.environ["FLET_WEB_MODE"] = "true"
@@ -10,11 +17,20 @@ import flet as ft
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "8550"))
-    ft.app(
-        target=main, 
-        view=ft.AppView.WEB_BROWSER, 
-        port=port, 
-        host="0.0.0.0",
-        web_renderer=ft.WebRenderer.CANVAS_KIT,  # More stable for web deployment
-    )
+    workers = int(os.getenv("WEB_WORKERS", "1"))
+    if workers > 1:
+        from app.workers import run_supervisor
+        run_supervisor(os.path.abspath(__file__), workers, host="0.0.0.0", port=port)
+    else:
+        metrics_port = int(os.getenv("METRICS_PORT", "9100"))
+        if metrics_port:
+            from app.metrics import start_metrics_server
+            start_metrics_server(metrics_port + int(os.getenv("WEB_WORKER_INDEX", "0")))
 
+        ft.app(
+            target=main,
+            view=ft.AppView.WEB_BROWSER,
+            port=port,
+            host=os.getenv("WEB_HOST", "0.0.0.0"),
+            web_renderer=ft.WebRenderer.CANVAS_KIT,  # More stable for web deployment
+        )